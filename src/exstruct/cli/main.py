@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import argparse
 from collections.abc import Callable
+from functools import lru_cache
 from importlib import import_module
 from pathlib import Path
 import sys
@@ -200,6 +201,17 @@ def build_parser() -> argparse.ArgumentParser:
     return parser
 
 
+@lru_cache(maxsize=1)
+def _default_parser() -> argparse.ArgumentParser:
+    """Return the extraction parser, built once per process.
+
+    ``parse_args`` does not mutate the parser, so repeated in-process calls to
+    ``main`` can share one instance. ``build_parser`` still returns a fresh
+    parser for callers that customize it.
+    """
+    return build_parser()
+
+
 def _validate_auto_page_breaks_request(args: argparse.Namespace) -> None:
     """Validate runtime requirements for auto page-break export."""
     auto_page_breaks_dir = getattr(args, "auto_page_breaks_dir", None)
@@ -244,8 +256,7 @@ def main(argv: list[str] | None = None) -> int:
     if is_edit_subcommand(resolved_argv):
         return run_edit_cli(resolved_argv)
 
-    parser = build_parser()
-    args = parser.parse_args(resolved_argv)
+    args = _default_parser().parse_args(resolved_argv)
 
     input_path: Path = args.input
     if not input_path.exists():
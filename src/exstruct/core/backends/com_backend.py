@@ -2,8 +2,12 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from array import array
+from bisect import bisect_right
+from collections.abc import Iterable
+from dataclasses import dataclass, field
 import logging
+import re
 from typing import Any, Literal, cast
 
 import xlwings as xw
@@ -22,16 +26,49 @@ from .base import ChartData, MergedCellData, PrintAreaData, RichBackend, ShapeDa
 
 logger = logging.getLogger(__name__)
 
+# One comma-separated part: runs of quoted sheet names (with '' escapes, or
+# unterminated up to the end of input) and unquoted characters other than commas.
+_CSV_PART_RE = re.compile(r"(?:'(?:[^']|'')*(?:'|$)|[^,'])+")
+
 
 @dataclass(frozen=True)
 class ComBackend:
     """COM-based backend for extraction tasks.
 
+    Sheets are read one after another on purpose. Excel serves COM calls from a
+    single-threaded apartment, so worker threads would each need their own
+    marshaled workbook pointer and their calls would still be serialized by
+    Excel; per-sheet latency is instead cut by reading each sheet's properties
+    once (see ``_snapshot_sheet_api``).
+
+    The sheet list and sheet names are read from COM on first use and reused by
+    later ``extract_*`` calls; call ``invalidate`` after adding, removing, or
+    renaming sheets through another handle.
+
     Attributes:
         workbook: xlwings workbook instance.
     """
 
     workbook: xw.Book
+    _sheet_cache: list[tuple[xw.Sheet, str]] = field(
+        default_factory=list, init=False, repr=False, compare=False
+    )
+
+    def invalidate(self) -> None:
+        """Forget the cached sheet list so the next call re-reads it from COM."""
+        self._sheet_cache.clear()
+
+    def _sheets(self) -> list[tuple[xw.Sheet, str]]:
+        """Return ``(sheet, name)`` pairs, reading them from COM only once.
+
+        Returns:
+            Worksheets in workbook order paired with their names.
+        """
+        if not self._sheet_cache:
+            self._sheet_cache.extend(
+                (sheet, sheet.name) for sheet in self.workbook.sheets
+            )
+        return self._sheet_cache
 
     def extract_print_areas(self) -> PrintAreaData:
         """Extract print areas per sheet via xlwings/COM.
@@ -40,26 +77,29 @@ class ComBackend:
             Mapping of sheet name to print area list.
         """
         areas: PrintAreaData = {}
-        for sheet in self.workbook.sheets:
-            raw = ""
+        for sheet, sheet_name in self._sheets():
             try:
-                raw = sheet.api.PageSetup.PrintArea or ""
+                snapshot = _snapshot_sheet_api(
+                    sheet.api, sheet_name, include_page_breaks=False
+                )
             except Exception as exc:
                 logger.warning(
                     "Failed to read print area via COM for sheet '%s'. (%r)",
-                    sheet.name,
+                    sheet_name,
                     exc,
                 )
-            if not raw:
                 continue
-            for part in str(raw).split(","):
+            if not snapshot.print_area:
+                continue
+            sheet_areas: list[PrintArea] = []
+            for part in snapshot.print_area.split(","):
                 parsed = _parse_print_area_range(part)
                 if not parsed:
                     continue
                 r1, c1, r2, c2 = parsed
-                areas.setdefault(sheet.name, []).append(
-                    PrintArea(r1=r1 + 1, c1=c1, r2=r2 + 1, c2=c2)
-                )
+                sheet_areas.append(PrintArea(r1=r1 + 1, c1=c1, r2=r2 + 1, c2=c2))
+            if sheet_areas:
+                areas[sheet_name] = sheet_areas
         return areas
 
     def extract_colors_map(
@@ -114,59 +154,46 @@ class ComBackend:
             Mapping from sheet name to a list of PrintArea entries. Each PrintArea describes a rectangular region with `r1` and `r2` as 1-based row indices and `c1` and `c2` as 0-based column indices.
         """
         results: PrintAreaData = {}
-        for sheet in self.workbook.sheets:
+        for sheet, sheet_name in self._sheets():
             ws_api: Any | None = None
             original_display: bool | None = None
-            failed = False
             try:
                 ws_api = cast(Any, sheet.api)
                 original_display = ws_api.DisplayPageBreaks
                 ws_api.DisplayPageBreaks = True
-                print_area = ws_api.PageSetup.PrintArea or ws_api.UsedRange.Address
-                parts_raw = _split_csv_respecting_quotes(str(print_area))
+                snapshot = _snapshot_sheet_api(
+                    ws_api, sheet_name, include_page_breaks=True
+                )
                 area_parts: list[str] = []
-                for part in parts_raw:
-                    rng = _normalize_area_for_sheet(part, sheet.name)
+                for part in _split_csv_respecting_quotes(snapshot.print_area):
+                    rng = _normalize_area_for_sheet(part, sheet_name)
                     if rng:
                         area_parts.append(rng)
-                hpb = cast(Any, ws_api.HPageBreaks)
-                vpb = cast(Any, ws_api.VPageBreaks)
-                h_break_rows = [
-                    hpb.Item(i).Location.Row for i in range(1, int(hpb.Count) + 1)
-                ]
-                v_break_cols = [
-                    vpb.Item(i).Location.Column for i in range(1, int(vpb.Count) + 1)
-                ]
+                sheet_areas: list[PrintArea] = []
                 for addr in area_parts:
                     range_obj = cast(Any, ws_api.Range(addr))
                     min_row = int(range_obj.Row)
                     max_row = min_row + int(range_obj.Rows.Count) - 1
                     min_col = int(range_obj.Column)
                     max_col = min_col + int(range_obj.Columns.Count) - 1
-                    rows = (
-                        [min_row]
-                        + [r for r in h_break_rows if min_row < r <= max_row]
-                        + [max_row + 1]
-                    )
-                    cols = (
-                        [min_col]
-                        + [c for c in v_break_cols if min_col < c <= max_col]
-                        + [max_col + 1]
-                    )
-                    for i in range(len(rows) - 1):
-                        r1, r2 = rows[i], rows[i + 1] - 1
-                        for j in range(len(cols) - 1):
-                            c1, c2 = cols[j], cols[j + 1] - 1
-                            results.setdefault(sheet.name, []).append(
-                                PrintArea(r1=r1, c1=c1 - 1, r2=r2, c2=c2 - 1)
-                            )
+                    row_spans = _break_spans(min_row, max_row, snapshot.h_break_rows)
+                    col_spans = [
+                        (c1 - 1, c2 - 1)
+                        for c1, c2 in _break_spans(
+                            min_col, max_col, snapshot.v_break_cols
+                        )
+                    ]
+                    for r1, r2 in row_spans:
+                        for c1, c2 in col_spans:
+                            sheet_areas.append(PrintArea(r1=r1, c1=c1, r2=r2, c2=c2))
+                if sheet_areas:
+                    results[sheet_name] = sheet_areas
             except Exception as exc:
                 logger.warning(
                     "Failed to extract auto page breaks via COM for sheet '%s'. (%r)",
-                    sheet.name,
+                    sheet_name,
                     exc,
                 )
-                failed = True
             finally:
                 if ws_api is not None and original_display is not None:
                     try:
@@ -174,11 +201,9 @@ class ComBackend:
                     except Exception as exc:
                         logger.debug(
                             "Failed to restore DisplayPageBreaks for sheet '%s'. (%r)",
-                            sheet.name,
+                            sheet_name,
                             exc,
                         )
-            if failed:
-                continue
         return results
 
     def extract_merged_cells(self) -> MergedCellData:
@@ -210,6 +235,100 @@ class ComRichBackend(RichBackend):
         return chart_data
 
 
+@dataclass(frozen=True)
+class _SheetPageSnapshot:
+    """Page-layout properties of one worksheet, read once from COM.
+
+    Attributes:
+        name: Worksheet name.
+        print_area: Raw ``PageSetup.PrintArea`` string. When page breaks are
+            included and no print area is set, the used range address instead.
+        h_break_rows: Sorted 1-based rows of horizontal page breaks.
+        v_break_cols: Sorted 1-based columns of vertical page breaks.
+    """
+
+    name: str
+    print_area: str
+    h_break_rows: array[int] = field(default_factory=lambda: array("i"))
+    v_break_cols: array[int] = field(default_factory=lambda: array("i"))
+
+
+def _snapshot_sheet_api(
+    ws_api: object, sheet_name: str, *, include_page_breaks: bool
+) -> _SheetPageSnapshot:
+    """Read the page-layout properties of a worksheet into local Python values.
+
+    Every attribute access on ``ws_api`` is a cross-process COM call, so each
+    property is read exactly once here and later loops only touch the snapshot.
+
+    Args:
+        ws_api: Worksheet COM object (``sheet.api``).
+        sheet_name: Worksheet name, already read by the caller.
+        include_page_breaks: Whether to read page breaks and fall back to the
+            used range when no print area is set.
+
+    Returns:
+        Snapshot of the worksheet's page-layout properties.
+    """
+    api = cast(Any, ws_api)
+    print_area = str(api.PageSetup.PrintArea or "")
+    if not include_page_breaks:
+        return _SheetPageSnapshot(name=sheet_name, print_area=print_area)
+    if not print_area:
+        print_area = str(api.UsedRange.Address)
+    return _SheetPageSnapshot(
+        name=sheet_name,
+        print_area=print_area,
+        h_break_rows=_read_page_break_locations(api.HPageBreaks, "Row"),
+        v_break_cols=_read_page_break_locations(api.VPageBreaks, "Column"),
+    )
+
+
+def _read_page_break_locations(breaks: object, axis: str) -> array[int]:
+    """Read the 1-based row or column of every page break in a COM collection.
+
+    The collection is enumerated through ``IEnumVARIANT`` when the wrapper
+    supports iteration, which avoids the ``Count`` and per-index ``Item(i)``
+    round-trips; otherwise it falls back to indexed access.
+
+    Args:
+        breaks: ``HPageBreaks`` or ``VPageBreaks`` COM collection.
+        axis: Location attribute to read (``"Row"`` or ``"Column"``).
+
+    Returns:
+        Break positions sorted ascending, packed as C ints.
+    """
+    collection = cast(Any, breaks)
+    items: Iterable[Any]
+    try:
+        items = iter(collection)
+    except TypeError:
+        items = (collection.Item(i) for i in range(1, int(collection.Count) + 1))
+    return array("i", sorted(int(getattr(item.Location, axis)) for item in items))
+
+
+def _break_spans(start: int, end: int, breaks: array[int]) -> list[tuple[int, int]]:
+    """Split the inclusive range ``start..end`` at the page breaks inside it.
+
+    A break at position ``p`` starts a new span at ``p``. Only breaks with
+    ``start < p <= end`` are considered; they are located by bisection, so
+    each print-area part costs O(log n) in the sheet's break count rather
+    than a scan of every break.
+
+    Args:
+        start: First row or column of the range (1-based).
+        end: Last row or column of the range (1-based).
+        breaks: Sorted break positions for the same axis.
+
+    Returns:
+        Inclusive ``(first, last)`` spans covering the range in order.
+    """
+    lo = bisect_right(breaks, start)
+    hi = bisect_right(breaks, end, lo)
+    bounds = [start, *breaks[lo:hi], end + 1]
+    return [(bounds[i], bounds[i + 1] - 1) for i in range(len(bounds) - 1)]
+
+
 def _parse_print_area_range(range_str: str) -> tuple[int, int, int, int] | None:
     """Parse an Excel range string into zero-based coordinates.
 
@@ -235,6 +354,9 @@ def _normalize_area_for_sheet(part: str, ws_name: str) -> str | None:
     Returns:
         Range without sheet prefix, or None if not matching.
     """
+    # Plain str operations on purpose: the "!" membership test and one rsplit
+    # are cheaper than any regex match, and splitting at the last "!" keeps
+    # quoted sheet names that themselves contain "!" intact.
     s = part.strip()
     if "!" not in s:
         return s
@@ -254,28 +376,6 @@ def _split_csv_respecting_quotes(raw: str) -> list[str]:
     Returns:
         List of split parts.
     """
-    parts: list[str] = []
-    buf: list[str] = []
-    in_quote = False
-    i = 0
-    while i < len(raw):
-        ch = raw[i]
-        if ch == "'":
-            if in_quote and i + 1 < len(raw) and raw[i + 1] == "'":
-                buf.append("''")
-                i += 2
-                continue
-            in_quote = not in_quote
-            buf.append(ch)
-            i += 1
-            continue
-        if ch == "," and not in_quote:
-            parts.append("".join(buf).strip())
-            buf = []
-            i += 1
-            continue
-        buf.append(ch)
-        i += 1
-    if buf:
-        parts.append("".join(buf).strip())
-    return [p for p in parts if p]
+    return [
+        part for match in _CSV_PART_RE.finditer(raw) if (part := match.group(0).strip())
+    ]
@@ -2,11 +2,14 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from collections.abc import Collection
+from dataclasses import dataclass, field
 import logging
 from pathlib import Path
 from typing import Literal
 
+from openpyxl.workbook.workbook import Workbook
+
 from ...models import PrintArea
 from ..cells import (
     WorkbookColorsMap,
@@ -19,21 +22,99 @@ from ..cells import (
     extract_sheet_merged_cells,
 )
 from ..ranges import parse_range_zero_based
-from ..workbook import openpyxl_workbook
+from ..workbook import OpenpyxlLoadMode, load_openpyxl_workbook
 from .base import CellData, MergedCellData, PrintAreaData
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass(frozen=True)
+@dataclass(eq=False)
 class OpenpyxlBackend:
     """Openpyxl-based backend for extraction tasks.
 
+    Workbooks loaded by the ``extract_*`` methods are cached on the instance,
+    keyed by load mode and the file's modification time, so calling several
+    methods on one backend parses the file once per mode. Use the backend as a
+    context manager (or call ``close``) to release the cached workbooks. Since
+    the backend owns that mutable cache, it compares and hashes by identity.
+
     Attributes:
         file_path: Path to the workbook file.
     """
 
     file_path: Path
+    _workbooks: dict[OpenpyxlLoadMode, tuple[int, Workbook]] = field(
+        default_factory=dict, init=False, repr=False
+    )
+
+    def __enter__(self) -> OpenpyxlBackend:
+        """Return the backend so cached workbooks are closed on exit."""
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Close cached workbooks when leaving the ``with`` block."""
+        self.close()
+
+    def close(self) -> None:
+        """Close and drop every cached workbook."""
+        for _, wb in self._workbooks.values():
+            _close_workbook(wb)
+        self._workbooks.clear()
+
+    def _workbook(self, mode: OpenpyxlLoadMode) -> Workbook:
+        """Return the cached workbook for the mode, reloading if the file changed.
+
+        Args:
+            mode: How much of the workbook openpyxl should materialize.
+
+        Returns:
+            openpyxl workbook owned by this backend.
+        """
+        mtime_ns = self.file_path.stat().st_mtime_ns
+        cached = self._workbooks.get(mode)
+        if cached is not None:
+            cached_mtime_ns, cached_wb = cached
+            if cached_mtime_ns == mtime_ns:
+                return cached_wb
+            _close_workbook(cached_wb)
+            del self._workbooks[mode]
+        data_only, read_only, keep_links = mode.load_options()
+        wb = load_openpyxl_workbook(
+            self.file_path,
+            data_only=data_only,
+            read_only=read_only,
+            keep_links=keep_links,
+        )
+        self._workbooks[mode] = (mtime_ns, wb)
+        return wb
+
+    def _cached_workbook(self, mode: OpenpyxlLoadMode) -> Workbook | None:
+        """Return the workbook cached for the mode if it is still current.
+
+        Args:
+            mode: Load mode to look up.
+
+        Returns:
+            Cached openpyxl workbook, or None when none is loaded for the file.
+        """
+        cached = self._workbooks.get(mode)
+        if cached is not None and cached[0] == self.file_path.stat().st_mtime_ns:
+            return cached[1]
+        return None
+
+    def _metadata_workbook(self) -> Workbook:
+        """Return a workbook suitable for reading workbook-level metadata.
+
+        Reuses an already-loaded styled workbook when one is cached for the
+        current file; otherwise loads the cheaper read-only metadata view.
+
+        Returns:
+            openpyxl workbook owned by this backend.
+        """
+        styled = self._cached_workbook(OpenpyxlLoadMode.STYLED)
+        if styled is not None:
+            return styled
+        return self._workbook(OpenpyxlLoadMode.METADATA_ONLY)
 
     def extract_cells(self, *, include_links: bool) -> CellData:
         """Extract cell rows from the workbook.
@@ -44,11 +125,11 @@ class OpenpyxlBackend:
         Returns:
             Mapping of sheet name to cell rows.
         """
-        return (
-            extract_sheet_cells_with_links(self.file_path)
-            if include_links
-            else extract_sheet_cells(self.file_path)
-        )
+        if include_links:
+            return extract_sheet_cells_with_links(
+                self.file_path, workbook=self._workbook(OpenpyxlLoadMode.STYLED)
+            )
+        return extract_sheet_cells(self.file_path)
 
     def extract_print_areas(self) -> PrintAreaData:
         """Extract print areas per sheet using openpyxl defined names.
@@ -57,24 +138,27 @@ class OpenpyxlBackend:
             Mapping of sheet name to print area list.
         """
         try:
-            with openpyxl_workbook(
-                self.file_path, data_only=True, read_only=False
-            ) as wb:
-                areas = _extract_print_areas_from_defined_names(wb)
-                if not areas:
-                    areas = _extract_print_areas_from_sheet_props(wb)
-                return areas
+            wb = self._metadata_workbook()
+            areas = _extract_print_areas_from_defined_names(wb)
+            if not areas:
+                areas = _extract_print_areas_from_sheet_props(wb)
+            return areas
         except Exception:
             return {}
 
     def extract_colors_map(
-        self, *, include_default_background: bool, ignore_colors: set[str] | None
+        self,
+        *,
+        include_default_background: bool,
+        ignore_colors: set[str] | None,
+        sheet_names: Collection[str] | None = None,
     ) -> WorkbookColorsMap | None:
         """Extract colors_map using openpyxl.
 
         Args:
             include_default_background: Whether to include default background colors.
             ignore_colors: Optional set of color keys to ignore.
+            sheet_names: Optional sheet titles to scan; other sheets are skipped.
 
         Returns:
             WorkbookColorsMap or None when extraction fails.
@@ -84,6 +168,8 @@ class OpenpyxlBackend:
                 self.file_path,
                 include_default_background=include_default_background,
                 ignore_colors=ignore_colors,
+                workbook=self._workbook(OpenpyxlLoadMode.STYLED),
+                sheet_names=sheet_names,
             )
         except Exception as exc:
             logger.warning(
@@ -91,26 +177,48 @@ class OpenpyxlBackend:
             )
             return None
 
-    def extract_merged_cells(self) -> MergedCellData:
+    def extract_merged_cells(
+        self, *, sheet_names: Collection[str] | None = None
+    ) -> MergedCellData:
         """Extract merged cell ranges per sheet.
 
+        Reuses a styled workbook that another extraction already loaded;
+        otherwise reads the ranges straight from the xlsx XML rather than
+        loading a styled workbook just for them.
+
+        Args:
+            sheet_names: Optional sheet titles to scan; other sheets are skipped.
+
         Returns:
             Mapping of sheet name to merged cell ranges.
         """
         try:
-            return extract_sheet_merged_cells(self.file_path)
+            return extract_sheet_merged_cells(
+                self.file_path,
+                workbook=self._cached_workbook(OpenpyxlLoadMode.STYLED),
+                sheet_names=sheet_names,
+            )
         except Exception:
             return {}
 
-    def extract_formulas_map(self) -> WorkbookFormulasMap | None:
+    def extract_formulas_map(
+        self, *, sheet_names: Collection[str] | None = None
+    ) -> WorkbookFormulasMap | None:
         """
         Extract a mapping of workbook formulas for each sheet.
 
+        Parameters:
+            sheet_names (Collection[str] | None): Optional sheet titles to scan; other sheets are skipped.
+
         Returns:
             WorkbookFormulasMap | None: A mapping from sheet name to its formulas, or `None` if extraction fails.
         """
         try:
-            return extract_sheet_formulas_map(self.file_path)
+            return extract_sheet_formulas_map(
+                self.file_path,
+                workbook=self._workbook(OpenpyxlLoadMode.FORMULAS),
+                sheet_names=sheet_names,
+            )
         except Exception as exc:
             logger.warning(
                 "Formula map extraction failed; skipping formulas_map. (%r)", exc
@@ -135,11 +243,28 @@ class OpenpyxlBackend:
             list[str]: Detected table candidate ranges as A1-style range strings; empty list if none are found or detection fails.
         """
         try:
-            return detect_tables_openpyxl(self.file_path, sheet_name, mode=mode)
+            return detect_tables_openpyxl(
+                self.file_path,
+                sheet_name,
+                mode=mode,
+                workbook=self._workbook(OpenpyxlLoadMode.STYLED),
+            )
         except Exception:
             return []
 
 
+def _close_workbook(workbook: Workbook) -> None:
+    """Close an openpyxl workbook, logging instead of raising on failure.
+
+    Args:
+        workbook: openpyxl workbook instance.
+    """
+    try:
+        workbook.close()
+    except Exception as exc:
+        logger.debug("Failed to close openpyxl workbook. (%r)", exc)
+
+
 def _extract_print_areas_from_defined_names(workbook: object) -> PrintAreaData:
     """Extract print areas from defined names in an openpyxl workbook.
 
@@ -192,14 +317,17 @@ def _append_print_areas(areas: PrintAreaData, sheet_name: str, range_str: str) -
         sheet_name: Target sheet name.
         range_str: Raw range string, possibly comma-separated.
     """
+    if not range_str:
+        return
+    parsed_areas: list[PrintArea] = []
     for part in str(range_str).split(","):
         parsed = _parse_print_area_range(part)
         if not parsed:
             continue
         r1, c1, r2, c2 = parsed
-        areas.setdefault(sheet_name, []).append(
-            PrintArea(r1=r1 + 1, c1=c1, r2=r2 + 1, c2=c2)
-        )
+        parsed_areas.append(PrintArea(r1=r1 + 1, c1=c1, r2=r2 + 1, c2=c2))
+    if parsed_areas:
+        areas.setdefault(sheet_name, []).extend(parsed_areas)
 
 
 def _parse_print_area_range(range_str: str) -> tuple[int, int, int, int] | None:
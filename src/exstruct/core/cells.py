@@ -2,25 +2,55 @@
 
 from __future__ import annotations
 
-from collections import deque
-from collections.abc import Callable, Sequence
+from array import array
+from collections.abc import (
+    Callable,
+    Collection,
+    Iterable,
+    Iterator,
+    Mapping,
+    Sequence,
+)
+from contextlib import contextmanager
 from dataclasses import dataclass
+from datetime import datetime
 from decimal import Decimal, InvalidOperation
+from functools import lru_cache
+from io import BytesIO
 import logging
 import math
 import os
 from pathlib import Path
 import re
-from typing import Literal
+import sys
+from typing import Any, Literal, cast
+from xml.etree.ElementTree import Element
+from zipfile import ZipFile
 
+from defusedxml import ElementTree
 import numpy as np
+from openpyxl.cell.text import Text
 from openpyxl.styles.colors import Color
+from openpyxl.styles.numbers import (
+    builtin_format_code,
+    is_date_format,
+    is_timedelta_format,
+)
 from openpyxl.utils import get_column_letter, range_boundaries
+from openpyxl.utils.datetime import (
+    CALENDAR_MAC_1904,
+    CALENDAR_WINDOWS_1900,
+    from_excel,
+    from_ISO8601,
+)
+from openpyxl.workbook.workbook import Workbook
+from openpyxl.worksheet._read_only import ReadOnlyWorksheet
 from openpyxl.worksheet.worksheet import Worksheet
 import pandas as pd
 import xlwings as xw
 
 from ..models import CellRow
+from .ooxml_package import iter_sheet_xml_paths, read_relationships
 from .workbook import openpyxl_workbook
 
 logger = logging.getLogger(__name__)
@@ -44,6 +74,27 @@ _DETECTION_CONFIG = {
 _DEFAULT_BACKGROUND_HEX = "FFFFFF"
 _XL_COLOR_NONE = -4142
 _BORDER_CLUSTER_BACKEND_ENV = "EXSTRUCT_BORDER_CLUSTER_BACKEND"
+# ``CellRow`` column keys ("0", "1", ...) for every Excel column (XFD = 16384),
+# interned once so all rows share the same key objects.
+_COL_KEYS: tuple[str, ...] = tuple(sys.intern(str(i)) for i in range(16384))
+_SHEET_MAIN_NS = "{http://schemas.openxmlformats.org/spreadsheetml/2006/main}"
+_ROW_TAG = f"{_SHEET_MAIN_NS}row"
+_CELL_TAG = f"{_SHEET_MAIN_NS}c"
+_VALUE_TAG = f"{_SHEET_MAIN_NS}v"
+_INLINE_STRING_TAG = f"{_SHEET_MAIN_NS}is"
+_SHARED_STRING_TAG = f"{_SHEET_MAIN_NS}si"
+# ``<`` never appears unescaped in cell text, so a raw byte scan for the
+# ``mergeCell`` start tag cannot be fooled by sheet contents.
+_MERGE_CELL_REF_RE = re.compile(
+    rb"<(?:[\w.-]+:)?mergeCell\s[^>]*?\bref\s*=\s*[\"']([^\"']+)[\"']"
+)
+_CELL_RANGE_REF_RE = re.compile(r"([A-Z]+)([0-9]+)(?::([A-Z]+)([0-9]+))?")
+_STYLES_REL_TYPE = (
+    "http://schemas.openxmlformats.org/officeDocument/2006/relationships/styles"
+)
+_SHARED_STRINGS_REL_TYPE = (
+    "http://schemas.openxmlformats.org/officeDocument/2006/relationships/sharedStrings"
+)
 
 ExtractionMode = Literal["light", "libreoffice", "standard", "verbose"]
 
@@ -103,7 +154,7 @@ class WorkbookFormulasMap:
         return self.sheets.get(sheet_name)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MergedCellRange:
     """Merged cell range with normalized value."""
 
@@ -165,8 +216,57 @@ def _resolve_table_scan_limits(
     return _DEFAULT_TABLE_SCAN_LIMITS
 
 
+@contextmanager
+def _openpyxl_workbook_or_borrowed(
+    file_path: Path,
+    workbook: Workbook | None,
+    *,
+    data_only: bool,
+    read_only: bool = False,
+) -> Iterator[Workbook]:
+    """Yield a caller-owned workbook as-is, or open (and close) one from disk.
+
+    Args:
+        file_path: Excel workbook path used when no workbook is supplied.
+        workbook: Already-opened workbook owned by the caller, or None.
+        data_only: Whether a freshly opened workbook reads cached values.
+        read_only: Whether a freshly opened workbook streams its sheets.
+
+    Yields:
+        openpyxl workbook instance.
+    """
+    if workbook is not None:
+        yield workbook
+        return
+    with openpyxl_workbook(file_path, data_only=data_only, read_only=read_only) as wb:
+        yield wb
+
+
+def _select_worksheets(
+    workbook: Workbook, sheet_names: Collection[str] | None
+) -> list[Worksheet]:
+    """Return the workbook's worksheets, limited to ``sheet_names`` when given.
+
+    Args:
+        workbook: openpyxl workbook instance.
+        sheet_names: Sheet titles to keep, or None for every worksheet. Unknown
+            titles are ignored.
+
+    Returns:
+        Worksheets in workbook order.
+    """
+    if sheet_names is None:
+        return list(workbook.worksheets)
+    return [ws for ws in workbook.worksheets if ws.title in sheet_names]
+
+
 def extract_sheet_colors_map(
-    file_path: Path, *, include_default_background: bool, ignore_colors: set[str] | None
+    file_path: Path,
+    *,
+    include_default_background: bool,
+    ignore_colors: set[str] | None,
+    workbook: Workbook | None = None,
+    sheet_names: Collection[str] | None = None,
 ) -> WorkbookColorsMap:
     """Extract background colors for each worksheet.
 
@@ -175,13 +275,16 @@ def extract_sheet_colors_map(
         include_default_background: Whether to include default (white) backgrounds
             within the used range.
         ignore_colors: Optional set of color keys to ignore.
+        workbook: Already-opened ``data_only=True`` workbook to reuse instead of
+            loading ``file_path`` again. The caller keeps ownership.
+        sheet_names: Optional sheet titles to scan; other sheets are skipped.
 
     Returns:
         WorkbookColorsMap containing per-sheet color maps.
     """
     sheets: dict[str, SheetColorsMap] = {}
-    with openpyxl_workbook(file_path, data_only=True, read_only=False) as wb:
-        for ws in wb.worksheets:
+    with _openpyxl_workbook_or_borrowed(file_path, workbook, data_only=True) as wb:
+        for ws in _select_worksheets(wb, sheet_names):
             sheet_map = _extract_sheet_colors(
                 ws, include_default_background, ignore_colors
             )
@@ -189,19 +292,30 @@ def extract_sheet_colors_map(
     return WorkbookColorsMap(sheets=sheets)
 
 
-def extract_sheet_formulas_map(file_path: Path) -> WorkbookFormulasMap:
+def extract_sheet_formulas_map(
+    file_path: Path,
+    *,
+    workbook: Workbook | None = None,
+    sheet_names: Collection[str] | None = None,
+) -> WorkbookFormulasMap:
     """
     Extract normalized formula strings from every worksheet in the workbook.
 
     Parameters:
         file_path (Path): Path to the Excel workbook to read.
+        workbook (Workbook | None): Already-opened ``data_only=False`` workbook to reuse instead of loading ``file_path`` again. The caller keeps ownership.
+        sheet_names (Collection[str] | None): Optional sheet titles to scan; other sheets are skipped.
 
     Returns:
         WorkbookFormulasMap: Mapping of sheet names to SheetFormulasMap objects. Each SheetFormulasMap contains a mapping from normalized formula strings (each beginning with "=") to a list of cell coordinates (row, column) where that formula occurs.
     """
     sheets: dict[str, SheetFormulasMap] = {}
-    with openpyxl_workbook(file_path, data_only=False, read_only=False) as wb:
-        for ws in wb.worksheets:
+    # Formulas need neither styles nor random access, so a workbook opened
+    # here streams each sheet's XML instead of materializing every cell.
+    with _openpyxl_workbook_or_borrowed(
+        file_path, workbook, data_only=False, read_only=True
+    ) as wb:
+        for ws in _select_worksheets(wb, sheet_names):
             sheet_map = _extract_sheet_formulas(ws)
             sheets[ws.title] = sheet_map
     return WorkbookFormulasMap(sheets=sheets)
@@ -230,16 +344,19 @@ def extract_sheet_formulas_map_com(workbook: xw.Book) -> WorkbookFormulasMap:
                 sheet_name=sheet.name, formulas_map=formulas_map
             )
             continue
+        # One ``.formula`` read pulls the whole used range across the COM
+        # boundary; the '=' scan below runs on the returned Python values.
         rng = sheet.range((start_row, start_col), (max_row, max_col))
         matrix = _normalize_matrix(rng.formula)
-        for r_offset, row in enumerate(matrix):
+        col_base = start_col - 1
+        for row_index, row in enumerate(matrix, start=start_row):
             for c_offset, value in enumerate(row):
                 normalized = _normalize_formula_from_com(value)
                 if normalized is None:
                     continue
-                row_index = start_row + r_offset
-                col_index = start_col + c_offset - 1
-                formulas_map.setdefault(normalized, []).append((row_index, col_index))
+                formulas_map.setdefault(normalized, []).append(
+                    (row_index, col_base + c_offset)
+                )
         sheets[sheet.name] = SheetFormulasMap(
             sheet_name=sheet.name, formulas_map=formulas_map
         )
@@ -293,16 +410,23 @@ def _extract_sheet_colors(
     if min_row > max_row or min_col > max_col:
         return SheetColorsMap(sheet_name=ws.title, colors_map=colors_map)
 
-    ignore_set = _normalize_ignore_colors(ignore_colors)
+    normalize_key = _make_color_key_normalizer(ignore_colors)
+    # Cells reference the workbook's shared fills by index, so each distinct
+    # fill is resolved and normalized once per sheet.
+    keys_by_fill_id: dict[int, str | None] = {}
     for row in ws.iter_rows(
         min_row=min_row, max_row=max_row, min_col=min_col, max_col=max_col
     ):
         for cell in row:
-            color_key = _resolve_cell_background(cell, include_default_background)
-            if color_key is None:
-                continue
-            normalized_key = _normalize_color_key(color_key)
-            if _should_ignore_color(normalized_key, ignore_set):
+            fill_id = _cell_fill_id(cell)
+            if fill_id is not None and fill_id in keys_by_fill_id:
+                normalized_key = keys_by_fill_id[fill_id]
+            else:
+                color_key = _resolve_cell_background(cell, include_default_background)
+                normalized_key = None if color_key is None else normalize_key(color_key)
+                if fill_id is not None:
+                    keys_by_fill_id[fill_id] = normalized_key
+            if normalized_key is None:
                 continue
             colors_map.setdefault(normalized_key, []).append(
                 (cell.row, cell.col_idx - 1)
@@ -310,6 +434,18 @@ def _extract_sheet_colors(
     return SheetColorsMap(sheet_name=ws.title, colors_map=colors_map)
 
 
+def _cell_fill_id(cell: object) -> int | None:
+    """Return the index of a cell's fill in the workbook fill table.
+
+    openpyxl builds a new proxy object on every ``cell.fill`` access, while the
+    style array holds the stable table index. Returns None for cell objects
+    without a style array so callers resolve the fill directly.
+    """
+    style = getattr(cell, "_style", None)
+    fill_id = getattr(style, "fillId", None)
+    return fill_id if isinstance(fill_id, int) else None
+
+
 def _extract_sheet_formulas(ws: Worksheet) -> SheetFormulasMap:
     """
     Collect normalized formula strings from a worksheet and group their cell coordinates.
@@ -320,21 +456,29 @@ def _extract_sheet_formulas(ws: Worksheet) -> SheetFormulasMap:
     Returns:
         SheetFormulasMap: container with the sheet's name and a mapping from each normalized formula string (prefixed with "=") to a list of cell coordinates as (row, zero-based-column).
     """
-    min_row, min_col, max_row, max_col = _get_used_range_bounds(ws)
     formulas_map: dict[str, list[tuple[int, int]]] = {}
-    if min_row > max_row or min_col > max_col:
-        return SheetFormulasMap(sheet_name=ws.title, formulas_map=formulas_map)
+    rows: Iterable[Sequence[object]]
+    if isinstance(ws, ReadOnlyWorksheet):
+        # Streamed sheets yield only the rows stored in the XML; an unbounded
+        # scan avoids trusting the file's own <dimension> element.
+        rows = ws.iter_rows()
+    else:
+        min_row, min_col, max_row, max_col = _get_used_range_bounds(ws)
+        if min_row > max_row or min_col > max_col:
+            return SheetFormulasMap(sheet_name=ws.title, formulas_map=formulas_map)
+        rows = ws.iter_rows(
+            min_row=min_row, max_row=max_row, min_col=min_col, max_col=max_col
+        )
 
-    for row in ws.iter_rows(
-        min_row=min_row, max_row=max_row, min_col=min_col, max_col=max_col
-    ):
+    for row in rows:
         for cell in row:
             if getattr(cell, "data_type", None) != "f":
                 continue
             normalized = _normalize_formula_value(getattr(cell, "value", None))
             if normalized is None:
                 continue
-            formulas_map.setdefault(normalized, []).append((cell.row, cell.col_idx - 1))
+            c = cast(Any, cell)
+            formulas_map.setdefault(normalized, []).append((c.row, c.column - 1))
     return SheetFormulasMap(sheet_name=ws.title, formulas_map=formulas_map)
 
 
@@ -404,7 +548,7 @@ def _extract_sheet_colors_com(
     if max_row <= 0 or max_col <= 0:
         return SheetColorsMap(sheet_name=sheet.name, colors_map=colors_map)
 
-    ignore_set = _normalize_ignore_colors(ignore_colors)
+    normalize_key = _make_color_key_normalizer(ignore_colors)
     for row in range(start_row, max_row + 1):
         for col in range(start_col, max_col + 1):
             color_key = _resolve_cell_background_com(
@@ -412,8 +556,8 @@ def _extract_sheet_colors_com(
             )
             if color_key is None:
                 continue
-            normalized_key = _normalize_color_key(color_key)
-            if _should_ignore_color(normalized_key, ignore_set):
+            normalized_key = normalize_key(color_key)
+            if normalized_key is None:
                 continue
             colors_map.setdefault(normalized_key, []).append((row, col - 1))
     return SheetColorsMap(sheet_name=sheet.name, colors_map=colors_map)
@@ -611,22 +755,57 @@ def _normalize_color_key(color_key: str) -> str:
     return hex_key
 
 
-def _normalize_ignore_colors(ignore_colors: set[str] | None) -> set[str]:
+def _normalize_ignore_colors(ignore_colors: set[str] | None) -> frozenset[str]:
     """Normalize ignore color keys.
 
     Args:
         ignore_colors: Optional set of color keys to ignore.
 
     Returns:
-        Normalized set of color keys.
+        Normalized, immutable set of color keys.
     """
     if not ignore_colors:
-        return set()
+        return frozenset()
     normalized = {_normalize_color_key(color) for color in ignore_colors}
-    return {color for color in normalized if color}
+    return frozenset(color for color in normalized if color)
+
+
+_UNRESOLVED = object()
+
+
+def _make_color_key_normalizer(
+    ignore_colors: set[str] | None,
+) -> Callable[[str], str | None]:
+    """Build a memoized mapper from raw color keys to normalized, non-ignored keys.
+
+    A sheet typically uses a handful of distinct fills across many cells, so
+    normalization and the ignore check run once per distinct raw key instead
+    of once per cell.
+
+    Args:
+        ignore_colors: Optional set of color keys to ignore (normalized once here).
+
+    Returns:
+        Function returning the normalized key, or None when the color is ignored.
+    """
+    ignore_set = _normalize_ignore_colors(ignore_colors)
+    resolved: dict[str, str | None] = {}
+    lookup = resolved.get
+
+    def _normalize(color_key: str) -> str | None:
+        # Cache hits are the per-cell path: one dict probe, no second lookup.
+        result = lookup(color_key, _UNRESOLVED)
+        if result is not _UNRESOLVED:
+            return cast(str | None, result)
+        normalized = _normalize_color_key(color_key)
+        result = None if _should_ignore_color(normalized, ignore_set) else normalized
+        resolved[color_key] = result
+        return result
 
+    return _normalize
 
-def _should_ignore_color(color_key: str, ignore_colors: set[str]) -> bool:
+
+def _should_ignore_color(color_key: str, ignore_colors: frozenset[str]) -> bool:
     """Check whether a color key should be ignored.
 
     Args:
@@ -669,9 +848,13 @@ def _color_to_key(color: Color | object) -> str | None:
     return None
 
 
+@lru_cache(maxsize=4096)
 def _normalize_rgb(rgb: str) -> str:
     """Normalize an RGB/ARGB string into 6-hex format.
 
+    Called for every colored cell before any per-sheet dedup, and sheets
+    reuse a handful of ARGB strings, so results are memoized.
+
     Args:
         rgb: Raw RGB/ARGB string from openpyxl.
 
@@ -704,14 +887,15 @@ def extract_sheet_cells(file_path: Path) -> dict[str, list[CellRow]]:
     result: dict[str, list[CellRow]] = {}
     for sheet_name, df in dfs.items():
         df = df.fillna("")
+        col_keys = _COL_KEYS[: df.shape[1]]
         rows: list[CellRow] = []
         for excel_row, row in enumerate(df.itertuples(index=False, name=None), start=1):
             filtered: dict[str, int | float | str] = {}
-            for j, v in enumerate(row):
+            for col_key, v in zip(col_keys, row, strict=True):
                 s = "" if v is None else str(v)
                 if s.strip() == "":
                     continue
-                filtered[str(j)] = _coerce_numeric_preserve_format(s)
+                filtered[col_key] = _coerce_numeric_preserve_format(s)
             if not filtered:
                 continue
             rows.append(CellRow(r=excel_row, c=filtered))
@@ -719,10 +903,17 @@ def extract_sheet_cells(file_path: Path) -> dict[str, list[CellRow]]:
     return result
 
 
-def extract_sheet_cells_with_links(file_path: Path) -> dict[str, list[CellRow]]:
+def extract_sheet_cells_with_links(
+    file_path: Path, *, workbook: Workbook | None = None
+) -> dict[str, list[CellRow]]:
     """
     Extract cells and hyperlinks per sheet.
 
+    Args:
+        file_path: Excel workbook path.
+        workbook: Already-opened ``data_only=True`` workbook to reuse for the
+            hyperlink scan. The caller keeps ownership.
+
     Returns:
         {sheet_name: [CellRow(r=..., c=..., links={"col_index": url, ...}), ...]}
 
@@ -733,7 +924,7 @@ def extract_sheet_cells_with_links(file_path: Path) -> dict[str, list[CellRow]]:
     """
     cell_rows = extract_sheet_cells(file_path)
     links_by_sheet: dict[str, dict[int, dict[str, str]]] = {}
-    with openpyxl_workbook(file_path, data_only=True, read_only=False) as wb:
+    with _openpyxl_workbook_or_borrowed(file_path, workbook, data_only=True) as wb:
         for ws in wb.worksheets:
             sheet_links: dict[int, dict[str, str]] = {}
             for row in ws.iter_rows():
@@ -742,59 +933,403 @@ def extract_sheet_cells_with_links(file_path: Path) -> dict[str, list[CellRow]]:
                     target = getattr(link, "target", None) if link else None
                     if not target:
                         continue
-                    col_str = str(
-                        cell.col_idx - 1
-                    )  # zero-based to align with extract_sheet_cells
+                    # zero-based to align with extract_sheet_cells
+                    col_str = _COL_KEYS[cell.col_idx - 1]
                     sheet_links.setdefault(cell.row, {})[col_str] = target
             links_by_sheet[ws.title] = sheet_links
 
     merged: dict[str, list[CellRow]] = {}
     for sheet_name, rows in cell_rows.items():
         sheet_links = links_by_sheet.get(sheet_name, {})
-        merged_rows: list[CellRow] = []
-        for row in rows:
-            links = sheet_links.get(row.r, {})
-            merged_rows.append(CellRow(r=row.r, c=row.c, links=links or None))
+        # Link dicts are only created for rows that have a hyperlink, so rows
+        # without one keep links=None instead of a throwaway empty dict.
+        merged_rows = [
+            CellRow(r=row.r, c=row.c, links=sheet_links.get(row.r)) for row in rows
+        ]
         merged[sheet_name] = merged_rows
-    wb.close()
     return merged
 
 
-def extract_sheet_merged_cells(file_path: Path) -> dict[str, list[MergedCellRange]]:
-    """Extract merged cell ranges per sheet via openpyxl.
+def extract_sheet_merged_cells(
+    file_path: Path,
+    *,
+    workbook: Workbook | None = None,
+    sheet_names: Collection[str] | None = None,
+) -> dict[str, list[MergedCellRange]]:
+    """Extract merged cell ranges per sheet.
+
+    Without a borrowed workbook the ranges are read straight from the xlsx
+    XML (see ``extract_sheet_merged_cells_fast``) instead of loading the whole
+    workbook through openpyxl. Both paths return each sheet's ranges sorted by
+    ``(r1, c1, r2, c2)``, because openpyxl keeps them in an unordered set.
 
     Args:
         file_path: Excel workbook path.
+        workbook: Already-opened ``data_only=True`` workbook to reuse instead of
+            loading ``file_path`` again. The caller keeps ownership.
+        sheet_names: Optional sheet titles to scan; other sheets are skipped.
 
     Returns:
         Mapping of sheet name to merged cell ranges.
     """
+    if workbook is None:
+        return extract_sheet_merged_cells_fast(file_path, sheet_names=sheet_names)
     merged_by_sheet: dict[str, list[MergedCellRange]] = {}
-    with openpyxl_workbook(file_path, data_only=True, read_only=False) as wb:
-        for ws in wb.worksheets:
-            merged_ranges = getattr(ws, "merged_cells", None)
-            if merged_ranges is None:
-                merged_by_sheet[ws.title] = []
+    for ws in _select_worksheets(workbook, sheet_names):
+        merged_ranges = getattr(ws, "merged_cells", None)
+        if merged_ranges is None:
+            merged_by_sheet[ws.title] = []
+            continue
+        results: list[MergedCellRange] = []
+        for merged_range in getattr(merged_ranges, "ranges", []):
+            min_col, min_row, max_col, max_row = range_boundaries(str(merged_range))
+            cell_value = ws.cell(row=min_row, column=min_col).value
+            results.append(
+                _merged_cell_range(min_col, min_row, max_col, max_row, cell_value)
+            )
+        merged_by_sheet[ws.title] = _sorted_merged_ranges(results)
+    return merged_by_sheet
+
+
+def extract_sheet_merged_cells_fast(
+    file_path: Path, *, sheet_names: Collection[str] | None = None
+) -> dict[str, list[MergedCellRange]]:
+    """Extract merged cell ranges per sheet directly from the xlsx XML.
+
+    Only the ``<mergeCell>`` refs and the top-left cell of each range are
+    read; cell values are decoded the way openpyxl's ``data_only`` reader
+    does, and ranges are sorted by ``(r1, c1, r2, c2)`` rather than kept in
+    document order, so the result matches the openpyxl path.
+
+    Args:
+        file_path: Excel workbook path (xlsx/xlsm).
+        sheet_names: Optional sheet titles to scan; other sheets are skipped.
+
+    Returns:
+        Mapping of sheet name to merged cell ranges.
+    """
+    raw_by_sheet: dict[
+        str, list[tuple[tuple[int, int, int, int], _RawCellValue | None]]
+    ] = {}
+    with ZipFile(file_path) as archive:
+        for sheet_name, sheet_xml_path in iter_sheet_xml_paths(archive):
+            if sheet_names is not None and sheet_name not in sheet_names:
                 continue
-            results: list[MergedCellRange] = []
-            for merged_range in getattr(merged_ranges, "ranges", []):
-                bounds = range_boundaries(str(merged_range))
-                min_col, min_row, max_col, max_row = bounds
-                cell_value = ws.cell(row=min_row, column=min_col).value
-                value_str = "" if cell_value is None else str(cell_value)
-                if value_str == "":
-                    value_str = " "
-                results.append(
-                    MergedCellRange(
-                        r1=min_row,
-                        c1=min_col - 1,
-                        r2=max_row,
-                        c2=max_col - 1,
-                        v=value_str,
-                    )
+            data = archive.read(sheet_xml_path)
+            merges = _read_merge_refs(data, sheet_name)
+            # Anchor cells are looked up by their A1 text, as written in both
+            # the normalized mergeCell ref and the cell's r attribute.
+            anchors = _read_anchor_cells(
+                data, {ref.partition(":")[0]: (b[1], b[0]) for ref, b in merges}
+            )
+            raw_by_sheet[sheet_name] = [
+                (b, anchors.get((b[1], b[0]))) for _, b in merges
+            ]
+        decoder = _CellValueDecoder.load(
+            archive,
+            [raw for ranges in raw_by_sheet.values() for _, raw in ranges if raw],
+        )
+    return {
+        sheet_name: _sorted_merged_ranges(
+            [_merged_cell_range(*bounds, decoder.decode(raw)) for bounds, raw in ranges]
+        )
+        for sheet_name, ranges in raw_by_sheet.items()
+    }
+
+
+def _sorted_merged_ranges(ranges: list[MergedCellRange]) -> list[MergedCellRange]:
+    """Return merged ranges in the ``(r1, c1, r2, c2)`` order both readers share."""
+    return sorted(ranges, key=lambda r: (r.r1, r.c1, r.r2, r.c2))
+
+
+def _merged_cell_range(
+    min_col: int, min_row: int, max_col: int, max_row: int, cell_value: object
+) -> MergedCellRange:
+    """Build a MergedCellRange from 1-based bounds and the top-left value."""
+    value_str = "" if cell_value is None else str(cell_value)
+    return MergedCellRange(
+        r1=min_row,
+        c1=min_col - 1,
+        r2=max_row,
+        c2=max_col - 1,
+        v=value_str or " ",
+    )
+
+
+def _cell_ref_to_row_col(ref: str) -> tuple[int, int]:
+    """Split an A1-style reference into 1-based ``(row, column)``.
+
+    Args:
+        ref: Cell reference such as ``"AB12"``.
+
+    Returns:
+        Row and column numbers.
+
+    Raises:
+        ValueError: If ``ref`` is not a plain A1 reference.
+    """
+    col = 0
+    for index, char in enumerate(ref):
+        code = ord(char) - 64
+        if not 1 <= code <= 26:
+            if index == 0:
+                break
+            return int(ref[index:]), col
+        col = col * 26 + code
+    raise ValueError(f"Invalid cell reference: {ref!r}")
+
+
+@lru_cache(maxsize=4096)
+def _column_number(letters: str) -> int:
+    """Return the 1-based column number for column letters such as ``"AB"``."""
+    col = 0
+    for char in letters:
+        col = col * 26 + ord(char) - 64
+    return col
+
+
+def _read_merge_refs(
+    data: bytes, sheet_name: str
+) -> list[tuple[str, tuple[int, int, int, int]]]:
+    """Return the normalized ``<mergeCell>`` refs of a worksheet with their bounds.
+
+    Refs are upper-cased and stripped of ``$`` markers, as openpyxl accepts
+    them; refs that still do not parse are logged and skipped so one bad
+    entry does not discard the sheet's other merged ranges.
+
+    Args:
+        data: Raw worksheet XML.
+        sheet_name: Sheet name used in log messages.
+
+    Returns:
+        ``(ref, (min_col, min_row, max_col, max_row))`` pairs in document order.
+    """
+    merges: list[tuple[str, tuple[int, int, int, int]]] = []
+    for match in _MERGE_CELL_REF_RE.finditer(data):
+        ref = match.group(1).decode("ascii", "replace").replace("$", "").upper()
+        try:
+            merges.append((ref, _merge_ref_bounds(ref)))
+        except ValueError:
+            logger.warning(
+                "Skipping invalid merged cell reference %r on sheet %s.",
+                ref,
+                sheet_name,
+            )
+    return merges
+
+
+def _merge_ref_bounds(ref: str) -> tuple[int, int, int, int]:
+    """Return ``(min_col, min_row, max_col, max_row)`` for a mergeCell ref.
+
+    Raises:
+        ValueError: If ``ref`` is not an A1 cell or range reference.
+    """
+    match = _CELL_RANGE_REF_RE.fullmatch(ref)
+    if match is None:
+        raise ValueError(f"Invalid cell reference: {ref!r}")
+    first_col, first_row, last_col, last_row = match.groups()
+    min_col = _column_number(first_col)
+    min_row = int(first_row)
+    if last_col is None:
+        return min_col, min_row, min_col, min_row
+    return min_col, min_row, _column_number(last_col), int(last_row)
+
+
+@dataclass(frozen=True, slots=True)
+class _RawCellValue:
+    """Undecoded ``<c>`` element payload: type, text, and style index."""
+
+    data_type: str
+    text: str | None
+    style_id: int
+
+
+def _read_anchor_cells(
+    data: bytes, anchors: Mapping[str, tuple[int, int]]
+) -> dict[tuple[int, int], _RawCellValue]:
+    """Stream a worksheet part and collect the cells at ``anchors``.
+
+    Rows are stored in ascending order, so parsing stops once every anchor is
+    found or the last anchor row has been passed. Cells carrying an ``r``
+    attribute are matched by that text alone; a reference is only parsed when
+    a following cell omits ``r`` and its column has to be counted.
+
+    Args:
+        data: Worksheet XML bytes.
+        anchors: A1 reference text to 1-based ``(row, column)`` position.
+
+    Returns:
+        Raw payload per anchor position; anchors without a ``<c>`` element are
+        absent.
+    """
+    found: dict[tuple[int, int], _RawCellValue] = {}
+    if not anchors:
+        return found
+    positions = set(anchors.values())
+    last_row = max(row for row, _ in positions)
+    row = col = 0
+    last_ref = ""
+    for event, elem in ElementTree.iterparse(BytesIO(data), events=("start", "end")):
+        if event == "start":
+            if elem.tag == _ROW_TAG:
+                row_attr = elem.get("r")
+                row = int(row_attr) if row_attr else row + 1
+                col = 0
+                if row > last_row:
+                    break
+            continue
+        if elem.tag != _CELL_TAG:
+            if elem.tag == _ROW_TAG:
+                elem.clear()
+            continue
+        ref = elem.get("r")
+        position: tuple[int, int] | None
+        if ref:
+            position = anchors.get(ref)
+            last_ref = ref
+            col = -1
+        else:
+            if col < 0:
+                row, col = _cell_ref_to_row_col(last_ref)
+            col += 1
+            position = (row, col) if (row, col) in positions else None
+        if position is not None:
+            found[position] = _raw_cell_value(elem)
+            if len(found) == len(positions):
+                break
+        elem.clear()
+    return found
+
+
+def _raw_cell_value(elem: Element) -> _RawCellValue:
+    """Capture a ``<c>`` element before it is cleared."""
+    data_type = elem.get("t", "n")
+    style_id = int(elem.get("s") or 0)
+    if data_type != "inlineStr":
+        return _RawCellValue(data_type, elem.findtext(_VALUE_TAG) or None, style_id)
+    inline = elem.find(_INLINE_STRING_TAG)
+    text = None if inline is None else Text.from_tree(inline).content
+    return _RawCellValue(data_type, text, style_id)
+
+
+@dataclass(frozen=True)
+class _CellValueDecoder:
+    """Workbook-level lookups needed to decode raw cell payloads."""
+
+    shared_strings: dict[int, str]
+    date_styles: frozenset[int]
+    timedelta_styles: frozenset[int]
+    epoch: datetime
+
+    @classmethod
+    def load(
+        cls, archive: ZipFile, raw_cells: Sequence[_RawCellValue]
+    ) -> _CellValueDecoder:
+        """Read only the shared strings and styles that ``raw_cells`` refer to."""
+        rels = read_relationships(archive, "xl/_rels/workbook.xml.rels")
+        targets = {rel.relationship_type: rel.target for rel in rels.values()}
+        string_ids = {
+            int(raw.text) for raw in raw_cells if raw.data_type == "s" and raw.text
+        }
+        shared_strings: dict[int, str] = {}
+        strings_path = targets.get(_SHARED_STRINGS_REL_TYPE)
+        if string_ids and strings_path:
+            shared_strings = _read_shared_strings(archive, strings_path, string_ids)
+        date_styles: frozenset[int] = frozenset()
+        timedelta_styles: frozenset[int] = frozenset()
+        styles_path = targets.get(_STYLES_REL_TYPE)
+        if styles_path and any(
+            raw.data_type == "n" and raw.style_id for raw in raw_cells
+        ):
+            date_styles, timedelta_styles = _read_date_styles(archive, styles_path)
+        return cls(
+            shared_strings=shared_strings,
+            date_styles=date_styles,
+            timedelta_styles=timedelta_styles,
+            epoch=_read_workbook_epoch(archive)
+            if date_styles
+            else CALENDAR_WINDOWS_1900,
+        )
+
+    def decode(self, raw: _RawCellValue | None) -> object:
+        """Convert a raw payload to the value openpyxl would report."""
+        if raw is None or raw.text is None:
+            return None
+        text = raw.text
+        if raw.data_type == "n":
+            number = float(text) if "." in text or "e" in text.lower() else int(text)
+            if raw.style_id not in self.date_styles:
+                return number
+            try:
+                return from_excel(
+                    number,
+                    self.epoch,
+                    timedelta=raw.style_id in self.timedelta_styles,
                 )
-            merged_by_sheet[ws.title] = results
-    return merged_by_sheet
+            except (OverflowError, ValueError):
+                return "#VALUE!"
+        if raw.data_type == "s":
+            return self.shared_strings[int(text)]
+        if raw.data_type == "b":
+            return bool(int(text))
+        if raw.data_type == "d":
+            return from_ISO8601(text)
+        return text
+
+
+def _read_shared_strings(
+    archive: ZipFile, path: str, wanted: set[int]
+) -> dict[int, str]:
+    """Stream the shared string table, stopping after the last wanted index."""
+    strings: dict[int, str] = {}
+    last = max(wanted)
+    index = 0
+    with archive.open(path) as fp:
+        for _, elem in ElementTree.iterparse(fp):
+            if elem.tag != _SHARED_STRING_TAG:
+                continue
+            if index in wanted:
+                strings[index] = Text.from_tree(elem).content.replace("x005F_", "")
+            elem.clear()
+            if index == last:
+                break
+            index += 1
+    return strings
+
+
+def _read_date_styles(
+    archive: ZipFile, path: str
+) -> tuple[frozenset[int], frozenset[int]]:
+    """Return the cellXfs indices whose number format is a date or a duration."""
+    root = ElementTree.fromstring(archive.read(path))
+    custom = {
+        int(fmt.get("numFmtId", -1)): fmt.get("formatCode")
+        for fmt in root.iterfind(f"{_SHEET_MAIN_NS}numFmts/{_SHEET_MAIN_NS}numFmt")
+    }
+    date_styles: set[int] = set()
+    timedelta_styles: set[int] = set()
+    xfs = root.iterfind(f"{_SHEET_MAIN_NS}cellXfs/{_SHEET_MAIN_NS}xf")
+    for index, xf in enumerate(xfs):
+        fmt_id = int(xf.get("numFmtId", 0))
+        fmt = custom[fmt_id] if fmt_id in custom else builtin_format_code(fmt_id)
+        if is_date_format(fmt):
+            date_styles.add(index)
+        if is_timedelta_format(fmt):
+            timedelta_styles.add(index)
+    return frozenset(date_styles), frozenset(timedelta_styles)
+
+
+def _read_workbook_epoch(archive: ZipFile) -> datetime:
+    """Return the serial-date epoch declared by ``workbookPr/@date1904``."""
+    root = ElementTree.fromstring(archive.read("xl/workbook.xml"))
+    props = root.find(f"{_SHEET_MAIN_NS}workbookPr")
+    date1904 = "" if props is None else props.get("date1904", "")
+    epoch: datetime = (
+        CALENDAR_MAC_1904
+        if date1904.lower() in {"1", "true"}
+        else CALENDAR_WINDOWS_1900
+    )
+    return epoch
 
 
 def shrink_to_content(  # noqa: C901
@@ -937,6 +1472,30 @@ def shrink_to_content(  # noqa: C901
     return top, left, bottom, right
 
 
+def _read_only_sheet_dimension(ws: object) -> str:
+    """Return the used-range dimension of a read-only worksheet.
+
+    Read-only worksheets report the ``<dimension>`` element stored in the file.
+    When it is missing, or is the bare "A1:A1" some writers emit regardless of
+    content, the sheet is measured by scanning its rows instead.
+
+    Args:
+        ws: openpyxl read-only worksheet.
+
+    Returns:
+        Dimension string such as "A1:D20".
+    """
+    sheet = cast(Any, ws)
+    try:
+        dimension = str(sheet.calculate_dimension())
+    except ValueError:
+        dimension = ""
+    if dimension in ("", "A1:A1"):
+        sheet.reset_dimensions()
+        dimension = str(sheet.calculate_dimension(force=True))
+    return dimension
+
+
 def load_border_maps_xlsx(  # noqa: C901
     xlsx_path: Path,
     sheet_name: str,
@@ -954,14 +1513,17 @@ def load_border_maps_xlsx(  # noqa: C901
         Tuple of (has_border, top_edge, bottom_edge, left_edge, right_edge,
         scan_max_row, scan_max_col).
     """
-    with openpyxl_workbook(xlsx_path, data_only=True, read_only=False) as wb:
+    # Read-only mode streams just this sheet's XML and stops parsing at the
+    # early-exit below, instead of materializing every sheet up front and
+    # creating a Cell object for each probed coordinate via ws.cell().
+    with openpyxl_workbook(xlsx_path, data_only=True, read_only=True) as wb:
         if sheet_name not in wb.sheetnames:
             raise KeyError(f"Sheet '{sheet_name}' not found in {xlsx_path}")
 
         ws = wb[sheet_name]
         try:
             min_col, min_row, max_col, max_row = range_boundaries(
-                ws.calculate_dimension()
+                _read_only_sheet_dimension(ws)
             )
         except Exception:
             min_col, min_row, max_col, max_row = (
@@ -971,77 +1533,101 @@ def load_border_maps_xlsx(  # noqa: C901
                 ws.max_row or 1,
             )
 
-    resolved_limits = scan_limits or _DEFAULT_TABLE_SCAN_LIMITS
-    scan_max_row = min(max_row, resolved_limits.max_rows)
-    scan_max_col = min(max_col, resolved_limits.max_cols)
-
-    shape = (scan_max_row + 1, scan_max_col + 1)
-    has_border = np.zeros(shape, dtype=bool)
-    top_edge = np.zeros(shape, dtype=bool)
-    bottom_edge = np.zeros(shape, dtype=bool)
-    left_edge = np.zeros(shape, dtype=bool)
-    right_edge = np.zeros(shape, dtype=bool)
-    col_has_border = np.zeros(shape[1], dtype=bool)
-
-    def edge_has_style(edge: object) -> bool:
-        """Return True when a border edge has a usable style."""
-        if edge is None:
-            return False
-        style = getattr(edge, "style", None)
-        return style is not None and style != "none"
-
-    consecutive_empty_rows = 0
-    current_max_col = scan_max_col
-    rows_scanned = 0
-
-    for r in range(min_row, scan_max_row + 1):
-        row_has_border = False
-        for c in range(min_col, current_max_col + 1):
-            cell = ws.cell(row=r, column=c)
-            b = getattr(cell, "border", None)
-            if b is None:
-                continue
-
-            t = edge_has_style(b.top)
-            btm = edge_has_style(b.bottom)
-            left_border = edge_has_style(b.left)
-            rgt = edge_has_style(b.right)
-
-            if t or btm or left_border or rgt:
-                row_has_border = True
-                col_has_border[c] = True
-                has_border[r, c] = True
-                if t:
-                    top_edge[r, c] = True
-                if btm:
-                    bottom_edge[r, c] = True
-                if left_border:
-                    left_edge[r, c] = True
-                if rgt:
-                    right_edge[r, c] = True
-
-        if row_has_border:
-            consecutive_empty_rows = 0
-        else:
-            consecutive_empty_rows += 1
-        rows_scanned += 1
-        if consecutive_empty_rows >= resolved_limits.empty_row_run:
-            break
-
-        if rows_scanned < resolved_limits.min_rows_before_col_shrink:
-            continue
+        resolved_limits = scan_limits or _DEFAULT_TABLE_SCAN_LIMITS
+        scan_max_row = min(max_row, resolved_limits.max_rows)
+        scan_max_col = min(max_col, resolved_limits.max_cols)
+
+        # One contiguous grid per side; has_border is their union, derived
+        # once after the scan instead of being written cell by cell.
+        shape = (scan_max_row + 1, scan_max_col + 1)
+        top_edge = np.zeros(shape, dtype=bool)
+        bottom_edge = np.zeros(shape, dtype=bool)
+        left_edge = np.zeros(shape, dtype=bool)
+        right_edge = np.zeros(shape, dtype=bool)
+        col_has_border = np.zeros(shape[1], dtype=bool)
+
+        def edge_has_style(edge: object) -> bool:
+            """Return True when a border edge has a usable style."""
+            if edge is None:
+                return False
+            style = getattr(edge, "style", None)
+            return style is not None and style != "none"
+
+        # Read-only cells share the workbook's Border objects by style index,
+        # so each distinct border is classified once per scan. The cache keeps
+        # a reference to each Border so its id() cannot be reused mid-scan.
+        side_cache: dict[int, tuple[object, tuple[bool, bool, bool, bool]]] = {}
+
+        def border_sides(border: object) -> tuple[bool, bool, bool, bool]:
+            """Return (top, bottom, left, right) style flags for a Border."""
+            cached = side_cache.get(id(border))
+            if cached is not None:
+                return cached[1]
+            b = cast(Any, border)
+            sides = (
+                edge_has_style(b.top),
+                edge_has_style(b.bottom),
+                edge_has_style(b.left),
+                edge_has_style(b.right),
+            )
+            side_cache[id(border)] = (border, sides)
+            return sides
+
+        consecutive_empty_rows = 0
+        current_max_col = scan_max_col
+        rows_scanned = 0
+
+        rows = ws.iter_rows(
+            min_row=min_row,
+            max_row=scan_max_row,
+            min_col=min_col,
+            max_col=scan_max_col,
+        )
+        for r, row in enumerate(rows, start=min_row):
+            row_has_border = False
+            for c, cell in enumerate(
+                row[: current_max_col - min_col + 1], start=min_col
+            ):
+                b = getattr(cell, "border", None)
+                if b is None:
+                    continue
 
-        trailing_empty_cols = 0
-        for c in range(current_max_col, min_col - 1, -1):
-            if col_has_border[c]:
-                break
-            trailing_empty_cols += 1
-            if trailing_empty_cols >= resolved_limits.empty_col_run:
-                new_max_col = max(min_col, current_max_col - trailing_empty_cols)
-                if new_max_col < current_max_col:
-                    current_max_col = new_max_col
+                t, btm, left_border, rgt = border_sides(b)
+                if t or btm or left_border or rgt:
+                    row_has_border = True
+                    col_has_border[c] = True
+                    if t:
+                        top_edge[r, c] = True
+                    if btm:
+                        bottom_edge[r, c] = True
+                    if left_border:
+                        left_edge[r, c] = True
+                    if rgt:
+                        right_edge[r, c] = True
+
+            if row_has_border:
+                consecutive_empty_rows = 0
+            else:
+                consecutive_empty_rows += 1
+            rows_scanned += 1
+            if consecutive_empty_rows >= resolved_limits.empty_row_run:
                 break
 
+            if rows_scanned < resolved_limits.min_rows_before_col_shrink:
+                continue
+
+            trailing_empty_cols = 0
+            for c in range(current_max_col, min_col - 1, -1):
+                if col_has_border[c]:
+                    break
+                trailing_empty_cols += 1
+                if trailing_empty_cols >= resolved_limits.empty_col_run:
+                    new_max_col = max(min_col, current_max_col - trailing_empty_cols)
+                    if new_max_col < current_max_col:
+                        current_max_col = new_max_col
+                    break
+
+    has_border = top_edge | bottom_edge | left_edge | right_edge
     return (
         has_border,
         top_edge,
@@ -1065,23 +1651,30 @@ def _detect_border_clusters_numpy(
     Returns:
         List of bounding boxes (r1, c1, r2, c2).
     """
-    from scipy.ndimage import label
+    from scipy.ndimage import find_objects, label
 
     structure = np.array([[0, 1, 0], [1, 1, 1], [0, 1, 0]], dtype=np.uint8)
     lbl, num = label(has_border.astype(np.uint8), structure=structure)
+    # One pass each for sizes and bounding boxes, instead of a full-grid
+    # comparison per label.
+    sizes = np.bincount(lbl.ravel(), minlength=int(num) + 1)
     rects: list[tuple[int, int, int, int]] = []
-    for k in range(1, int(num) + 1):
-        ys, xs = np.where(lbl == k)
-        if int(len(ys)) < min_size:
+    for k, bbox in enumerate(find_objects(lbl), start=1):
+        if bbox is None or int(sizes[k]) < min_size:
             continue
-        rects.append((int(ys.min()), int(xs.min()), int(ys.max()), int(xs.max())))
+        rows, cols = bbox
+        rects.append((rows.start, cols.start, rows.stop - 1, cols.stop - 1))
     return rects
 
 
 def _detect_border_clusters_python(
     has_border: np.ndarray, min_size: int
 ) -> list[tuple[int, int, int, int]]:
-    """Detect border clusters with a pure-Python BFS.
+    """Detect border clusters with a pure-Python flood fill.
+
+    The grid is flattened to bytes and cells are addressed by ``r * w + c``,
+    so the fill touches a ``bytearray`` and an ``array`` stack instead of
+    NumPy scalars and tuple queues.
 
     Args:
         has_border: Boolean border grid.
@@ -1091,35 +1684,64 @@ def _detect_border_clusters_python(
         List of bounding boxes (r1, c1, r2, c2).
     """
     h, w = has_border.shape
-    visited = np.zeros_like(has_border, dtype=bool)
+    grid = has_border.astype(bool).tobytes()
+    visited = bytearray(h * w)
     rects: list[tuple[int, int, int, int]] = []
-    for r in range(h):
-        for c in range(w):
-            if not has_border[r, c] or visited[r, c]:
-                continue
-            q = deque([(r, c)])
-            visited[r, c] = True
-            ys = [r]
-            xs = [c]
-            while q:
-                yy, xx = q.popleft()
-                for dy, dx in ((1, 0), (-1, 0), (0, 1), (0, -1)):
-                    ny, nx = yy + dy, xx + dx
-                    if (
-                        0 <= ny < h
-                        and 0 <= nx < w
-                        and has_border[ny, nx]
-                        and not visited[ny, nx]
-                    ):
-                        visited[ny, nx] = True
-                        q.append((ny, nx))
-                        ys.append(ny)
-                        xs.append(nx)
-            if len(ys) >= min_size:
-                rects.append((min(ys), min(xs), max(ys), max(xs)))
+    for start in range(h * w):
+        if not grid[start] or visited[start]:
+            continue
+        size, rect = _flood_fill_flat(grid, visited, start, h, w)
+        if size >= min_size:
+            rects.append(rect)
     return rects
 
 
+def _flood_fill_flat(
+    grid: bytes, visited: bytearray, start: int, h: int, w: int
+) -> tuple[int, tuple[int, int, int, int]]:
+    """Mark the 4-connected region containing ``start`` and measure it.
+
+    Args:
+        grid: Row-major cell flags of an ``h`` x ``w`` grid.
+        visited: Row-major visited flags, updated in place.
+        start: Flat index of the region's first cell in raster order.
+        h: Grid height.
+        w: Grid width.
+
+    Returns:
+        Tuple of (cell count, (r1, c1, r2, c2) bounding box).
+    """
+    visited[start] = 1
+    stack = array("l", (start,))
+    # Raster order reaches each region at its topmost cell first.
+    top, left = divmod(start, w)
+    bottom, right = top, left
+    size = 0
+    while stack:
+        idx = stack.pop()
+        size += 1
+        r, c = divmod(idx, w)
+        if r > bottom:
+            bottom = r
+        if c < left:
+            left = c
+        elif c > right:
+            right = c
+        if r + 1 < h and grid[idx + w] and not visited[idx + w]:
+            visited[idx + w] = 1
+            stack.append(idx + w)
+        if r > 0 and grid[idx - w] and not visited[idx - w]:
+            visited[idx - w] = 1
+            stack.append(idx - w)
+        if c + 1 < w and grid[idx + 1] and not visited[idx + 1]:
+            visited[idx + 1] = 1
+            stack.append(idx + 1)
+        if c > 0 and grid[idx - 1] and not visited[idx - 1]:
+            visited[idx - 1] = 1
+            stack.append(idx - 1)
+    return size, (top, left, bottom, right)
+
+
 def _resolve_border_cluster_backend() -> Literal["auto", "python", "numpy"]:
     """Resolve the border clustering backend from environment."""
     value = os.getenv(_BORDER_CLUSTER_BACKEND_ENV, "").strip().lower()
@@ -1206,6 +1828,43 @@ def _ensure_matrix(matrix: MatrixInput) -> list[list[object]]:
     return [list(rows_seq)]
 
 
+def _nonempty_mask(matrix: Sequence[Sequence[object]]) -> np.ndarray:
+    """Return a boolean grid marking non-empty cells of a 2D matrix.
+
+    Ragged rows are padded with False up to the widest row. The table
+    heuristics below derive everything from this grid, so each cell value is
+    stringified and stripped once per candidate instead of once per metric.
+    """
+    rows = len(matrix)
+    cols = max((len(r) for r in matrix), default=0)
+    mask = np.zeros((rows, cols), dtype=bool)
+    for i, row in enumerate(matrix):
+        for j, v in enumerate(row):
+            if not (v is None or str(v).strip() == ""):
+                mask[i, j] = True
+    return mask
+
+
+def _density_metrics_from_mask(mask: np.ndarray, total: int) -> tuple[float, float]:
+    """Return (density, coverage) of a non-empty mask over ``total`` cells."""
+    if total <= 0:
+        return 0.0, 0.0
+    ys, xs = np.nonzero(mask)
+    if ys.size == 0:
+        return 0.0, 0.0
+    density = ys.size / total
+    bbox_h = int(ys.max() - ys.min()) + 1
+    bbox_w = int(xs.max() - xs.min()) + 1
+    return density, (bbox_h * bbox_w) / total
+
+
+def _has_table_structure(mask: np.ndarray) -> bool:
+    """Return True when at least 2 rows and 2 columns hold 2+ non-empty cells."""
+    rows_with_two = int(np.count_nonzero(mask.sum(axis=1) >= 2))
+    cols_with_two = int(np.count_nonzero(mask.sum(axis=0) >= 2))
+    return rows_with_two >= 2 and cols_with_two >= 2
+
+
 def _table_density_metrics(matrix: MatrixInput) -> tuple[float, float]:
     """
     Given a 2D matrix (list of rows), return (density, coverage).
@@ -1213,32 +1872,11 @@ def _table_density_metrics(matrix: MatrixInput) -> tuple[float, float]:
     coverage: area of tight bounding box of nonempty cells divided by total area.
     """
     normalized = _ensure_matrix(matrix)
-    if not normalized:
-        return 0.0, 0.0
-    rows = len(normalized)
-    cols = len(normalized[0]) if rows else 0
-    if rows == 0 or cols == 0:
+    if not normalized or not normalized[0]:
         return 0.0, 0.0
-
-    nonempty_coords = []
-    for i, row in enumerate(normalized):
-        for j, v in enumerate(row):
-            if not (v is None or str(v).strip() == ""):
-                nonempty_coords.append((i, j))
-
-    total = rows * cols
-    if not nonempty_coords:
-        return 0.0, 0.0
-
-    nonempty = len(nonempty_coords)
-    density = nonempty / total
-
-    ys = [p[0] for p in nonempty_coords]
-    xs = [p[1] for p in nonempty_coords]
-    bbox_h = max(ys) - min(ys) + 1
-    bbox_w = max(xs) - min(xs) + 1
-    coverage = (bbox_h * bbox_w) / total if total > 0 else 0.0
-    return density, coverage
+    return _density_metrics_from_mask(
+        _nonempty_mask(normalized), len(normalized) * len(normalized[0])
+    )
 
 
 def _is_plausible_table(matrix: MatrixInput) -> bool:
@@ -1250,28 +1888,15 @@ def _is_plausible_table(matrix: MatrixInput) -> bool:
     normalized = _ensure_matrix(matrix)
     if not normalized:
         return False
+    return _is_plausible_mask(_nonempty_mask(normalized))
 
-    rows = len(normalized)
-    cols = (
-        max((len(r) if isinstance(r, list) else 1) for r in normalized) if rows else 0
-    )
+
+def _is_plausible_mask(mask: np.ndarray) -> bool:
+    """Apply the ``_is_plausible_table`` heuristic to a non-empty mask."""
+    rows, cols = mask.shape
     if rows < 2 or cols < 2:
         return False
-
-    row_counts: list[int] = []
-    col_counts = [0] * cols
-    for r in normalized:
-        cnt = 0
-        for j in range(cols):
-            v = r[j] if j < len(r) else None
-            if not (v is None or str(v).strip() == ""):
-                cnt += 1
-                col_counts[j] += 1
-        row_counts.append(cnt)
-
-    rows_with_two = sum(1 for c in row_counts if c >= 2)
-    cols_with_two = sum(1 for c in col_counts if c >= 2)
-    return rows_with_two >= 2 and cols_with_two >= 2
+    return _has_table_structure(mask)
 
 
 def _nonempty_clusters(
@@ -1280,44 +1905,21 @@ def _nonempty_clusters(
     """Return bounding boxes of connected components of nonempty cells (4-neighbor)."""
     if not matrix:
         return []
-    rows = len(matrix)
-    cols = max(len(r) for r in matrix) if rows else 0
-    grid = [[False] * cols for _ in range(rows)]
-    for i, row in enumerate(matrix):
-        for j in range(cols):
-            v = row[j] if j < len(row) else None
-            if not (v is None or str(v).strip() == ""):
-                grid[i][j] = True
-    visited = [[False] * cols for _ in range(rows)]
-    boxes: list[tuple[int, int, int, int]] = []
-
-    def bfs(sr: int, sc: int) -> tuple[int, int, int, int]:
-        """Return bounding box of a connected component starting at (sr, sc)."""
-        q = deque([(sr, sc)])
-        visited[sr][sc] = True
-        ys = [sr]
-        xs = [sc]
-        while q:
-            r, c = q.popleft()
-            for dr, dc in ((1, 0), (-1, 0), (0, 1), (0, -1)):
-                nr, nc = r + dr, c + dc
-                if (
-                    0 <= nr < rows
-                    and 0 <= nc < cols
-                    and grid[nr][nc]
-                    and not visited[nr][nc]
-                ):
-                    visited[nr][nc] = True
-                    q.append((nr, nc))
-                    ys.append(nr)
-                    xs.append(nc)
-        return min(ys), min(xs), max(ys), max(xs)
-
-    for i in range(rows):
-        for j in range(cols):
-            if grid[i][j] and not visited[i][j]:
-                boxes.append(bfs(i, j))
-    return boxes
+    return _nonempty_clusters_from_mask(_nonempty_mask(matrix))
+
+
+def _nonempty_clusters_from_mask(
+    mask: np.ndarray,
+) -> list[tuple[int, int, int, int]]:
+    """Return bounding boxes of 4-connected True regions of a non-empty mask.
+
+    Labeling is shared with the border clustering, so large value blocks are
+    flood-filled by scipy instead of a Python BFS. Boxes come back in raster
+    order of each region's first cell.
+    """
+    if not mask.any():
+        return []
+    return detect_border_clusters(mask, min_size=1)
 
 
 def _normalize_matrix(matrix: object) -> list[list[object]]:
@@ -1333,44 +1935,37 @@ def _normalize_matrix(matrix: object) -> list[list[object]]:
 
 def _header_like_row(row: list[object]) -> bool:
     """Return True if a row looks like a header row."""
-    nonempty = [v for v in row if not (v is None or str(v).strip() == "")]
-    if len(nonempty) < 2:
-        return False
     str_like = 0
     num_like = 0
-    for v in nonempty:
+    for v in row:
+        if v is None:
+            continue
         s = str(v)
-        if _INT_RE.match(s) or _FLOAT_RE.match(s):
+        if not s.strip():
+            continue
+        if _may_be_numeric(s) and (_INT_RE.match(s) or _FLOAT_RE.match(s)):
             num_like += 1
         else:
             str_like += 1
+    if str_like + num_like < 2:
+        return False
     return str_like >= num_like and str_like >= 1
 
 
 def _table_signal_score(matrix: Sequence[Sequence[object]]) -> float:
     """Compute a heuristic table-likeliness score for a matrix."""
     normalized = _ensure_matrix(matrix)
-    density, coverage = _table_density_metrics(normalized)
-    header = any(_header_like_row(r) for r in normalized[:2])  # check first 2 rows
+    return _table_signal_score_from_mask(normalized, _nonempty_mask(normalized))
 
-    rows = len(normalized)
-    cols = (
-        max((len(r) if isinstance(r, list) else 1) for r in normalized) if rows else 0
-    )
-    row_counts: list[int] = []
-    col_counts = [0] * cols if cols else []
-    for r in normalized:
-        cnt = 0
-        for j in range(cols):
-            v = r[j] if j < len(r) else None
-            if not (v is None or str(v).strip() == ""):
-                cnt += 1
-                if j < len(col_counts):
-                    col_counts[j] += 1
-        row_counts.append(cnt)
-    rows_with_two = sum(1 for c in row_counts if c >= 2)
-    cols_with_two = sum(1 for c in col_counts if c >= 2)
-    structure_score = 0.1 if (rows_with_two >= 2 and cols_with_two >= 2) else 0.0
+
+def _table_signal_score_from_mask(
+    normalized: list[list[object]], mask: np.ndarray
+) -> float:
+    """Compute ``_table_signal_score`` reusing a precomputed non-empty mask."""
+    first_width = len(normalized[0]) if normalized else 0
+    density, coverage = _density_metrics_from_mask(mask, len(normalized) * first_width)
+    header = any(_header_like_row(r) for r in normalized[:2])  # check first 2 rows
+    structure_score = 0.1 if _has_table_structure(mask) else 0.0
 
     score = density
     if header:
@@ -1736,23 +2331,24 @@ def _collect_table_candidates_from_values(
         List of detected table candidate range strings.
     """
     normalized = [list(row) for row in values]
-    nonempty = _count_nonempty_cells(normalized)
-    if nonempty < _DETECTION_CONFIG["min_nonempty_cells"]:
+    mask = _nonempty_mask(normalized)
+    if int(np.count_nonzero(mask)) < _DETECTION_CONFIG["min_nonempty_cells"]:
         return []
 
     results: list[str] = []
-    clusters = _nonempty_clusters(normalized)
+    clusters = _nonempty_clusters_from_mask(mask)
     for r0, c0, r1, c1 in clusters:
         sub = [row[c0 : c1 + 1] for row in normalized[r0 : r1 + 1]]
-        density, coverage = _table_density_metrics(sub)
+        sub_mask = mask[r0 : r1 + 1, c0 : c1 + 1]
+        density, coverage = _density_metrics_from_mask(sub_mask, len(sub) * len(sub[0]))
         if (
             density < _DETECTION_CONFIG["density_min"]
             and coverage < _DETECTION_CONFIG["coverage_min"]
         ):
             continue
-        if not _is_plausible_table(sub):
+        if not _is_plausible_mask(sub_mask):
             continue
-        score = _table_signal_score(sub)
+        score = _table_signal_score_from_mask(sub, sub_mask)
         if score < _DETECTION_CONFIG["table_score_threshold"]:
             continue
         addr = (
@@ -1772,9 +2368,7 @@ def _count_nonempty_cells(values: Sequence[Sequence[object]]) -> int:
     Returns:
         Number of non-empty cells.
     """
-    return sum(
-        1 for row in values for v in row if not (v is None or str(v).strip() == "")
-    )
+    return int(np.count_nonzero(_nonempty_mask(values)))
 
 
 def _extract_openpyxl_table_refs(ws: Worksheet) -> list[str]:
@@ -1848,10 +2442,15 @@ def detect_tables_openpyxl(
     *,
     mode: ExtractionMode = "standard",
     scan_limits: TableScanLimits | None = None,
+    workbook: Workbook | None = None,
 ) -> list[str]:
-    """Detect table-like ranges via openpyxl tables and border clusters."""
+    """Detect table-like ranges via openpyxl tables and border clusters.
+
+    Pass an already-loaded ``workbook`` (data_only, not read-only) to avoid
+    re-parsing the file once per sheet; it is left open for the caller.
+    """
     resolved_limits = _resolve_table_scan_limits(mode, scan_limits)
-    with openpyxl_workbook(xlsx_path, data_only=True, read_only=False) as wb:
+    with _openpyxl_workbook_or_borrowed(xlsx_path, workbook, data_only=True) as wb:
         ws = wb[sheet_name]
         tables = _extract_openpyxl_table_refs(ws)
 
@@ -1945,6 +2544,18 @@ def detect_tables(sheet: xw.Sheet, *, mode: ExtractionMode = "standard") -> list
 
 _INT_RE = re.compile(r"^[+-]?\d+$")
 _FLOAT_RE = re.compile(r"^[+-]?\d*\.\d+$")
+_SIGN_CHARS = frozenset("+-")
+
+
+def _may_be_numeric(text: str) -> bool:
+    """Return False for text that cannot match ``_INT_RE`` or ``_FLOAT_RE``.
+
+    Most cell text is not numeric; a numeric string must start (after an
+    optional sign) with a digit or '.', so this rejects the rest before the
+    regexes run.
+    """
+    head = text[1:2] if text[:1] in _SIGN_CHARS else text[:1]
+    return head == "." or head.isdigit()
 
 
 def _coerce_numeric_preserve_format(val: str) -> int | float | str:
@@ -1952,6 +2563,8 @@ def _coerce_numeric_preserve_format(val: str) -> int | float | str:
     Convert numeric-looking strings to int/float while keeping precision.
     Integers stay int; decimals keep scale via Decimal before casting to float.
     """
+    if not _may_be_numeric(val):
+        return val
     if _INT_RE.match(val):
         try:
             return int(val)
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+import re
 from typing import Literal
 
 import xlwings as xw
@@ -13,122 +14,86 @@ from ..models.maps import XL_CHART_TYPE_MAP
 logger = logging.getLogger(__name__)
 
 
-def _extract_series_args_text(formula: str) -> str | None:  # noqa: C901
+# Tokens that matter to the SERIES scanners: a quoted string (doubled quotes
+# escape; an unterminated one runs to the end) or a single delimiter. The
+# string branch is an unrolled loop, so it never backtracks. Text between
+# tokens is skipped by the regex engine rather than walked per character.
+_SERIES_TOKEN_RE = re.compile(r'"[^"]*(?:""[^"]*)*"?|[(){},;]')
+
+# One anchored match for the common flat form: up to five comma-separated
+# arguments that are plain references or quoted strings, with no brackets and
+# no ';' anywhere (so ',' is unambiguously the separator). Anything else, such
+# as unions, array constants or ';'-separated locales, goes to the scanners.
+_FLAT_SERIES_ARG = r'(\s*"[^";]*(?:""[^";]*)*"\s*|[^"(){},;]*)'
+_FLAT_SERIES_RE = re.compile(
+    r"(?ai:=SERIES)\("
+    + _FLAT_SERIES_ARG
+    + (r"(?:," + _FLAT_SERIES_ARG) * 4
+    + r")?" * 4
+    + r"\)"
+)
+
+
+def _has_series_prefix(s: str) -> bool:
+    """Return True if ``s`` starts with "=SERIES", ignoring case.
+
+    Only the first seven characters are upper-cased. Upper-casing never
+    shortens a character, so this agrees with ``s.upper().startswith(...)``
+    without copying the whole formula.
+    """
+    return s[:7].upper().startswith("=SERIES")
+
+
+def _extract_series_args_text(formula: str) -> str | None:
     """Extract the outer argument text from '=SERIES(...)'; return None if unmatched."""
     if not formula:
         return None
     s = formula.strip()
-    if not s.upper().startswith("=SERIES"):
+    if not _has_series_prefix(s):
         return None
     try:
-        open_idx = s.index("(", s.upper().index("=SERIES"))
+        open_idx = s.index("(")
     except ValueError:
         return None
+    start = open_idx + 1
     depth_paren = 0
-    depth_brace = 0
-    in_str = False
-    i = open_idx + 1
-    start = i
-    while i < len(s):
-        ch = s[i]
-        if in_str:
-            if ch == '"':
-                if i + 1 < len(s) and s[i + 1] == '"':
-                    i += 2
-                    continue
-                else:
-                    in_str = False
-                    i += 1
-                    continue
-            else:
-                i += 1
-                continue
-        else:
-            if ch == '"':
-                in_str = True
-                i += 1
-                continue
-            elif ch == "(":
-                depth_paren += 1
-            elif ch == ")":
-                if depth_paren == 0:
-                    return s[start:i].strip()
-                depth_paren -= 1
-            elif ch == "{":
-                depth_brace += 1
-            elif ch == "}":
-                if depth_brace > 0:
-                    depth_brace -= 1
-            i += 1
+    for match in _SERIES_TOKEN_RE.finditer(s, start):
+        token = match.group()
+        if token == "(":
+            depth_paren += 1
+        elif token == ")":
+            if depth_paren == 0:
+                return s[start : match.start()].strip()
+            depth_paren -= 1
     return None
 
 
-def _split_top_level_args(args_text: str) -> list[str]:  # noqa: C901
+def _split_top_level_args(args_text: str) -> list[str]:
     """Split SERIES arguments at top-level separators (',' or ';')."""
     if args_text is None:
         return []
     use_semicolon = (";" in args_text) and ("," not in args_text.split('"')[0])
-    sep_chars = (";",) if use_semicolon else (",",)
+    sep = ";" if use_semicolon else ","
     args: list[str] = []
-    buf: list[str] = []
+    pos = 0
     depth_paren = 0
     depth_brace = 0
-    in_str = False
-    i = 0
-    while i < len(args_text):
-        ch = args_text[i]
-        if in_str:
-            if ch == '"':
-                if i + 1 < len(args_text) and args_text[i + 1] == '"':
-                    buf.append('""')
-                    i += 2
-                    continue
-                else:
-                    in_str = False
-                    buf.append('"')
-                    i += 1
-                    continue
-            else:
-                buf.append(ch)
-                i += 1
-                continue
-        else:
-            if ch == '"':
-                in_str = True
-                buf.append('"')
-                i += 1
-                continue
-            elif ch == "(":
-                depth_paren += 1
-                buf.append(ch)
-                i += 1
-                continue
-            elif ch == ")":
-                depth_paren = max(0, depth_paren - 1)
-                buf.append(ch)
-                i += 1
-                continue
-            elif ch == "{":
-                depth_brace += 1
-                buf.append(ch)
-                i += 1
-                continue
-            elif ch == "}":
-                depth_brace = max(0, depth_brace - 1)
-                buf.append(ch)
-                i += 1
-                continue
-            elif (ch in sep_chars) and depth_paren == 0 and depth_brace == 0:
-                args.append("".join(buf).strip())
-                buf = []
-                i += 1
-                continue
-            else:
-                buf.append(ch)
-                i += 1
-                continue
-    if buf or (args and args_text.endswith(sep_chars)):
-        args.append("".join(buf).strip())
+    for match in _SERIES_TOKEN_RE.finditer(args_text):
+        token = match.group()
+        if token == "(":
+            depth_paren += 1
+        elif token == ")":
+            depth_paren = max(0, depth_paren - 1)
+        elif token == "{":
+            depth_brace += 1
+        elif token == "}":
+            depth_brace = max(0, depth_brace - 1)
+        elif token == sep and depth_paren == 0 and depth_brace == 0:
+            args.append(args_text[pos : match.start()].strip())
+            pos = match.end()
+    tail = args_text[pos:]
+    if tail or (args and args_text.endswith(sep)):
+        args.append(tail.strip())
     return args
 
 
@@ -143,21 +108,29 @@ def _unquote_excel_string(s: str | None) -> str | None:
     return None
 
 
+def _match_flat_series(formula: str) -> tuple[str | None, ...] | None:
+    """Return the five SERIES slots of a flat formula, or None if not flat."""
+    match = _FLAT_SERIES_RE.fullmatch(formula.strip()) if formula else None
+    if match is None:
+        return None
+    return tuple((arg.strip() or None) if arg else None for arg in match.groups())
+
+
 def parse_series_formula(formula: str) -> dict[str, str | None] | None:
     """Parse =SERIES into a dict of references; return None on failure."""
-    args_text = _extract_series_args_text(formula)
-    if args_text is None:
+    # Most formulas are not SERIES at all; reject them before any regex work.
+    if not formula or not _has_series_prefix(formula.lstrip()):
         return None
-    parts = _split_top_level_args(args_text)
-    name_part = parts[0].strip() if len(parts) >= 1 and parts[0].strip() != "" else None
-    x_part = parts[1].strip() if len(parts) >= 2 and parts[1].strip() != "" else None
-    y_part = parts[2].strip() if len(parts) >= 3 and parts[2].strip() != "" else None
-    plot_order_part = (
-        parts[3].strip() if len(parts) >= 4 and parts[3].strip() != "" else None
-    )
-    bubble_part = (
-        parts[4].strip() if len(parts) >= 5 and parts[4].strip() != "" else None
-    )
+    slots = _match_flat_series(formula)
+    if slots is None:
+        args_text = _extract_series_args_text(formula)
+        if args_text is None:
+            return None
+        # Arguments come back stripped; pad to the five SERIES slots and map
+        # empty ones to None in a single pass.
+        parts = _split_top_level_args(args_text)
+        slots = tuple((parts[i] or None) if i < len(parts) else None for i in range(5))
+    name_part, x_part, y_part, plot_order_part, bubble_part = slots
     name_literal = _unquote_excel_string(name_part)
     name_range = None if name_literal is not None else name_part
     return {
@@ -176,7 +149,11 @@ def get_charts(
 ) -> list[Chart]:
     """Parse charts in a sheet into Chart models; failed charts carry an error field."""
     charts: list[Chart] = []
+    # Every property read below is a cross-process COM call, so the sheet
+    # dispatch and each chart's name are fetched once and reused.
+    sheet_api = sheet.api
     for ch in sheet.charts:
+        chart_name = ch.name
         series_list: list[ChartSeries] = []
         y_axis_title: str = ""
         y_axis_range: list[int] = []
@@ -186,7 +163,7 @@ def get_charts(
         chart_height: int | None = None
 
         try:
-            chart_com = sheet.api.ChartObjects(ch.name).Chart
+            chart_com = sheet_api.ChartObjects(chart_name).Chart
             chart_type_num = chart_com.ChartType
             chart_type_label = XL_CHART_TYPE_MAP.get(
                 chart_type_num, f"unknown_{chart_type_num}"
@@ -230,7 +207,7 @@ def get_charts(
 
         charts.append(
             Chart(
-                name=ch.name,
+                name=chart_name,
                 chart_type=chart_type_label,
                 title=title,
                 y_axis_title=y_axis_title,
@@ -42,7 +42,7 @@ class LibreOfficeUnavailableError(RuntimeError):
     """Raised when the LibreOffice runtime is not available."""
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class LibreOfficeChartGeometry:
     """Best-effort chart geometry captured from LibreOffice draw pages."""
 
@@ -54,7 +54,7 @@ class LibreOfficeChartGeometry:
     height: int | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class LibreOfficeDrawPageShape:
     """Best-effort shape snapshot captured from a LibreOffice draw page."""
 
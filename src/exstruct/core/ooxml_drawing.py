@@ -10,13 +10,16 @@ from zipfile import ZipFile
 from defusedxml import ElementTree
 
 from ..models import ChartSeries
+from .ooxml_package import (
+    OoxmlRelationship,
+    iter_sheet_xml_paths,
+    read_relationships,
+)
 
 _NS = {
     "a": "http://schemas.openxmlformats.org/drawingml/2006/main",
     "c": "http://schemas.openxmlformats.org/drawingml/2006/chart",
     "r": "http://schemas.openxmlformats.org/officeDocument/2006/relationships",
-    "rel": "http://schemas.openxmlformats.org/package/2006/relationships",
-    "spreadsheetml": "http://schemas.openxmlformats.org/spreadsheetml/2006/main",
     "xdr": "http://schemas.openxmlformats.org/drawingml/2006/spreadsheetDrawing",
 }
 _EMU_PER_POINT = 12700.0
@@ -42,9 +45,6 @@ _SHAPE_TYPE_MAP = {
     "rect": "Rectangle",
     "straightConnector1": "StraightConnector1",
 }
-_WORKSHEET_REL_TYPE = (
-    "http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet"
-)
 _DRAWING_REL_TYPE = (
     "http://schemas.openxmlformats.org/officeDocument/2006/relationships/drawing"
 )
@@ -53,7 +53,7 @@ _CHART_REL_TYPE = (
 )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DrawingShapeRef:
     """Geometric and identity metadata for a drawing object anchor."""
 
@@ -66,7 +66,7 @@ class DrawingShapeRef:
     height: int | None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DrawingConnectorRef:
     """Connection metadata linking a connector to drawing ids."""
 
@@ -75,15 +75,7 @@ class DrawingConnectorRef:
     end_drawing_id: int | None
 
 
-@dataclass(frozen=True)
-class OoxmlRelationship:
-    """Relationship metadata extracted from an OOXML ``.rels`` part."""
-
-    target: str
-    relationship_type: str
-
-
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class OoxmlChartInfo:
     """Chart metadata extracted from OOXML chart and drawing parts."""
 
@@ -99,7 +91,7 @@ class OoxmlChartInfo:
     anchor_height: int | None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class OoxmlShapeInfo:
     """Shape metadata extracted from OOXML drawing anchors."""
 
@@ -113,7 +105,7 @@ class OoxmlShapeInfo:
     end_arrow_style: int | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class OoxmlConnectorInfo:
     """Connector metadata extracted from OOXML drawing anchors."""
 
@@ -140,7 +132,7 @@ def read_sheet_drawings(file_path: Path) -> dict[str, SheetDrawingData]:
     """Read worksheet drawing metadata directly from OOXML parts."""
     result: dict[str, SheetDrawingData] = {}
     with ZipFile(file_path) as archive:
-        for sheet_name, sheet_xml_path in _iter_sheet_xml_paths(archive):
+        for sheet_name, sheet_xml_path in iter_sheet_xml_paths(archive):
             drawing_path = _resolve_sheet_drawing_path(archive, sheet_xml_path)
             if drawing_path is None:
                 continue
@@ -148,32 +140,13 @@ def read_sheet_drawings(file_path: Path) -> dict[str, SheetDrawingData]:
     return result
 
 
-def _iter_sheet_xml_paths(archive: ZipFile) -> list[tuple[str, str]]:
-    """Return workbook sheet names paired with their OOXML worksheet paths."""
-
-    workbook_xml = archive.read("xl/workbook.xml")
-    workbook_root = ElementTree.fromstring(workbook_xml)
-    rel_map = _read_relationships(archive, "xl/_rels/workbook.xml.rels")
-    paths: list[tuple[str, str]] = []
-    for sheet in workbook_root.findall("spreadsheetml:sheets/spreadsheetml:sheet", _NS):
-        name = sheet.attrib.get("name")
-        rel_id = sheet.attrib.get(f"{{{_NS['r']}}}id")
-        if not name or not rel_id or rel_id not in rel_map:
-            continue
-        relationship = rel_map[rel_id]
-        if relationship.relationship_type != _WORKSHEET_REL_TYPE:
-            continue
-        paths.append((name, relationship.target))
-    return paths
-
-
 def _resolve_sheet_drawing_path(archive: ZipFile, sheet_xml_path: str) -> str | None:
     """Resolve the drawing part referenced by a worksheet, if any."""
 
     rels_path = _rels_path(sheet_xml_path)
     if rels_path not in archive.namelist():
         return None
-    rel_map = _read_relationships(archive, rels_path)
+    rel_map = read_relationships(archive, rels_path)
     for relationship in rel_map.values():
         if relationship.relationship_type != _DRAWING_REL_TYPE:
             continue
@@ -188,7 +161,7 @@ def _parse_sheet_drawing(archive: ZipFile, drawing_path: str) -> SheetDrawingDat
     rel_map = {}
     drawing_rels_path = _rels_path(drawing_path)
     if drawing_rels_path in archive.namelist():
-        rel_map = _read_relationships(archive, drawing_rels_path)
+        rel_map = read_relationships(archive, drawing_rels_path)
 
     shapes: list[OoxmlShapeInfo] = []
     connectors: list[OoxmlConnectorInfo] = []
@@ -639,37 +612,6 @@ def _marker_to_points(
     return (left, top)
 
 
-def _read_relationships(
-    archive: ZipFile, rels_path: str
-) -> dict[str, OoxmlRelationship]:
-    """Read a relationships part into a relationship-id keyed metadata map."""
-
-    root = ElementTree.fromstring(archive.read(rels_path))
-    base_path = _base_dir(_source_path_from_rels(rels_path))
-    rel_map: dict[str, OoxmlRelationship] = {}
-    for rel in root.findall("rel:Relationship", _NS):
-        rel_id = rel.attrib.get("Id")
-        target = rel.attrib.get("Target")
-        relationship_type = rel.attrib.get("Type")
-        if not rel_id or not target or not relationship_type:
-            continue
-        rel_map[rel_id] = OoxmlRelationship(
-            target=_normalize_zip_path(base_path, target),
-            relationship_type=relationship_type,
-        )
-    return rel_map
-
-
-def _source_path_from_rels(rels_path: str) -> str:
-    """Recover the source part path that owns a relationships part."""
-
-    rels = PurePosixPath(rels_path)
-    if rels.parent.name != "_rels":
-        return rels_path
-    stem = rels.name.removesuffix(".rels")
-    return str(rels.parent.parent / stem)
-
-
 def _rels_path(source_path: str) -> str:
     """Return the relationships part path for a source part."""
 
@@ -677,29 +619,6 @@ def _rels_path(source_path: str) -> str:
     return str(path.parent / "_rels" / f"{path.name}.rels")
 
 
-def _base_dir(path: str) -> str:
-    """Return the POSIX parent directory for a zip path."""
-
-    return str(PurePosixPath(path).parent)
-
-
-def _normalize_zip_path(base_dir: str, target: str) -> str:
-    """Normalize a relative OOXML zip target against a base directory."""
-
-    base = PurePosixPath(base_dir)
-    normalized = base.joinpath(PurePosixPath(target)).as_posix()
-    parts: list[str] = []
-    for part in normalized.split("/"):
-        if part in {"", "."}:
-            continue
-        if part == "..":
-            if parts:
-                parts.pop()
-            continue
-        parts.append(part)
-    return "/".join(parts)
-
-
 def _extract_text(node: ElementTree.Element | None) -> str:
     """Extract concatenated text from a drawing text body."""
 
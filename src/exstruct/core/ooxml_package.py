@@ -0,0 +1,99 @@
+"""OOXML package readers shared by the drawing and cell parsers."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from pathlib import PurePosixPath
+from zipfile import ZipFile
+
+from defusedxml import ElementTree
+
+_NS = {
+    "r": "http://schemas.openxmlformats.org/officeDocument/2006/relationships",
+    "rel": "http://schemas.openxmlformats.org/package/2006/relationships",
+    "spreadsheetml": "http://schemas.openxmlformats.org/spreadsheetml/2006/main",
+}
+_WORKSHEET_REL_TYPE = (
+    "http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet"
+)
+
+
+@dataclass(frozen=True, slots=True)
+class OoxmlRelationship:
+    """Relationship metadata extracted from an OOXML ``.rels`` part."""
+
+    target: str
+    relationship_type: str
+
+
+def iter_sheet_xml_paths(archive: ZipFile) -> list[tuple[str, str]]:
+    """Return workbook sheet names paired with their OOXML worksheet paths."""
+
+    workbook_xml = archive.read("xl/workbook.xml")
+    workbook_root = ElementTree.fromstring(workbook_xml)
+    rel_map = read_relationships(archive, "xl/_rels/workbook.xml.rels")
+    paths: list[tuple[str, str]] = []
+    for sheet in workbook_root.findall("spreadsheetml:sheets/spreadsheetml:sheet", _NS):
+        name = sheet.attrib.get("name")
+        rel_id = sheet.attrib.get(f"{{{_NS['r']}}}id")
+        if not name or not rel_id or rel_id not in rel_map:
+            continue
+        relationship = rel_map[rel_id]
+        if relationship.relationship_type != _WORKSHEET_REL_TYPE:
+            continue
+        paths.append((name, relationship.target))
+    return paths
+
+
+def read_relationships(
+    archive: ZipFile, rels_path: str
+) -> dict[str, OoxmlRelationship]:
+    """Read a relationships part into a relationship-id keyed metadata map."""
+
+    root = ElementTree.fromstring(archive.read(rels_path))
+    base_path = _base_dir(_source_path_from_rels(rels_path))
+    rel_map: dict[str, OoxmlRelationship] = {}
+    for rel in root.findall("rel:Relationship", _NS):
+        rel_id = rel.attrib.get("Id")
+        target = rel.attrib.get("Target")
+        relationship_type = rel.attrib.get("Type")
+        if not rel_id or not target or not relationship_type:
+            continue
+        rel_map[rel_id] = OoxmlRelationship(
+            target=_normalize_zip_path(base_path, target),
+            relationship_type=relationship_type,
+        )
+    return rel_map
+
+
+def _source_path_from_rels(rels_path: str) -> str:
+    """Recover the source part path that owns a relationships part."""
+
+    rels = PurePosixPath(rels_path)
+    if rels.parent.name != "_rels":
+        return rels_path
+    stem = rels.name.removesuffix(".rels")
+    return str(rels.parent.parent / stem)
+
+
+def _base_dir(path: str) -> str:
+    """Return the POSIX parent directory for a zip path."""
+
+    return str(PurePosixPath(path).parent)
+
+
+def _normalize_zip_path(base_dir: str, target: str) -> str:
+    """Normalize a relative OOXML zip target against a base directory."""
+
+    base = PurePosixPath(base_dir)
+    normalized = base.joinpath(PurePosixPath(target)).as_posix()
+    parts: list[str] = []
+    for part in normalized.split("/"):
+        if part in {"", "."}:
+            continue
+        if part == "..":
+            if parts:
+                parts.pop()
+            continue
+        parts.append(part)
+    return "/".join(parts)
@@ -28,6 +28,7 @@ from .backends.com_backend import ComBackend, ComRichBackend
 from .backends.libreoffice_backend import LibreOfficeRichBackend
 from .backends.openpyxl_backend import OpenpyxlBackend
 from .cells import (
+    _COL_KEYS,
     MergedCellRange,
     WorkbookColorsMap,
     WorkbookFormulasMap,
@@ -97,6 +98,9 @@ class ExtractionArtifacts:
         shape_data: Extracted shapes per sheet.
         chart_data: Extracted charts per sheet.
         merged_cell_data: Extracted merged cell ranges per sheet.
+        openpyxl_backend: Backend shared by the openpyxl-based steps so each
+            workbook load mode is parsed once per run; see
+            ``_shared_openpyxl_backend``.
     """
 
     cell_data: CellData = field(default_factory=dict)
@@ -107,6 +111,9 @@ class ExtractionArtifacts:
     shape_data: ShapeData = field(default_factory=dict)
     chart_data: ChartData = field(default_factory=dict)
     merged_cell_data: MergedCellData = field(default_factory=dict)
+    openpyxl_backend: OpenpyxlBackend | None = field(
+        default=None, repr=False, compare=False
+    )
 
 
 ExtractionStep = Callable[[ExtractionInputs, ExtractionArtifacts], None]
@@ -425,11 +432,9 @@ def build_pre_com_pipeline(inputs: ExtractionInputs) -> list[ExtractionStep]:
             ),
         ),
     }
-    steps: list[ExtractionStep] = []
-    for config in step_table[inputs.mode]:
-        if config.enabled(inputs):
-            steps.append(config.step)
-    return steps
+    return [
+        config.step for config in step_table[inputs.mode] if config.enabled(inputs)
+    ]
 
 
 def build_com_pipeline(inputs: ExtractionInputs) -> list[ComExtractionStep]:
@@ -476,11 +481,7 @@ def build_com_pipeline(inputs: ExtractionInputs) -> list[ComExtractionStep]:
             enabled=lambda _inputs: _inputs.include_colors_map,
         ),
     )
-    steps: list[ComExtractionStep] = []
-    for config in step_table:
-        if config.enabled(inputs):
-            steps.append(config.step)
-    return steps
+    return [config.step for config in step_table if config.enabled(inputs)]
 
 
 def run_pipeline(
@@ -561,6 +562,37 @@ def _run_timed_com_step(
     logger.info("COM step %s completed in %.2fs", step.__name__, elapsed)
 
 
+def _shared_openpyxl_backend(
+    inputs: ExtractionInputs, artifacts: ExtractionArtifacts
+) -> OpenpyxlBackend:
+    """Return the run's openpyxl backend, creating it on first use.
+
+    Steps share one backend so a workbook needed by several of them (e.g. the
+    styled workbook behind hyperlinks, colors, and table detection) is loaded
+    once; ``run_extraction_pipeline`` closes it when the run ends. A backend
+    left over for a different file is closed before it is replaced.
+
+    Keeping the fully materialized (styled) workbook resident costs memory
+    proportional to the sheet contents, so the COM path releases the cached
+    workbooks before opening Excel; a COM-phase fallback that still needs
+    openpyxl reloads the file on demand.
+
+    Args:
+        inputs: Pipeline inputs.
+        artifacts: Artifact container that holds the shared backend.
+
+    Returns:
+        OpenpyxlBackend bound to ``inputs.file_path``.
+    """
+    backend = artifacts.openpyxl_backend
+    if backend is None or backend.file_path != inputs.file_path:
+        if backend is not None:
+            backend.close()
+        backend = OpenpyxlBackend(inputs.file_path)
+        artifacts.openpyxl_backend = backend
+    return backend
+
+
 def step_extract_cells(
     inputs: ExtractionInputs, artifacts: ExtractionArtifacts
 ) -> None:
@@ -570,7 +602,7 @@ def step_extract_cells(
         inputs: Pipeline inputs.
         artifacts: Artifact container to update.
     """
-    backend = OpenpyxlBackend(inputs.file_path)
+    backend = _shared_openpyxl_backend(inputs, artifacts)
     artifacts.cell_data = backend.extract_cells(include_links=inputs.include_cell_links)
 
 
@@ -584,7 +616,7 @@ def step_extract_print_areas_openpyxl(
         inputs (ExtractionInputs): Pipeline inputs containing the file path and extraction options.
         artifacts (ExtractionArtifacts): Mutable artifact container; `artifacts.print_area_data` will be set to the extracted print area mapping.
     """
-    backend = OpenpyxlBackend(inputs.file_path)
+    backend = _shared_openpyxl_backend(inputs, artifacts)
     artifacts.print_area_data = backend.extract_print_areas()
 
 
@@ -600,7 +632,7 @@ def step_extract_formulas_map_openpyxl(
         inputs (ExtractionInputs): Resolved pipeline inputs (provides file_path).
         artifacts (ExtractionArtifacts): Mutable container to receive the extracted formulas map.
     """
-    backend = OpenpyxlBackend(inputs.file_path)
+    backend = _shared_openpyxl_backend(inputs, artifacts)
     try:
         artifacts.formulas_map_data = backend.extract_formulas_map()
     except Exception as exc:
@@ -619,7 +651,7 @@ def step_extract_colors_map_openpyxl(
     Sets artifacts.colors_map_data to the colors map extracted from inputs.file_path,
     respecting inputs.include_default_background and inputs.ignore_colors.
     """
-    backend = OpenpyxlBackend(inputs.file_path)
+    backend = _shared_openpyxl_backend(inputs, artifacts)
     artifacts.colors_map_data = backend.extract_colors_map(
         include_default_background=inputs.include_default_background,
         ignore_colors=inputs.ignore_colors,
@@ -635,7 +667,7 @@ def step_extract_merged_cells_openpyxl(
         inputs: Pipeline inputs.
         artifacts: Artifact container to update.
     """
-    backend = OpenpyxlBackend(inputs.file_path)
+    backend = _shared_openpyxl_backend(inputs, artifacts)
     artifacts.merged_cell_data = backend.extract_merged_cells()
 
 
@@ -736,8 +768,8 @@ def step_extract_colors_map_com(
         artifacts.colors_map_data = com_result
         return
     if artifacts.colors_map_data is None:
-        artifacts.colors_map_data = OpenpyxlBackend(
-            inputs.file_path
+        artifacts.colors_map_data = _shared_openpyxl_backend(
+            inputs, artifacts
         ).extract_colors_map(
             include_default_background=inputs.include_default_background,
             ignore_colors=inputs.ignore_colors,
@@ -786,6 +818,18 @@ def _resolve_sheet_formulas_map(
     return sheet_formulas.formulas_map
 
 
+def _row_untouched_by_merges(row: CellRow, excluded: frozenset[str]) -> bool:
+    """Return True if filtering would rebuild ``row`` unchanged.
+
+    That holds when no value sits in an excluded column and every link still
+    has a value next to it, so the row can be reused instead of validating a
+    new ``CellRow``.
+    """
+    if not row.c or not excluded.isdisjoint(row.c):
+        return False
+    return row.links is None or bool(row.links and row.links.keys() <= row.c.keys())
+
+
 def _filter_rows_excluding_merged_values(
     rows: list[CellRow],
     merged_cells: list[MergedCellRange],
@@ -808,20 +852,27 @@ def _filter_rows_excluding_merged_values(
     intervals_by_row = _build_merged_row_intervals(merged_cells)
     if not intervals_by_row:
         return rows
+    # Rows spanned by the same merged ranges share one set of excluded column
+    # keys, so each cell is filtered by a single membership test.
+    excluded_by_intervals: dict[tuple[tuple[int, int], ...], frozenset[str]] = {}
     filtered_rows: list[CellRow] = []
     for row in rows:
         intervals = intervals_by_row.get(row.r)
         if not intervals:
             filtered_rows.append(row)
             continue
-        filtered_cells: dict[str, int | float | str] = {}
-        for col_key, value in row.c.items():
-            col_index = _safe_col_index(col_key)
-            if col_index is None:
-                filtered_cells[col_key] = value
-                continue
-            if not _col_in_intervals(col_index, intervals):
-                filtered_cells[col_key] = value
+        excluded = excluded_by_intervals.get(intervals)
+        if excluded is None:
+            excluded = _excluded_col_keys(intervals)
+            excluded_by_intervals[intervals] = excluded
+        if _row_untouched_by_merges(row, excluded):
+            filtered_rows.append(row)
+            continue
+        filtered_cells = {
+            col_key: value
+            for col_key, value in row.c.items()
+            if col_key not in excluded
+        }
         if not filtered_cells:
             continue
         filtered_links = None
@@ -839,22 +890,27 @@ def _filter_rows_excluding_merged_values(
 
 def _build_merged_row_intervals(
     merged_cells: list[MergedCellRange],
-) -> dict[int, list[tuple[int, int]]]:
+) -> dict[int, tuple[tuple[int, int], ...]]:
     """Build row -> merged column intervals lookup.
 
     Args:
         merged_cells: Merged cell ranges.
 
     Returns:
-        Mapping of row index to merged column intervals.
+        Mapping of row index to merged, sorted column intervals.
     """
-    intervals_by_row: dict[int, list[tuple[int, int]]] = {}
+    spans_by_row: dict[int, list[tuple[int, int]]] = {}
     for cell in merged_cells:
         for row in range(cell.r1, cell.r2 + 1):
-            intervals_by_row.setdefault(row, []).append((cell.c1, cell.c2))
-    for row, intervals in intervals_by_row.items():
-        intervals_by_row[row] = _merge_intervals(intervals)
-    return intervals_by_row
+            spans_by_row.setdefault(row, []).append((cell.c1, cell.c2))
+    return {row: tuple(_merge_intervals(spans)) for row, spans in spans_by_row.items()}
+
+
+def _excluded_col_keys(intervals: Sequence[tuple[int, int]]) -> frozenset[str]:
+    """Return the column keys (``str`` column indices) covered by intervals."""
+    return frozenset(
+        key for start, end in intervals for key in _COL_KEYS[start : end + 1]
+    )
 
 
 def _merge_intervals(intervals: list[tuple[int, int]]) -> list[tuple[int, int]]:
@@ -874,24 +930,6 @@ def _merge_intervals(intervals: list[tuple[int, int]]) -> list[tuple[int, int]]:
     return merged
 
 
-def _col_in_intervals(col_index: int, intervals: list[tuple[int, int]]) -> bool:
-    """Check whether a column index falls in any interval."""
-    for start, end in intervals:
-        if col_index < start:
-            return False
-        if start <= col_index <= end:
-            return True
-    return False
-
-
-def _safe_col_index(col_key: str) -> int | None:
-    """Parse a column key to int, returning None on failure."""
-    try:
-        return int(col_key)
-    except ValueError:
-        return None
-
-
 def collect_sheet_raw_data(
     *,
     cell_data: CellData,
@@ -1039,8 +1077,30 @@ def run_extraction_pipeline(inputs: ExtractionInputs) -> PipelineResult:
     Returns:
         PipelineResult: Contains the constructed workbook data, collected artifacts, and pipeline execution state (including COM attempt/success and any fallback reason).
     """
+    artifacts = ExtractionArtifacts()
+    try:
+        return _run_extraction_pipeline(inputs, artifacts)
+    finally:
+        backend = artifacts.openpyxl_backend
+        artifacts.openpyxl_backend = None
+        if backend is not None:
+            backend.close()
+
+
+def _run_extraction_pipeline(
+    inputs: ExtractionInputs, artifacts: ExtractionArtifacts
+) -> PipelineResult:
+    """Run the planned steps and build the result for ``run_extraction_pipeline``.
+
+    Args:
+        inputs: Resolved pipeline inputs.
+        artifacts: Artifact container shared by every step of the run.
+
+    Returns:
+        PipelineResult for the run.
+    """
     plan = build_pipeline_plan(inputs)
-    artifacts = run_pipeline(plan.pre_com_steps, inputs, ExtractionArtifacts())
+    run_pipeline(plan.pre_com_steps, inputs, artifacts)
     state = PipelineState()
 
     def _fallback(
@@ -1094,6 +1154,11 @@ def run_extraction_pipeline(inputs: ExtractionInputs) -> PipelineResult:
             FallbackReason.SKIP_COM_TESTS,
         )
 
+    if artifacts.openpyxl_backend is not None:
+        # The pre-COM steps are the last regular openpyxl consumers; do not
+        # keep their workbooks resident alongside Excel.
+        artifacts.openpyxl_backend.close()
+
     try:
         with xlwings_workbook(inputs.file_path) as workbook:
             state.com_attempted = True
@@ -1205,7 +1270,7 @@ def build_cells_tables_workbook(
         WorkbookData: A workbook composed from the available per-sheet cell rows, detected table candidates, merged-cell information, shapes, charts, and any resolved formulas and colors maps. When `include_rich_artifacts` is false and no OOXML fallback is available, shapes and charts are empty. Formulas and colors maps are extracted from artifacts or from the Openpyxl backend when requested and not already present.
     """
     logger.info("Building fallback workbook with OOXML: %s", reason)
-    backend = OpenpyxlBackend(inputs.file_path)
+    backend = _shared_openpyxl_backend(inputs, artifacts)
     colors_map_data = artifacts.colors_map_data
     if inputs.include_colors_map and colors_map_data is None:
         colors_map_data = backend.extract_colors_map(
@@ -1235,6 +1300,18 @@ def build_cells_tables_workbook(
                     artifacts.chart_data[sn] = cv
         include_rich_artifacts = bool(artifacts.shape_data or artifacts.chart_data)
 
+    # Resolve the run-level switches once; the sheet loop only does lookups.
+    shape_source: ShapeData = artifacts.shape_data if include_rich_artifacts else {}
+    chart_source: ChartData = (
+        artifacts.chart_data
+        if include_rich_artifacts and inputs.mode != "light"
+        else {}
+    )
+    print_area_source: PrintAreaData = (
+        artifacts.print_area_data if inputs.include_print_areas else {}
+    )
+    filter_merged_values = not inputs.include_merged_values_in_rows
+
     sheets: dict[str, SheetRawData] = {}
     for sheet_name, rows in artifacts.cell_data.items():
         detect_start = time.monotonic()
@@ -1251,23 +1328,14 @@ def build_cells_tables_workbook(
             time.monotonic() - detect_start,
         )
         merged_cells = artifacts.merged_cell_data.get(sheet_name, [])
-        filtered_rows = (
-            rows
-            if inputs.include_merged_values_in_rows
-            else _filter_rows_excluding_merged_values(rows, merged_cells)
-        )
+        if filter_merged_values:
+            rows = _filter_rows_excluding_merged_values(rows, merged_cells)
         sheets[sheet_name] = SheetRawData(
-            rows=filtered_rows,
-            shapes=artifacts.shape_data.get(sheet_name, [])
-            if include_rich_artifacts
-            else [],
-            charts=artifacts.chart_data.get(sheet_name, [])
-            if include_rich_artifacts and inputs.mode != "light"
-            else [],
+            rows=rows,
+            shapes=shape_source.get(sheet_name, []),
+            charts=chart_source.get(sheet_name, []),
             table_candidates=tables,
-            print_areas=artifacts.print_area_data.get(sheet_name, [])
-            if inputs.include_print_areas
-            else [],
+            print_areas=print_area_source.get(sheet_name, []),
             auto_print_areas=[],
             formulas_map=sheet_formulas.formulas_map if sheet_formulas else {},
             colors_map=sheet_colors.colors_map if sheet_colors else {},
@@ -1,11 +1,12 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 
 from openpyxl.utils import range_boundaries
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RangeBounds:
     """Normalized range bounds.
 
@@ -22,9 +23,14 @@ class RangeBounds:
     c2: int
 
 
+@lru_cache(maxsize=4096)
 def parse_range_zero_based(range_str: str) -> RangeBounds | None:
     """Parse an Excel range string into zero-based bounds.
 
+    Results are memoized per input string; ``RangeBounds`` is frozen, so the
+    cached instances are safe to share. Call ``parse_range_zero_based.cache_clear()``
+    to reset the cache.
+
     Args:
         range_str: Excel range string (e.g., "Sheet1!A1:B2").
 
@@ -36,6 +42,13 @@ def parse_range_zero_based(range_str: str) -> RangeBounds | None:
         return None
     if "!" in cleaned:
         cleaned = cleaned.split("!", 1)[1]
+    # A bounded range needs a column letter and a row number. Rejecting other
+    # tokens here skips the exception path for junk such as "INVALID" and for
+    # whole-row/column references ("A:C", "1:3"), which have no bounds.
+    if not (
+        any(ch.isdigit() for ch in cleaned) and any(ch.isalpha() for ch in cleaned)
+    ):
+        return None
     try:
         min_col, min_row, max_col, max_row = range_boundaries(cleaned)
     except Exception:
@@ -2,33 +2,68 @@ from __future__ import annotations
 
 from collections.abc import Iterator
 from contextlib import contextmanager
+from enum import StrEnum
 import logging
 from pathlib import Path
 from typing import Any
 import warnings
 
 from openpyxl import load_workbook
+from openpyxl.workbook.workbook import Workbook
 import xlwings as xw
 
 logger = logging.getLogger(__name__)
 
-__all__ = ["openpyxl_workbook", "xlwings_workbook", "_find_open_workbook", "xw"]
-
-
-@contextmanager
-def openpyxl_workbook(
-    file_path: Path, *, data_only: bool, read_only: bool
-) -> Iterator[Any]:
+__all__ = [
+    "OpenpyxlLoadMode",
+    "load_openpyxl_workbook",
+    "openpyxl_workbook",
+    "xlwings_workbook",
+    "_find_open_workbook",
+    "xw",
+]
+
+
+class OpenpyxlLoadMode(StrEnum):
+    """How much of a workbook openpyxl should materialize when loading it."""
+
+    METADATA_ONLY = "metadata_only"
+    STYLED = "styled"
+    FORMULAS = "formulas"
+
+    def load_options(self) -> tuple[bool, bool, bool]:
+        """
+        Return the ``(data_only, read_only, keep_links)`` flags for this mode.
+
+        ``METADATA_ONLY`` streams worksheets lazily and skips external links, which is
+        enough for workbook-level metadata such as defined names and print areas but
+        not for merged cells, styles, or hyperlinks. ``FORMULAS`` streams the same
+        way: formula text is read cell by cell in order and needs neither styles nor
+        linked workbooks.
+        """
+        if self is OpenpyxlLoadMode.METADATA_ONLY:
+            return (True, True, False)
+        if self is OpenpyxlLoadMode.FORMULAS:
+            return (False, True, False)
+        return (True, False, True)
+
+
+def load_openpyxl_workbook(
+    file_path: Path, *, data_only: bool, read_only: bool, keep_links: bool = True
+) -> Workbook:
     """
-    Open an openpyxl Workbook for temporary use and ensure it is closed on exit.
+    Load an openpyxl Workbook with known-noisy openpyxl warnings suppressed.
+
+    The caller owns the returned workbook and is responsible for closing it.
 
     Parameters:
         file_path (Path): Path to the workbook file.
         data_only (bool): If True, read stored cell values instead of formulas.
         read_only (bool): If True, open the workbook in optimized read-only mode.
+        keep_links (bool): If False, skip loading external workbook link parts.
 
-    Yields:
-        openpyxl.workbook.workbook.Workbook: The opened workbook instance.
+    Returns:
+        openpyxl.workbook.workbook.Workbook: The loaded workbook instance.
     """
     with warnings.catch_warnings():
         warnings.filterwarnings(
@@ -49,7 +84,30 @@ def openpyxl_workbook(
             category=UserWarning,
             module="openpyxl",
         )
-        wb = load_workbook(file_path, data_only=data_only, read_only=read_only)
+        return load_workbook(
+            file_path,
+            data_only=data_only,
+            read_only=read_only,
+            keep_links=keep_links,
+        )
+
+
+@contextmanager
+def openpyxl_workbook(
+    file_path: Path, *, data_only: bool, read_only: bool
+) -> Iterator[Any]:
+    """
+    Open an openpyxl Workbook for temporary use and ensure it is closed on exit.
+
+    Parameters:
+        file_path (Path): Path to the workbook file.
+        data_only (bool): If True, read stored cell values instead of formulas.
+        read_only (bool): If True, open the workbook in optimized read-only mode.
+
+    Yields:
+        openpyxl.workbook.workbook.Workbook: The opened workbook instance.
+    """
+    wb = load_openpyxl_workbook(file_path, data_only=data_only, read_only=read_only)
     try:
         yield wb
     finally:
@@ -76,6 +134,7 @@ def xlwings_workbook(file_path: Path, *, visible: bool = False) -> Iterator[xw.B
         return
 
     app = xw.App(add_book=False, visible=visible)
+    _quiet_excel_app(app)
     wb = app.books.open(str(file_path))
     try:
         yield wb
@@ -90,6 +149,24 @@ def xlwings_workbook(file_path: Path, *, visible: bool = False) -> Iterator[xw.B
             logger.debug("Failed to quit Excel application. (%r)", exc)
 
 
+def _quiet_excel_app(app: xw.App) -> None:
+    """Turn off UI work on an Excel instance owned by this process.
+
+    Alerts, repaints, and VBA event handlers only add cross-process round trips
+    (or block on dialogs) while a workbook is read. Calculation is left alone
+    because DisplayFormat colors depend on an explicit recalculation.
+
+    Args:
+        app: xlwings application started for extraction.
+    """
+    try:
+        app.display_alerts = False
+        app.screen_updating = False
+        app.api.EnableEvents = False
+    except Exception as exc:
+        logger.debug("Failed to quiet Excel application. (%r)", exc)
+
+
 def _find_open_workbook(file_path: Path) -> xw.Book | None:
     """Return an existing workbook if already open in Excel.
 
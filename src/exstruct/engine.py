@@ -189,11 +189,13 @@ def save_auto_page_break_views(
     )
 
 
-def export_pdf(excel_path: str | Path, output_pdf: str | Path) -> list[str]:
+def export_pdf(
+    excel_path: str | Path, output_pdf: str | Path, *, force: bool = False
+) -> list[str]:
     """Lazily proxy PDF rendering."""
     from .render import export_pdf as export_pdf_impl
 
-    return export_pdf_impl(excel_path, output_pdf)
+    return export_pdf_impl(excel_path, output_pdf, force=force)
 
 
 def export_sheet_images(
@@ -203,6 +205,7 @@ def export_sheet_images(
     *,
     sheet: str | None = None,
     a1_range: str | None = None,
+    image_format: Literal["png", "jpeg"] = "png",
 ) -> list[Path]:
     """Lazily proxy sheet image rendering."""
     from .render import export_sheet_images as export_sheet_images_impl
@@ -213,6 +216,7 @@ def export_sheet_images(
         dpi=dpi,
         sheet=sheet,
         a1_range=a1_range,
+        image_format=image_format,
     )
 
 
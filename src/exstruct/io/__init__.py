@@ -207,7 +207,9 @@ def _filter_row_to_area(
         return None
 
     filtered_cells: dict[str, int | float | str] = {}
-    filtered_links: dict[str, str] = {}
+    # Most rows carry no hyperlinks, so the links dict is only built for rows
+    # that have some.
+    filtered_links: dict[str, str] | None = None
 
     for col_idx_str, value in row.c.items():
         try:
@@ -219,6 +221,7 @@ def _filter_row_to_area(
             filtered_cells[key] = value
 
     if row.links:
+        filtered_links = {}
         for col_idx_str, url in row.links.items():
             try:
                 col_idx = int(col_idx_str)
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+from functools import lru_cache
 import importlib
 import json
+import math
 from types import ModuleType
 
 from ..errors import MissingDependencyError, SerializationError
@@ -70,6 +72,10 @@ def _serialize_payload_from_hint(
     match format_hint:
         case "json":
             indent_val = 2 if pretty and indent is None else indent
+            if indent_val == 2:
+                fast = _dumps_indent2_orjson(payload)
+                if fast is not None:
+                    return fast
             return json.dumps(payload, ensure_ascii=False, indent=indent_val)
         case "yaml":
             yaml = _require_yaml()
@@ -90,8 +96,79 @@ def _serialize_payload_from_hint(
             )
 
 
+def _dumps_indent2_orjson(payload: JsonStructure) -> str | None:
+    """Serialize ``payload`` as 2-space-indented JSON with orjson when available.
+
+    The stdlib encoder falls back to pure Python whenever ``indent`` is set,
+    while orjson's ``OPT_INDENT_2`` layout matches ``json.dumps(indent=2,
+    ensure_ascii=False)``. The two encoders only disagree on floats: orjson
+    writes NaN/Infinity as ``null`` and formats exponent floats differently
+    (``1e-7``/``0.00001``/``1e16`` rather than ``1e-07``/``1e-05``/``1e+16``).
+    Payloads holding any such float are left to the stdlib encoder, so the
+    output is identical either way. Compact output stays on the stdlib C
+    encoder, whose ``", "``/``": "`` separators orjson cannot reproduce.
+
+    Args:
+        payload: JSON-serializable payload.
+
+    Returns:
+        Serialized string, or None when orjson is not installed, the payload
+        holds a float orjson would format differently, or orjson cannot
+        encode the payload (e.g. integers wider than 64 bits).
+    """
+    orjson = _optional_orjson()
+    if orjson is None or _has_stdlib_only_float(payload):
+        return None
+    try:
+        data: bytes = orjson.dumps(
+            payload, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+        )
+    except orjson.JSONEncodeError:
+        return None
+    return data.decode("utf-8")
+
+
+def _has_stdlib_only_float(payload: JsonStructure) -> bool:
+    """Return True when ``payload`` holds a float orjson formats differently.
+
+    Those are NaN/Infinity and floats whose ``repr`` uses exponent form
+    (magnitudes below ``1e-4`` or from ``1e16`` up); every other float is
+    written identically by both encoders.
+
+    Args:
+        payload: JSON-serializable payload.
+
+    Returns:
+        True if any nested float is non-finite or printed in exponent form.
+    """
+    stack: list[JsonStructure] = [payload]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            stack.extend(node.values())
+        elif isinstance(node, list):
+            stack.extend(node)
+        elif isinstance(node, float) and (not math.isfinite(node) or "e" in repr(node)):
+            return True
+    return False
+
+
+@lru_cache(maxsize=1)
+def _optional_orjson() -> ModuleType | None:
+    """Return the orjson module if installed, otherwise None."""
+    try:
+        return importlib.import_module("orjson")
+    except ImportError:
+        return None
+
+
+@lru_cache(maxsize=1)
 def _require_yaml() -> ModuleType:
-    """Ensure pyyaml is installed; otherwise raise with guidance."""
+    """Ensure pyyaml is installed; otherwise raise with guidance.
+
+    The imported module is memoized; a failed import is not, so installing
+    the dependency later in the process is still picked up.
+    """
     try:
         module = importlib.import_module("yaml")
     except ImportError as e:
@@ -101,8 +178,12 @@ def _require_yaml() -> ModuleType:
     return module
 
 
+@lru_cache(maxsize=1)
 def _require_toon() -> ModuleType:
-    """Ensure python-toon is installed; otherwise raise with guidance."""
+    """Ensure python-toon is installed; otherwise raise with guidance.
+
+    Memoized like ``_require_yaml``.
+    """
     try:
         module = importlib.import_module("toon")
     except ImportError as e:
@@ -1,8 +1,16 @@
 from __future__ import annotations
 
+from collections.abc import Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+import ctypes
 import json
 import logging
 import math
+import mmap
+import multiprocessing
+import multiprocessing.pool
+import multiprocessing.util
 import os
 from pathlib import Path
 import re
@@ -12,18 +20,26 @@ import sys
 import tempfile
 import time
 from types import ModuleType
-from typing import Protocol, cast
+from typing import Any, Protocol, cast
 
 from pydantic import BaseModel, Field
 import xlwings as xw
 
 from ..errors import MissingDependencyError, RenderError
+from ._bitmaps import ReusableBitmapMaker
+from ._images import IMAGE_SUFFIXES, ImageFormat, page_image_name, save_page_image
 
 logger = logging.getLogger(__name__)
 _A1_RANGE_PATTERN = re.compile(r"^[A-Za-z]{1,3}[1-9][0-9]*:[A-Za-z]{1,3}[1-9][0-9]*$")
 _DEFAULT_RENDER_SUBPROCESS_STARTUP_TIMEOUT_SECONDS = 5.0
 _DEFAULT_RENDER_SUBPROCESS_JOIN_TIMEOUT_SECONDS = 120.0
 _DEFAULT_RENDER_SUBPROCESS_RESULT_TIMEOUT_SECONDS = 5.0
+_XL_SHEET_VISIBLE = -1
+_OPENPYXL_READABLE_SUFFIXES = frozenset({".xlsx", ".xlsm"})
+_XL_SHEET_HIDDEN_STATES = frozenset({0, 2})
+
+_WORKER_APP: xw.App | None = None
+_SHEET_FILENAME_TRANSLATION = str.maketrans(dict.fromkeys('\\/:*?"<>|', "_"))
 
 
 def _require_excel_app() -> xw.App:
@@ -37,10 +53,26 @@ def _require_excel_app() -> xw.App:
         ) from e
 
 
-def export_pdf(excel_path: str | Path, output_pdf: str | Path) -> list[str]:
-    """Export an Excel workbook to PDF via Excel COM and return sheet names in order."""
+def export_pdf(
+    excel_path: str | Path, output_pdf: str | Path, *, force: bool = False
+) -> list[str]:
+    """
+    Export an Excel workbook to PDF via Excel COM and return sheet names in order.
+
+    When `output_pdf` already exists and is newer than an .xlsx/.xlsm workbook, Excel is not started: the existing PDF is kept and the sheet names are read with openpyxl. Pass `force=True` to always re-export.
+    """
     normalized_excel_path = Path(excel_path)
     normalized_output_pdf = Path(output_pdf)
+    if not force:
+        current_sheet_names = _sheet_names_if_pdf_current(
+            normalized_excel_path, normalized_output_pdf
+        )
+        if current_sheet_names is not None:
+            logger.info(
+                "render-stage=export_pdf.skip path=%s reason=up-to-date",
+                normalized_output_pdf,
+            )
+            return current_sheet_names
     normalized_output_pdf.parent.mkdir(parents=True, exist_ok=True)
 
     with tempfile.TemporaryDirectory() as td:
@@ -75,6 +107,32 @@ def export_pdf(excel_path: str | Path, output_pdf: str | Path) -> list[str]:
     return sheet_names
 
 
+def _sheet_names_if_pdf_current(excel_path: Path, output_pdf: Path) -> list[str] | None:
+    """
+    Return the workbook's worksheet names when `output_pdf` is newer than `excel_path`.
+
+    Returns None when the PDF is missing or stale, when the workbook format cannot be read by openpyxl, or when reading the sheet names fails, so the caller falls back to a full Excel export.
+    """
+    if excel_path.suffix.lower() not in _OPENPYXL_READABLE_SUFFIXES:
+        return None
+    try:
+        if output_pdf.stat().st_mtime <= excel_path.stat().st_mtime:
+            return None
+    except OSError:
+        return None
+    try:
+        from openpyxl import load_workbook
+
+        workbook = load_workbook(excel_path, read_only=True)
+    except Exception as exc:
+        logger.debug("Failed to read sheet names for up-to-date check. (%r)", exc)
+        return None
+    try:
+        return [sheet.title for sheet in workbook.worksheets]
+    finally:
+        workbook.close()
+
+
 def _require_pdfium() -> ModuleType:
     """Ensure pypdfium2 is installed; otherwise raise with guidance."""
     try:
@@ -93,12 +151,17 @@ def export_sheet_images(
     *,
     sheet: str | None = None,
     a1_range: str | None = None,
+    image_format: ImageFormat = "png",
 ) -> list[Path]:
     """
-    Export each worksheet in the given Excel workbook to PNG files and return the image paths in workbook order.
+    Export each worksheet in the given Excel workbook to image files and return the image paths in workbook order.
+
+    Hidden worksheets are skipped unless one is selected explicitly via `sheet`.
+
+    PNG output is lossless. JPEG output (`image_format="jpeg"`, written with a `.jpg` suffix) is lossy but typically several times smaller, which suits high-DPI renders consumed by LLM or web pipelines.
 
     Returns:
-        paths (list[Path]): Paths to the generated PNG files, ordered by the corresponding worksheets.
+        paths (list[Path]): Paths to the generated image files, ordered by the corresponding worksheets.
 
     Raises:
         RenderError: If export or rendering fails.
@@ -109,6 +172,7 @@ def export_sheet_images(
     normalized_range = _normalize_a1_range(a1_range) if a1_range is not None else None
     if normalized_range is not None and normalized_sheet is None:
         raise ValueError("sheet is required when a1_range is specified.")
+    normalized_format = _normalize_image_format(image_format)
     normalized_output_dir.mkdir(parents=True, exist_ok=True)
     use_subprocess = _use_render_subprocess()
     pdfium = _ensure_pdfium(use_subprocess)
@@ -125,6 +189,7 @@ def export_sheet_images(
                 pdfium,
                 normalized_sheet,
                 normalized_range,
+                normalized_format,
             )
     except ValueError:
         raise
@@ -136,6 +201,123 @@ def export_sheet_images(
         ) from exc
 
 
+def export_sheet_images_many(
+    excel_paths: Sequence[str | Path],
+    output_dirs: Sequence[str | Path],
+    dpi: int = 144,
+    *,
+    image_format: ImageFormat = "png",
+    processes: int | None = None,
+) -> list[list[Path]]:
+    """
+    Export sheet images for several workbooks, sharing one Excel instance per worker process.
+
+    Workbooks are distributed over a spawn-based process pool whose initializer starts Excel once per worker, so COM startup is paid per worker rather than per workbook. With a single workbook or `processes=1` everything runs in the calling process through `export_sheet_images`.
+
+    Parameters:
+        excel_paths (Sequence[str | Path]): Workbooks to render.
+        output_dirs (Sequence[str | Path]): Output directory for each workbook, matched by position.
+        dpi (int): Dots per inch used when rasterizing PDF pages.
+        image_format (ImageFormat): Output image format ("png" or "jpeg").
+        processes (int | None): Worker process count. Defaults to one less than the CPU count, capped at the number of workbooks.
+
+    Returns:
+        list[list[Path]]: Generated image paths for each workbook, in the order of `excel_paths`.
+
+    Raises:
+        ValueError: If the path lists differ in length or `processes` is not positive.
+        RenderError: If export or rendering fails for any workbook.
+    """
+    if len(excel_paths) != len(output_dirs):
+        raise ValueError("excel_paths and output_dirs must have the same length.")
+    if processes is not None and processes < 1:
+        raise ValueError("processes must be >= 1.")
+    normalized_format = _normalize_image_format(image_format)
+    jobs = [
+        (index, str(excel_path), str(output_dir), dpi, normalized_format)
+        for index, (excel_path, output_dir) in enumerate(
+            zip(excel_paths, output_dirs, strict=True)
+        )
+    ]
+    worker_count = min(len(jobs), processes or max(1, (os.cpu_count() or 2) - 1))
+    results: list[list[Path]] = [[] for _ in jobs]
+    if worker_count <= 1:
+        for job in jobs:
+            index, paths = _run_render_job(job)
+            results[index] = [Path(path) for path in paths]
+        return results
+    pool = _new_render_pool(worker_count)
+    try:
+        for index, paths in pool.imap_unordered(_run_render_job, jobs):
+            results[index] = [Path(path) for path in paths]
+        # close() + join() let each worker exit normally and run the finalizer
+        # that quits its Excel; terminate() would kill it before that.
+        pool.close()
+    except BaseException:
+        pool.terminate()
+        raise
+    finally:
+        pool.join()
+    return results
+
+
+def _new_render_pool(processes: int) -> multiprocessing.pool.Pool:
+    """Create a spawn-based pool whose workers each hold one Excel instance."""
+    context = multiprocessing.get_context("spawn")
+    return context.Pool(processes, initializer=_init_render_worker)
+
+
+def _init_render_worker() -> None:
+    """
+    Start Excel once for this worker process and quit it when the worker exits.
+
+    The quit is registered as a multiprocessing finalizer, which the worker runs as part of its own shutdown under every start method (`atexit` handlers are skipped by workers that leave through `os._exit`). It only runs if the pool is closed and joined rather than terminated.
+
+    Startup failures are only logged: a raising pool initializer makes multiprocessing respawn workers forever, whereas leaving the shared app unset lets each job surface the RenderError from `export_sheet_images`.
+    """
+    global _WORKER_APP
+    try:
+        app = _require_excel_app()
+    except RenderError as exc:
+        logger.warning("render-stage=worker.init excel unavailable (%s)", exc)
+        return
+    app.display_alerts = False
+    _WORKER_APP = app
+    multiprocessing.util.Finalize(None, _quit_worker_app, exitpriority=10)
+
+
+def _quit_worker_app() -> None:
+    """Quit the worker-owned Excel instance, ignoring COM shutdown errors."""
+    global _WORKER_APP
+    app, _WORKER_APP = _WORKER_APP, None
+    if app is None:
+        return
+    try:
+        app.quit()
+    except Exception as exc:
+        logger.debug("Failed to quit worker Excel app. (%r)", exc)
+
+
+def _excel_app_responds(app: xw.App) -> bool:
+    """Return True if a COM round trip to ``app`` still succeeds."""
+    try:
+        _ = app.books.count
+    except Exception:
+        return False
+    return True
+
+
+def _run_render_job(
+    job: tuple[int, str, str, int, ImageFormat],
+) -> tuple[int, list[str]]:
+    """Render one workbook for `export_sheet_images_many` and tag the result with its index."""
+    index, excel_path, output_dir, dpi, image_format = job
+    paths = export_sheet_images(
+        excel_path, output_dir, dpi=dpi, image_format=image_format
+    )
+    return index, [str(path) for path in paths]
+
+
 def _sanitize_sheet_filename(name: str) -> str:
     r"""
     Create a filesystem-safe filename derived from an Excel sheet name.
@@ -148,7 +330,7 @@ def _sanitize_sheet_filename(name: str) -> str:
     Returns:
         safe_name (str): Filename-safe string derived from `name`.
     """
-    return "".join("_" if c in '\\/:*?"<>|' else c for c in name).strip() or "sheet"
+    return name.translate(_SHEET_FILENAME_TRANSLATION).strip() or "sheet"
 
 
 def _normalize_optional_sheet(value: str | None) -> str | None:
@@ -161,6 +343,21 @@ def _normalize_optional_sheet(value: str | None) -> str | None:
     return candidate
 
 
+def _normalize_image_format(value: str) -> ImageFormat:
+    """Validate the output image format and fold the `jpg` alias into `jpeg`."""
+    candidate = value.strip().lower()
+    if candidate == "jpg":
+        candidate = "jpeg"
+    if candidate not in IMAGE_SUFFIXES:
+        raise ValueError(f"Unsupported image format: {value}")
+    return cast(ImageFormat, candidate)
+
+
+def _image_suffix(image_format: ImageFormat) -> str:
+    """Return the filename suffix used for the given image format."""
+    return IMAGE_SUFFIXES[image_format]
+
+
 def _normalize_a1_range(value: str) -> str:
     """Validate and normalize A1 range text."""
     candidate = value.strip()
@@ -235,10 +432,14 @@ class _RenderWorkerResult(BaseModel):
         return cls(paths=[], error=message)
 
 
-def _iter_sheet_apis(wb: xw.Book) -> list[tuple[int, str, _SheetApiProtocol]]:
+def _iter_sheet_apis(
+    wb: xw.Book, *, include_hidden: bool = False
+) -> list[tuple[int, str, _SheetApiProtocol]]:
     """
     Enumerate workbook sheets and return each sheet's zero-based index, display name, and COM API handle in workbook order.
 
+    Hidden and very hidden sheets are skipped unless `include_hidden` is True, so they are never exported to blank PDFs. Indexes keep their workbook positions either way.
+
     If direct COM access to Worksheets is unavailable, falls back to iterating wb.sheets to build the same list.
 
     Returns:
@@ -252,6 +453,8 @@ def _iter_sheet_apis(wb: xw.Book) -> list[tuple[int, str, _SheetApiProtocol]]:
         sheets: list[tuple[int, str, _SheetApiProtocol]] = []
         for i in range(1, count + 1):
             ws_api = cast(_SheetApiProtocol, ws_collection.Item(i))
+            if not include_hidden and not _is_sheet_visible(ws_api):
+                continue
             name = str(getattr(ws_api, "Name", f"Sheet{i}"))
             sheets.append((i - 1, name, ws_api))
         return sheets
@@ -263,9 +466,23 @@ def _iter_sheet_apis(wb: xw.Book) -> list[tuple[int, str, _SheetApiProtocol]]:
                 cast(_SheetApiProtocol, sheet.api),
             )
             for index, sheet in enumerate(wb.sheets)
+            if include_hidden or _is_sheet_visible(sheet.api)
         ]
 
 
+def _is_sheet_visible(sheet_api: object) -> bool:
+    """
+    Return whether a worksheet is visible according to its XlSheetVisibility value.
+
+    Only xlSheetHidden (0) and xlSheetVeryHidden (2) count as hidden; a missing or unreadable `Visible` property is treated as visible.
+    """
+    try:
+        visibility = int(getattr(sheet_api, "Visible", _XL_SHEET_VISIBLE))
+    except Exception:
+        return True
+    return visibility not in _XL_SHEET_HIDDEN_STATES
+
+
 def _build_sheet_export_plan(
     wb: xw.Book,
     *,
@@ -307,7 +524,7 @@ def _find_sheet_api(
     wb: xw.Book, *, sheet_name: str
 ) -> tuple[str, _SheetApiProtocol] | None:
     """Find one worksheet by name and return its display name and API handle."""
-    for _, candidate_name, sheet_api in _iter_sheet_apis(wb):
+    for _, candidate_name, sheet_api in _iter_sheet_apis(wb, include_hidden=True):
         if candidate_name == sheet_name:
             return candidate_name, sheet_api
     return None
@@ -377,59 +594,6 @@ def _split_csv_respecting_quotes(raw: str) -> list[str]:
     return [p for p in parts if p]
 
 
-def _rename_pages_for_print_area(
-    paths: list[Path],
-    output_dir: Path,
-    base_index: int,
-    safe_name: str,
-) -> list[Path]:
-    """
-    Rename the given image files so each gets a unique numeric prefix based on a base index and a safe sheet name.
-
-    Parameters:
-        paths (list[Path]): Existing image files for a single sheet or print area (may include per-page suffixes).
-        output_dir (Path): Directory where renamed files will reside.
-        base_index (int): Zero-based starting index used to compute the numeric prefix for each output file.
-        safe_name (str): Filesystem-safe base name to use after the numeric prefix.
-
-    Returns:
-        list[Path]: Paths to the renamed files in the same order as input, each named "{index:02d}_{safe_name}.png".
-    """
-    renamed: list[Path] = []
-    for path in paths:
-        page_index = _page_index_from_suffix(path.stem)
-        new_index = base_index + page_index
-        new_path = output_dir / f"{new_index + 1:02d}_{safe_name}.png"
-        if path != new_path:
-            path.replace(new_path)
-        renamed.append(new_path)
-    return renamed
-
-
-def _page_index_from_suffix(stem: str) -> int:
-    """
-    Extracts a zero-based page index from a filename stem ending with a "_pNN" numeric suffix.
-
-    If the stem ends with "_p" followed by digits, returns that number minus one. If the suffix is missing, non-numeric, or less than 1, returns 0.
-
-    Parameters:
-        stem (str): Filename stem to parse.
-
-    Returns:
-        int: Zero-based page index derived from the "_pNN" suffix, or 0 when no valid suffix is present.
-    """
-    if "_p" not in stem:
-        return 0
-    base, suffix = stem.rsplit("_p", 1)
-    _ = base
-    if suffix.isdigit():
-        page_number = int(suffix)
-        if page_number <= 0:
-            return 0
-        return page_number - 1
-    return 0
-
-
 def _export_sheet_pdf(
     sheet_api: _SheetApiProtocol,
     pdf_path: Path,
@@ -522,83 +686,106 @@ def _export_sheet_images_with_app(
     pdfium: ModuleType | None,
     sheet: str | None,
     a1_range: str | None,
+    image_format: ImageFormat = "png",
 ) -> list[Path]:
     """
-    Export each worksheet of an Excel workbook to PNG images by exporting sheets to per-sheet PDFs and rendering those PDFs.
+    Export each worksheet of an Excel workbook to images by exporting sheets to per-sheet PDFs and rendering those PDFs.
 
     Parameters:
         excel_path (Path): Path to the source Excel workbook.
-        output_dir (Path): Directory where generated PNGs will be written.
+        output_dir (Path): Directory where generated images will be written.
         temp_dir (Path): Temporary directory for per-sheet intermediate PDF files.
         dpi (int): Dots per inch used when rasterizing PDF pages.
         use_subprocess (bool): If True, render PDF pages in a subprocess; otherwise render in-process.
         pdfium (ModuleType | None): In-process pypdfium2 module when rendering in-process, or None when subprocess rendering is used.
+        image_format (ImageFormat): Output image format ("png" or "jpeg").
 
     Returns:
-        list[Path]: Paths to generated PNG images in the order corresponding to the workbook's sheets and print-area splits.
+        list[Path]: Paths to generated images in the order corresponding to the workbook's sheets and print-area splits.
     """
     written: list[Path] = []
-    app: xw.App | None = None
+    app: xw.App | None = _WORKER_APP
+    owns_app = app is None
     wb: xw.Book | None = None
     try:
-        app = _require_excel_app()
+        if app is None:
+            app = _require_excel_app()
         app.display_alerts = False
         wb = app.books.open(str(excel_path))
-        output_index = 0
-        for sheet_name, sheet_api, print_area in _build_sheet_export_plan(
-            wb,
-            sheet=sheet,
-            a1_range=a1_range,
-        ):
-            sheet_pdf = temp_dir / f"sheet_{output_index + 1:02d}.pdf"
-            safe_name = _sanitize_sheet_filename(sheet_name)
-            _export_sheet_pdf(
-                sheet_api,
-                sheet_pdf,
-                ignore_print_areas=False,
-                print_area=print_area,
-            )
-            sheet_paths = _render_sheet_images(
-                pdfium,
-                sheet_pdf,
-                output_dir,
-                output_index,
-                safe_name,
-                dpi,
-                use_subprocess,
-            )
-            if not sheet_paths and a1_range is None:
-                _export_sheet_pdf(
-                    sheet_api,
-                    sheet_pdf,
-                    ignore_print_areas=True,
-                    print_area=print_area,
-                )
-                sheet_paths = _render_sheet_images(
+        plan = _build_sheet_export_plan(wb, sheet=sheet, a1_range=a1_range)
+        # Excel COM calls stay on this thread while a single render thread
+        # rasterizes plan item N as Excel exports item N + 1. Rendering of N + 1
+        # starts only after N finishes, so output numbering and the
+        # IgnorePrintAreas retry behave exactly as in a serial loop.
+        with ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="exstruct-render"
+        ) as executor:
+            if plan:
+                _export_planned_sheet_pdf(plan, 0, temp_dir)
+            output_index = 0
+            for plan_index, (sheet_name, sheet_api, print_area) in enumerate(plan):
+                sheet_pdf = _planned_sheet_pdf_path(temp_dir, plan_index)
+                render_args = (
                     pdfium,
                     sheet_pdf,
                     output_dir,
                     output_index,
-                    safe_name,
+                    _sanitize_sheet_filename(sheet_name),
                     dpi,
                     use_subprocess,
+                    image_format,
                 )
-            sheet_paths = _normalize_multipage_paths(
-                sheet_paths,
-                output_dir,
-                output_index,
-                safe_name,
-            )
-            written.extend(sheet_paths)
-            output_index += max(1, len(sheet_paths))
+                future = executor.submit(_render_sheet_images, *render_args)
+                if plan_index + 1 < len(plan):
+                    _export_planned_sheet_pdf(plan, plan_index + 1, temp_dir)
+                sheet_paths = future.result()
+                if not sheet_paths and a1_range is None:
+                    _export_sheet_pdf(
+                        sheet_api,
+                        sheet_pdf,
+                        ignore_print_areas=True,
+                        print_area=print_area,
+                    )
+                    sheet_paths = executor.submit(
+                        _render_sheet_images, *render_args, map_pdf=True
+                    ).result()
+                written.extend(sheet_paths)
+                output_index += max(1, len(sheet_paths))
         return written
+    except Exception:
+        # A worker app that stopped answering COM calls is dropped, so later
+        # jobs on this worker start their own Excel instead of reusing it.
+        if app is not None and not owns_app and not _excel_app_responds(app):
+            _quit_worker_app()
+            wb = None
+        raise
     finally:
         if wb is not None:
             wb.close()
-        if app is not None:
+        if app is not None and owns_app:
             app.quit()
 
 
+def _planned_sheet_pdf_path(temp_dir: Path, plan_index: int) -> Path:
+    """Return the intermediate PDF path for one export plan item."""
+    return temp_dir / f"sheet_{plan_index + 1:02d}.pdf"
+
+
+def _export_planned_sheet_pdf(
+    plan: list[tuple[str, _SheetApiProtocol, str | None]],
+    plan_index: int,
+    temp_dir: Path,
+) -> None:
+    """Export one export plan item to its intermediate PDF, honoring print areas."""
+    _, sheet_api, print_area = plan[plan_index]
+    _export_sheet_pdf(
+        sheet_api,
+        _planned_sheet_pdf_path(temp_dir, plan_index),
+        ignore_print_areas=False,
+        print_area=print_area,
+    )
+
+
 def _render_sheet_images(
     pdfium: ModuleType | None,
     sheet_pdf: Path,
@@ -607,12 +794,17 @@ def _render_sheet_images(
     safe_name: str,
     dpi: int,
     use_subprocess: bool,
+    image_format: ImageFormat = "png",
+    *,
+    map_pdf: bool = False,
 ) -> list[Path]:
     """
-    Render a sheet PDF to one or more PNG files using either a subprocess or in-process renderer.
+    Render a sheet PDF to one or more image files using either a subprocess or in-process renderer.
+
+    `map_pdf` asks the in-process renderer to load the PDF from a memory map; it is used for the IgnorePrintAreas retry, where Excel has just rewritten the file. The subprocess renderer always opens the PDF by path.
 
     Returns:
-        paths (list[Path]): Paths to the generated PNG files in output order.
+        paths (list[Path]): Paths to the generated image files in output order.
 
     Raises:
         RenderError: If in-process rendering is requested but the `pypdfium2` module (`pdfium`) is not provided.
@@ -624,6 +816,7 @@ def _render_sheet_images(
             output_index,
             safe_name,
             dpi,
+            image_format=image_format,
         )
     if pdfium is None:
         raise RenderError("pypdfium2 is required for in-process rendering.")
@@ -634,44 +827,43 @@ def _render_sheet_images(
         output_index,
         safe_name,
         dpi,
+        image_format=image_format,
+        map_pdf=map_pdf,
     )
 
 
-def _normalize_multipage_paths(
-    paths: list[Path],
-    output_dir: Path,
-    base_index: int,
-    safe_name: str,
-) -> list[Path]:
+def _read_render_subprocess_env() -> bool:
     """
-    Assign distinct, ordered filenames for multi-page sheet outputs.
+    Read the subprocess rendering toggle from the environment.
 
-    If `paths` contains a single file, the list is returned unchanged. If `paths` contains multiple files, each file is given a unique, numbered filename in `output_dir` using `base_index` and `safe_name` so pages are ordered and do not collide.
-
-    Parameters:
-        paths (list[Path]): Existing file paths for a sheet's rendered pages.
-        output_dir (Path): Directory containing or intended to contain the output files.
-        base_index (int): Zero-based starting index used to compute numeric prefixes for filenames.
-        safe_name (str): Filesystem-safe base name included in the generated filenames.
+    Reads the environment variable EXSTRUCT_RENDER_SUBPROCESS (case-insensitive). Subprocess rendering is disabled when the variable is set to "0" or "false"; if the variable is unset or set to any other value, subprocess rendering is enabled.
 
     Returns:
-        list[Path]: Paths to the resulting files in `output_dir`. When multiple input paths are provided, returned paths reflect the new, uniquely prefixed filenames.
+        `true` if subprocess rendering is enabled, `false` otherwise.
     """
-    if len(paths) <= 1:
-        return paths
-    return _rename_pages_for_print_area(paths, output_dir, base_index, safe_name)
+    return os.getenv("EXSTRUCT_RENDER_SUBPROCESS", "1").lower() not in {"0", "false"}
+
+
+_USE_RENDER_SUBPROCESS = _read_render_subprocess_env()
+
+
+def _reload_render_subprocess_env() -> bool:
+    """Re-read EXSTRUCT_RENDER_SUBPROCESS and refresh the cached toggle."""
+    global _USE_RENDER_SUBPROCESS
+    _USE_RENDER_SUBPROCESS = _read_render_subprocess_env()
+    return _USE_RENDER_SUBPROCESS
 
 
 def _use_render_subprocess() -> bool:
     """
     Decide whether PDF-to-PNG rendering should be performed in a subprocess.
 
-    Reads the environment variable EXSTRUCT_RENDER_SUBPROCESS (case-insensitive). Subprocess rendering is disabled when the variable is set to "0" or "false"; if the variable is unset or set to any other value, subprocess rendering is enabled.
+    The toggle is read once at import time; call `_reload_render_subprocess_env` after changing the environment variable at runtime.
 
     Returns:
         `true` if subprocess rendering is enabled, `false` otherwise.
     """
-    return os.getenv("EXSTRUCT_RENDER_SUBPROCESS", "1").lower() not in {"0", "false"}
+    return _USE_RENDER_SUBPROCESS
 
 
 def _get_render_subprocess_join_timeout_seconds() -> float:
@@ -739,32 +931,64 @@ def _render_pdf_pages_in_process(
     sheet_index: int,
     safe_name: str,
     dpi: int,
+    *,
+    image_format: ImageFormat = "png",
+    map_pdf: bool = False,
 ) -> list[Path]:
-    """Render PDF pages to PNGs in the current process."""
+    """Render PDF pages to images in the current process."""
     scale = dpi / 72.0
+    suffix = _image_suffix(image_format)
     written: list[Path] = []
-    with pdfium.PdfDocument(str(pdf_path)) as pdf:
-        for page_index in range(len(pdf)):
-            page = pdf[page_index]
-            bitmap = page.render(scale=scale)
+    bitmap_maker = ReusableBitmapMaker(pdfium)
+    with _open_pdf_document(pdfium, pdf_path, map_pdf=map_pdf) as pdf:
+        for page_index, page in enumerate(pdf):
+            bitmap = page.render(scale=scale, bitmap_maker=bitmap_maker)
             pil_image = bitmap.to_pil()
-            page_suffix = f"_p{page_index + 1:02d}" if page_index > 0 else ""
-            img_path = (
-                output_dir / f"{sheet_index + 1:02d}_{safe_name}{page_suffix}.png"
+            img_path = output_dir / page_image_name(
+                sheet_index, page_index, safe_name, suffix
             )
-            pil_image.save(img_path, format="PNG", dpi=(dpi, dpi))
+            save_page_image(pil_image, img_path, image_format, dpi)
             written.append(img_path)
     return written
 
 
+@contextmanager
+def _open_pdf_document(
+    pdfium: ModuleType, pdf_path: Path, *, map_pdf: bool
+) -> Iterator[Any]:
+    """
+    Open a PDF with pypdfium2, optionally loading it from a memory map of the file.
+
+    The mapping is copy-on-write so ctypes can expose it as a writable buffer, which pdfium loads in place via FPDF_LoadMemDocument64 instead of reading the file again. The view is built from the mapping's address rather than holding a buffer export, because pypdfium2 keeps its input referenced after closing; the mapping is therefore unmapped explicitly as soon as the document is closed. Empty files cannot be mapped, so they are always opened by path and left for pdfium to reject.
+    """
+    if not map_pdf or pdf_path.stat().st_size == 0:
+        with pdfium.PdfDocument(str(pdf_path)) as pdf:
+            yield pdf
+        return
+    with pdf_path.open("rb") as handle:
+        mapped = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_COPY)
+    try:
+        address = ctypes.addressof(ctypes.c_char.from_buffer(mapped))
+        buffer = (ctypes.c_char * len(mapped)).from_address(address)
+        try:
+            with pdfium.PdfDocument(buffer) as pdf:
+                yield pdf
+        finally:
+            del buffer
+    finally:
+        mapped.close()
+
+
 def _render_pdf_pages_subprocess(
     pdf_path: Path,
     output_dir: Path,
     sheet_index: int,
     safe_name: str,
     dpi: int,
+    *,
+    image_format: ImageFormat = "png",
 ) -> list[Path]:
-    """Render PDF pages to PNGs in a subprocess for memory isolation."""
+    """Render PDF pages to images in a subprocess for memory isolation."""
     start_time = time.perf_counter()
     startup_timeout_seconds = _get_render_subprocess_startup_timeout_seconds()
     join_timeout_seconds = _get_render_subprocess_join_timeout_seconds()
@@ -786,6 +1010,7 @@ def _render_pdf_pages_subprocess(
         sheet_index,
         safe_name,
         dpi,
+        image_format=image_format,
         startup_timeout_seconds=startup_timeout_seconds,
         result_timeout_seconds=result_timeout_seconds,
         join_timeout_seconds=join_timeout_seconds,
@@ -811,6 +1036,7 @@ def _run_render_worker_subprocess(
     safe_name: str,
     dpi: int,
     *,
+    image_format: ImageFormat = "png",
     startup_timeout_seconds: float,
     result_timeout_seconds: float,
     join_timeout_seconds: float,
@@ -827,6 +1053,7 @@ def _run_render_worker_subprocess(
             "sheet_index": sheet_index,
             "safe_name": safe_name,
             "dpi": dpi,
+            "image_format": image_format,
             "started_path": str(started_path),
             "result_path": str(result_path),
         }
@@ -1054,4 +1281,9 @@ def _read_worker_stderr(process: _WorkerProcessProtocol) -> str:
     return f" stderr={cleaned[:240]}"
 
 
-__all__ = ["export_pdf", "export_sheet_images"]
+__all__ = [
+    "ImageFormat",
+    "export_pdf",
+    "export_sheet_images",
+    "export_sheet_images_many",
+]
@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+from types import ModuleType
+
+
+class ReusableBitmapMaker:
+    """
+    pypdfium2 `bitmap_maker` that reuses one native bitmap while the page size stays the same.
+
+    `PdfPage.render` clears the bitmap with `fill_rect` before drawing, so handing the same buffer to consecutive pages is safe as long as each page's image is saved before the next page is rendered. Pages of one Excel sheet PDF usually share a size, so this removes one full-page allocation per page.
+    """
+
+    def __init__(self, pdfium: ModuleType) -> None:
+        """Bind the maker to the pypdfium2 module used for rendering."""
+        self._pdfium = pdfium
+        self._key: tuple[int, int, int, bool] | None = None
+        self._bitmap: object = None
+        self.allocations = 0
+
+    def __call__(
+        self,
+        width: int,
+        height: int,
+        format: int,  # noqa: A002 - keyword name fixed by pypdfium2
+        rev_byteorder: bool = False,
+    ) -> object:
+        """Return the cached bitmap for this size and format, allocating on change."""
+        key = (width, height, format, rev_byteorder)
+        if key != self._key:
+            self._bitmap = self._pdfium.PdfBitmap.new_native(
+                width, height, format, rev_byteorder=rev_byteorder
+            )
+            self._key = key
+            self.allocations += 1
+        return self._bitmap
@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Literal, Protocol
+
+ImageFormat = Literal["png", "jpeg"]
+JPEG_QUALITY = 85
+IMAGE_SUFFIXES: dict[str, str] = {"png": ".png", "jpeg": ".jpg"}
+
+
+class PageImage(Protocol):
+    """Protocol for PIL images produced from rendered PDF pages."""
+
+    def save(self, fp: Path, **params: object) -> None:
+        """Write the image to `fp` using PIL save parameters."""
+
+
+def page_image_name(
+    sheet_index: int, page_index: int, safe_name: str, suffix: str
+) -> str:
+    """
+    Build the final output filename for one rendered page.
+
+    Pages of a multi-page sheet take consecutive numeric prefixes starting at the sheet's output index, so renderers can write each page under its final name and no rename pass is needed afterwards.
+    """
+    return f"{sheet_index + page_index + 1:02d}_{safe_name}{suffix}"
+
+
+def save_page_image(
+    pil_image: PageImage, img_path: Path, image_format: ImageFormat, dpi: int
+) -> None:
+    """Save one rendered page in the requested format."""
+    if image_format == "jpeg":
+        pil_image.save(
+            img_path,
+            format="JPEG",
+            quality=JPEG_QUALITY,
+            optimize=True,
+            dpi=(dpi, dpi),
+        )
+        return
+    # PIL emits the pHYs chunk for `dpi` with a single small write before IDAT.
+    # Injecting a precomputed chunk afterwards would mean rewriting the whole
+    # file, because chunks cannot be inserted in place, so keep PIL's path.
+    pil_image.save(img_path, format="PNG", dpi=(dpi, dpi))
@@ -5,7 +5,10 @@ from dataclasses import dataclass
 import json
 from pathlib import Path
 import sys
-from typing import Any
+from typing import Any, cast
+
+from ._bitmaps import ReusableBitmapMaker
+from ._images import IMAGE_SUFFIXES, ImageFormat, page_image_name, save_page_image
 
 
 @dataclass(frozen=True)
@@ -19,6 +22,7 @@ class RenderWorkerRequest:
     dpi: int
     started_path: Path
     result_path: Path
+    image_format: str = "png"
 
     @classmethod
     def from_payload(cls, payload: dict[str, Any]) -> RenderWorkerRequest:
@@ -31,6 +35,7 @@ class RenderWorkerRequest:
             dpi=int(payload["dpi"]),
             started_path=Path(str(payload["started_path"])),
             result_path=Path(str(payload["result_path"])),
+            image_format=str(payload.get("image_format", "png")),
         )
 
 
@@ -130,23 +135,25 @@ def _infer_result_path_from_request_file(request_file: Path | None) -> Path | No
 
 
 def _render_pdf_pages(request: RenderWorkerRequest) -> list[str]:
-    """Render all pages of one PDF to PNG files."""
+    """Render all pages of one PDF to PNG or JPEG files."""
     import pypdfium2 as pdfium
 
+    if request.image_format not in IMAGE_SUFFIXES:
+        raise ValueError(f"Unsupported image format: {request.image_format}")
+    image_format = cast(ImageFormat, request.image_format)
+    suffix = IMAGE_SUFFIXES[image_format]
     scale = request.dpi / 72.0
     request.output_dir.mkdir(parents=True, exist_ok=True)
     written: list[str] = []
+    bitmap_maker = ReusableBitmapMaker(pdfium)
     with pdfium.PdfDocument(str(request.pdf_path)) as pdf:
-        for page_index in range(len(pdf)):
-            page = pdf[page_index]
-            bitmap = page.render(scale=scale)
+        for page_index, page in enumerate(pdf):
+            bitmap = page.render(scale=scale, bitmap_maker=bitmap_maker)
             pil_image = bitmap.to_pil()
-            page_suffix = f"_p{page_index + 1:02d}" if page_index > 0 else ""
-            img_path = (
-                request.output_dir
-                / f"{request.sheet_index + 1:02d}_{request.safe_name}{page_suffix}.png"
+            img_path = request.output_dir / page_image_name(
+                request.sheet_index, page_index, request.safe_name, suffix
             )
-            pil_image.save(img_path, format="PNG", dpi=(request.dpi, request.dpi))
+            save_page_image(pil_image, img_path, image_format, request.dpi)
             written.append(str(img_path))
     return written
 
@@ -0,0 +1,99 @@
+"""Shared fixtures for backend tests.
+
+ComBackend tests in this package drive small in-process fakes of the Excel
+object model rather than a live Excel instance, so they stay unmarked and run
+on every platform. Tests that need real Excel use the ``com`` marker, which
+``tests/conftest.py`` skips off Windows or when Excel is unavailable.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from pathlib import Path
+import shutil
+
+from openpyxl import Workbook
+from openpyxl.styles import PatternFill
+import pytest
+
+from exstruct.core.backends import openpyxl_backend
+
+PatchOpenpyxlBackend = Callable[[str, object], None]
+
+
+@pytest.fixture
+def patch_openpyxl_backend(monkeypatch: pytest.MonkeyPatch) -> PatchOpenpyxlBackend:
+    """Return a helper that patches names on the openpyxl backend module.
+
+    The module object is bound once, so each patch is a plain ``setattr`` on it
+    instead of a dotted-path import walk, and ``monkeypatch`` undoes it.
+    """
+
+    def _patch(name: str, value: object) -> None:
+        monkeypatch.setattr(openpyxl_backend, name, value)
+
+    return _patch
+
+
+@pytest.fixture(scope="session")
+def colors_workbook_template(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Build the fill-color golden workbook once per session.
+
+    Sheet1 has solid fills FFFFFF (A1), AD3815 (B1), and 00FF00 (C1).
+    """
+    path = tmp_path_factory.mktemp("golden") / "colors.xlsx"
+    wb = Workbook()
+    ws = wb.active
+    ws.title = "Sheet1"
+    ws["A1"].fill = PatternFill(patternType="solid", fgColor="FFFFFF")
+    ws["B1"].fill = PatternFill(patternType="solid", fgColor="AD3815")
+    ws["C1"].fill = PatternFill(patternType="solid", fgColor="00FF00")
+    wb.save(path)
+    wb.close()
+    return path
+
+
+@pytest.fixture(scope="session")
+def merged_workbook_template(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Build the merged-cell golden workbook once per session.
+
+    Sheet1 has "Header" in A1 merged across A1:C1.
+    """
+    path = tmp_path_factory.mktemp("golden") / "merged.xlsx"
+    wb = Workbook()
+    ws = wb.active
+    ws.title = "Sheet1"
+    ws["A1"] = "Header"
+    ws.merge_cells("A1:C1")
+    wb.save(path)
+    wb.close()
+    return path
+
+
+@pytest.fixture(scope="session")
+def multi_print_area_workbook(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Build a workbook whose Sheet1 has print areas A1:B2 and D3:E4.
+
+    A1 holds "x" and D3 holds "y"; built with ``write_only=True``.
+    """
+    path = tmp_path_factory.mktemp("golden") / "multi_print_area.xlsx"
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet("Sheet1")
+    ws.append(["x"])
+    ws.append([])
+    ws.append([None, None, None, "y"])
+    ws.print_area = "A1:B2,D3:E4"
+    wb.save(path)
+    return path
+
+
+@pytest.fixture
+def colors_workbook(colors_workbook_template: Path, tmp_path: Path) -> Path:
+    """Return a per-test copy of the fill-color golden workbook."""
+    return Path(shutil.copy(colors_workbook_template, tmp_path / "colors.xlsx"))
+
+
+@pytest.fixture
+def merged_workbook(merged_workbook_template: Path, tmp_path: Path) -> Path:
+    """Return a per-test copy of the merged-cell golden workbook."""
+    return Path(shutil.copy(merged_workbook_template, tmp_path / "merged.xlsx"))
@@ -1,15 +1,19 @@
+from collections.abc import Callable, Iterator
+import os
 from pathlib import Path
 
 from _pytest.monkeypatch import MonkeyPatch
 from openpyxl import Workbook
+from tests.utils import parametrize
 
 from exstruct.core.backends.com_backend import ComBackend, _parse_print_area_range
 from exstruct.core.backends.openpyxl_backend import OpenpyxlBackend
 from exstruct.core.ranges import parse_range_zero_based
+from exstruct.core.workbook import load_openpyxl_workbook
 
 
 def test_openpyxl_backend_extract_cells_switches_link_mode(
-    monkeypatch: MonkeyPatch, tmp_path: Path
+    patch_openpyxl_backend: Callable[[str, object], None], tmp_path: Path
 ) -> None:
     calls: list[str] = []
 
@@ -17,136 +21,83 @@ def test_openpyxl_backend_extract_cells_switches_link_mode(
         calls.append("cells")
         return {}
 
-    def fake_cells_links(file_path: Path) -> dict[str, list[object]]:
+    def fake_cells_links(
+        file_path: Path, *, workbook: object | None = None
+    ) -> dict[str, list[object]]:
         calls.append("links")
         return {}
 
-    monkeypatch.setattr(
-        "exstruct.core.backends.openpyxl_backend.extract_sheet_cells",
-        fake_cells,
-    )
-    monkeypatch.setattr(
-        "exstruct.core.backends.openpyxl_backend.extract_sheet_cells_with_links",
-        fake_cells_links,
-    )
+    patch_openpyxl_backend("extract_sheet_cells", fake_cells)
+    patch_openpyxl_backend("extract_sheet_cells_with_links", fake_cells_links)
 
-    backend = OpenpyxlBackend(tmp_path / "book.xlsx")
-    backend.extract_cells(include_links=False)
-    backend.extract_cells(include_links=True)
+    file_path = tmp_path / "book.xlsx"
+    Workbook().save(file_path)
+    with OpenpyxlBackend(file_path) as backend:
+        backend.extract_cells(include_links=False)
+        backend.extract_cells(include_links=True)
 
     assert calls == ["cells", "links"]
 
 
 def test_openpyxl_backend_detect_tables_handles_failure(
-    monkeypatch: MonkeyPatch, tmp_path: Path
+    patch_openpyxl_backend: Callable[[str, object], None], tmp_path: Path
 ) -> None:
     def fake_detect(file_path: Path, sheet_name: str) -> list[str]:
         raise RuntimeError("boom")
 
-    monkeypatch.setattr(
-        "exstruct.core.backends.openpyxl_backend.detect_tables_openpyxl",
-        fake_detect,
-    )
+    patch_openpyxl_backend("detect_tables_openpyxl", fake_detect)
 
     backend = OpenpyxlBackend(tmp_path / "book.xlsx")
     assert backend.detect_tables("Sheet1") == []
 
 
-def test_openpyxl_backend_extract_colors_map_returns_none_on_failure(
-    monkeypatch: MonkeyPatch, tmp_path: Path
-) -> None:
-    def fake_colors_map(
-        file_path: Path,
-        *,
-        include_default_background: bool,
-        ignore_colors: set[str] | None,
-    ) -> object:
-        raise RuntimeError("boom")
+def _boom(*_args: object, **_kwargs: object) -> object:
+    raise RuntimeError("boom")
 
-    monkeypatch.setattr(
-        "exstruct.core.backends.openpyxl_backend.extract_sheet_colors_map",
-        fake_colors_map,
-    )
 
-    backend = OpenpyxlBackend(tmp_path / "book.xlsx")
-    assert (
-        backend.extract_colors_map(include_default_background=False, ignore_colors=None)
-        is None
+def _call_colors_map(backend: OpenpyxlBackend | ComBackend) -> object:
+    return backend.extract_colors_map(
+        include_default_background=False, ignore_colors=None
     )
 
 
-def test_openpyxl_backend_extract_formulas_map_returns_none_on_failure(
-    monkeypatch: MonkeyPatch, tmp_path: Path
-) -> None:
-    def fake_formulas_map(file_path: Path) -> object:
-        """
-        Test helper that always raises a RuntimeError to simulate a failure when extracting a formulas map.
+def _call_formulas_map(backend: OpenpyxlBackend | ComBackend) -> object:
+    return backend.extract_formulas_map()
 
-        Raises:
-            RuntimeError: with message "boom".
-        """
-        raise RuntimeError("boom")
 
-    monkeypatch.setattr(
-        "exstruct.core.backends.openpyxl_backend.extract_sheet_formulas_map",
-        fake_formulas_map,
-    )
+@parametrize(
+    "target,call",
+    [
+        ("extract_sheet_colors_map", _call_colors_map),
+        ("extract_sheet_formulas_map", _call_formulas_map),
+    ],
+)
+def test_openpyxl_backend_map_extraction_returns_none_on_failure(
+    patch_openpyxl_backend: Callable[[str, object], None],
+    tmp_path: Path,
+    target: str,
+    call: Callable[[OpenpyxlBackend], object],
+) -> None:
+    patch_openpyxl_backend(target, _boom)
 
     backend = OpenpyxlBackend(tmp_path / "book.xlsx")
-    assert backend.extract_formulas_map() is None
-
-
-def test_com_backend_extract_colors_map_returns_none_on_failure(
-    monkeypatch: MonkeyPatch,
+    assert call(backend) is None
+
+
+@parametrize(
+    "target,call",
+    [
+        ("extract_sheet_colors_map_com", _call_colors_map),
+        ("extract_sheet_formulas_map_com", _call_formulas_map),
+    ],
+)
+def test_com_backend_map_extraction_returns_none_on_failure(
+    monkeypatch: MonkeyPatch, target: str, call: Callable[[ComBackend], object]
 ) -> None:
-    def fake_colors_map(
-        workbook: object,
-        *,
-        include_default_background: bool,
-        ignore_colors: set[str] | None,
-    ) -> object:
-        raise RuntimeError("boom")
-
-    monkeypatch.setattr(
-        "exstruct.core.backends.com_backend.extract_sheet_colors_map_com",
-        fake_colors_map,
-    )
+    monkeypatch.setattr(f"exstruct.core.backends.com_backend.{target}", _boom)
 
-    class DummyWorkbook:
-        pass
-
-    backend = ComBackend(DummyWorkbook())
-    assert (
-        backend.extract_colors_map(include_default_background=False, ignore_colors=None)
-        is None
-    )
-
-
-def test_com_backend_extract_formulas_map_returns_none_on_failure(
-    monkeypatch: MonkeyPatch,
-) -> None:
-    def fake_formulas_map(workbook: object) -> object:
-        """
-        Test stub that simulates a failure by always raising a RuntimeError.
-
-        Parameters:
-            workbook (object): Workbook-like object (ignored); present to match the real function's signature.
-
-        Raises:
-            RuntimeError: Always raised with message "boom".
-        """
-        raise RuntimeError("boom")
-
-    monkeypatch.setattr(
-        "exstruct.core.backends.com_backend.extract_sheet_formulas_map_com",
-        fake_formulas_map,
-    )
-
-    class DummyWorkbook:
-        pass
-
-    backend = ComBackend(DummyWorkbook())
-    assert backend.extract_formulas_map() is None
+    backend = ComBackend(object())
+    assert call(backend) is None
 
 
 def test_com_backend_extract_print_areas_handles_sheet_error(
@@ -171,24 +122,30 @@ def test_com_backend_extract_print_areas_handles_sheet_error(
     assert backend.extract_print_areas() == {}
 
 
-def test_openpyxl_backend_extract_print_areas(tmp_path: Path) -> None:
+def _make_fake_workbook_with_print_area(print_area: str = "A1:B2") -> Workbook:
+    """Build an in-memory workbook whose only content is a sheet print area."""
+    wb = Workbook()
+    ws = wb.active
+    ws.title = "Sheet1"
+    ws.print_area = print_area
+    return wb
+
+
+def test_openpyxl_backend_extract_print_areas(
+    patch_openpyxl_backend: Callable[[str, object], None], tmp_path: Path
+) -> None:
     """
     Verifies that OpenpyxlBackend.extract_print_areas reads an openpyxl workbook's print area and returns the corresponding zero-based ranges keyed by sheet name.
 
-    Creates an in-memory workbook with a single sheet named "Sheet1", sets its print area to "A1:B2", saves and loads it via OpenpyxlBackend, then asserts the sheet is present, has at least one area, and that the first area's r1 and c1 are 1 and 0 respectively.
+    Serves a handcrafted in-memory workbook with "Sheet1" and print area "A1:B2" from the backend's loader (the file on disk only provides an mtime), then asserts the sheet is present, has at least one area, and that the first area's r1 and c1 are 1 and 0 respectively. The save/load round trip is covered by the read-only loading test.
     """
-    wb = Workbook()
-    ws = wb.active
-    ws.title = "Sheet1"
-    ws.append(["A", "B"])
-    ws.append([1, 2])
-    ws.print_area = "A1:B2"
+    wb = _make_fake_workbook_with_print_area()
+    patch_openpyxl_backend("load_openpyxl_workbook", lambda *_a, **_k: wb)
     file_path = tmp_path / "print_area.xlsx"
-    wb.save(file_path)
-    wb.close()
+    file_path.touch()
 
-    backend = OpenpyxlBackend(file_path)
-    areas = backend.extract_print_areas()
+    with OpenpyxlBackend(file_path) as backend:
+        areas = backend.extract_print_areas()
     assert "Sheet1" in areas
     assert areas["Sheet1"]
     assert areas["Sheet1"][0].r1 == 1
@@ -196,7 +153,7 @@ def test_openpyxl_backend_extract_print_areas(tmp_path: Path) -> None:
 
 
 def test_openpyxl_backend_extract_print_areas_returns_empty_on_error(
-    monkeypatch: MonkeyPatch, tmp_path: Path
+    patch_openpyxl_backend: Callable[[str, object], None], tmp_path: Path
 ) -> None:
     """
     Ensure OpenpyxlBackend.extract_print_areas returns an empty dict when the workbook loader raises an error.
@@ -207,13 +164,88 @@ def test_openpyxl_backend_extract_print_areas_returns_empty_on_error(
     def _raise(*_args: object, **_kwargs: object) -> None:
         raise RuntimeError("boom")
 
-    monkeypatch.setattr(
-        "exstruct.core.backends.openpyxl_backend.openpyxl_workbook", _raise
-    )
+    patch_openpyxl_backend("load_openpyxl_workbook", _raise)
     backend = OpenpyxlBackend(tmp_path / "book.xlsx")
     assert backend.extract_print_areas() == {}
 
 
+def test_openpyxl_backend_reuses_loaded_workbook(
+    patch_openpyxl_backend: Callable[[str, object], None], tmp_path: Path
+) -> None:
+    """Load the workbook once across extract_* calls and reload after a rewrite."""
+    wb = Workbook()
+    ws = wb.active
+    ws.title = "Sheet1"
+    ws["A1"] = "Header"
+    ws.merge_cells("A1:B1")
+    ws.print_area = "A1:B2"
+    file_path = tmp_path / "book.xlsx"
+    wb.save(file_path)
+
+    loads: list[tuple[bool, bool]] = []
+    real_load = load_openpyxl_workbook
+
+    def _counting_load(
+        path: Path, *, data_only: bool, read_only: bool, keep_links: bool = True
+    ) -> object:
+        loads.append((data_only, read_only))
+        return real_load(
+            path, data_only=data_only, read_only=read_only, keep_links=keep_links
+        )
+
+    patch_openpyxl_backend("load_openpyxl_workbook", _counting_load)
+
+    with OpenpyxlBackend(file_path) as backend:
+        assert backend.extract_colors_map(
+            include_default_background=False, ignore_colors=None
+        )
+        assert backend.extract_merged_cells()["Sheet1"]
+        assert backend.extract_print_areas()["Sheet1"]
+        assert loads == [(True, False)]
+
+        wb.save(file_path)
+        stat = file_path.stat()
+        os.utime(file_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        assert backend.extract_print_areas()["Sheet1"]
+        assert loads == [(True, False), (True, True)]
+    assert backend._workbooks == {}
+
+
+def test_openpyxl_backend_compares_by_identity(tmp_path: Path) -> None:
+    """Backends owning separate workbook caches are never equal or merged."""
+    file_path = tmp_path / "book.xlsx"
+    first = OpenpyxlBackend(file_path)
+    second = OpenpyxlBackend(file_path)
+
+    assert first != second
+    assert len({first, second}) == 2
+
+
+def test_openpyxl_backend_extract_print_areas_loads_read_only(
+    patch_openpyxl_backend: Callable[[str, object], None], tmp_path: Path
+) -> None:
+    """Read print areas from a read-only, data-only load without external links."""
+    wb = Workbook()
+    wb.active.print_area = "B2:C3"
+    file_path = tmp_path / "book.xlsx"
+    wb.save(file_path)
+
+    options: list[dict[str, bool]] = []
+    real_load = load_openpyxl_workbook
+
+    def _recording_load(path: Path, **kwargs: bool) -> object:
+        options.append(kwargs)
+        return real_load(path, **kwargs)
+
+    patch_openpyxl_backend("load_openpyxl_workbook", _recording_load)
+
+    with OpenpyxlBackend(file_path) as backend:
+        areas = backend.extract_print_areas()
+
+    assert options == [{"data_only": True, "read_only": True, "keep_links": False}]
+    assert [(a.r1, a.c1, a.r2, a.c2) for a in areas["Sheet"]] == [(2, 1, 3, 2)]
+
+
 def test_parse_range_zero_based_parses_sheet_prefix() -> None:
     bounds = parse_range_zero_based("Sheet1!A1:B2")
     assert bounds is not None
@@ -223,6 +255,20 @@ def test_parse_range_zero_based_parses_sheet_prefix() -> None:
     assert bounds.c2 == 1
 
 
+def test_parse_range_zero_based_memoizes_repeated_ranges() -> None:
+    parse_range_zero_based.cache_clear()
+    first = parse_range_zero_based("A1:B2")
+    second = parse_range_zero_based("A1:B2")
+    assert first is second
+    assert parse_range_zero_based.cache_info().hits == 1
+    assert parse_range_zero_based("INVALID") is None
+
+
+@parametrize("range_str", ["INVALID", "#REF!", "A:C", "$1:$3", "Sheet1!"])
+def test_parse_range_zero_based_rejects_unbounded_or_junk(range_str: str) -> None:
+    assert parse_range_zero_based(range_str) is None
+
+
 def test_com_backend_extract_print_areas_success() -> None:
     class _PageSetup:
         PrintArea = "A1:B2,INVALID"
@@ -246,6 +292,28 @@ def test_com_backend_extract_print_areas_success() -> None:
     assert areas["Sheet1"][0].c2 == 1
 
 
+def test_com_backend_extract_print_areas_skips_unset_print_area() -> None:
+    class _PageSetup:
+        PrintArea = ""
+
+    class _SheetApi:
+        PageSetup = _PageSetup()
+
+        @property
+        def UsedRange(self) -> object:
+            raise AssertionError("UsedRange must not be read for print areas")
+
+    class _Sheet:
+        name = "Sheet1"
+        api = _SheetApi()
+
+    class _DummyWorkbook:
+        sheets = [_Sheet()]
+
+    backend = ComBackend(_DummyWorkbook())
+    assert backend.extract_print_areas() == {}
+
+
 def test_com_backend_parse_print_area_range_invalid() -> None:
     assert _parse_print_area_range("INVALID") is None
 
@@ -298,6 +366,10 @@ class _Breaks:
         """
         return self._items[index - 1]
 
+    def __iter__(self) -> Iterator[_BreakItem]:
+        """Enumerate break items the way a COM ``IEnumVARIANT`` would."""
+        return iter(self._items)
+
 
 class _RangeRows:
     def __init__(self, count: int) -> None:
@@ -396,6 +468,57 @@ def test_com_backend_extract_auto_page_breaks_success() -> None:
     assert areas["Sheet1"]
 
 
+class _NameCountingSheet:
+    def __init__(self) -> None:
+        """Create a sheet double that counts how often its name is read."""
+        self.api = _SheetApi()
+        self.name_reads = 0
+
+    @property
+    def name(self) -> str:
+        """Return the sheet name, counting the (COM round-trip) read."""
+        self.name_reads += 1
+        return "Sheet1"
+
+
+def test_com_backend_extract_auto_page_breaks_reads_sheet_once() -> None:
+    """Read each sheet's name and page breaks once, not once per rectangle."""
+
+    sheet = _NameCountingSheet()
+
+    class _CountingWorkbook:
+        sheets = [sheet]
+
+    areas = ComBackend(_CountingWorkbook()).extract_auto_page_breaks()
+
+    assert [(a.r1, a.c1, a.r2, a.c2) for a in areas["Sheet1"]] == [
+        (1, 0, 1, 0),
+        (1, 1, 1, 1),
+        (2, 0, 2, 0),
+        (2, 1, 2, 1),
+    ]
+    assert sheet.name_reads == 1
+    assert sheet.api.DisplayPageBreaks is False
+
+
+def test_com_backend_caches_sheet_names_across_calls() -> None:
+    """Reuse the sheet list across extract_* calls until invalidate() is called."""
+
+    sheet = _NameCountingSheet()
+
+    class _CountingWorkbook:
+        sheets = [sheet]
+
+    backend = ComBackend(_CountingWorkbook())
+    assert backend.extract_print_areas()["Sheet1"]
+    assert backend.extract_auto_page_breaks()["Sheet1"]
+    assert sheet.name_reads == 1
+
+    backend.invalidate()
+    backend.extract_print_areas()
+    assert sheet.name_reads == 2
+
+
 class _RestoreErrorSheetApi:
     def __init__(self) -> None:
         """
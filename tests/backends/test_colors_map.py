@@ -1,34 +1,12 @@
 from pathlib import Path
 
-from openpyxl import Workbook
-from openpyxl.styles import PatternFill
-
 from exstruct.core.cells import extract_sheet_colors_map
 
 
-def _write_color_workbook(path: Path) -> None:
-    """Create a workbook with predefined fill colors for testing.
-
-    Args:
-        path: Target path to save the workbook.
-    """
-    wb = Workbook()
-    ws = wb.active
-    ws.title = "Sheet1"
-    ws["A1"].fill = PatternFill(patternType="solid", fgColor="FFFFFF")
-    ws["B1"].fill = PatternFill(patternType="solid", fgColor="AD3815")
-    ws["C1"].fill = PatternFill(patternType="solid", fgColor="00FF00")
-    wb.save(path)
-    wb.close()
-
-
-def test_colors_map_excludes_default_background(tmp_path: Path) -> None:
+def test_colors_map_excludes_default_background(colors_workbook: Path) -> None:
     """Exclude default background when include_default_background is False."""
-    path = tmp_path / "colors.xlsx"
-    _write_color_workbook(path)
-
     data = extract_sheet_colors_map(
-        path, include_default_background=False, ignore_colors=None
+        colors_workbook, include_default_background=False, ignore_colors=None
     )
     sheet = data.get_sheet("Sheet1")
     assert sheet is not None
@@ -37,13 +15,10 @@ def test_colors_map_excludes_default_background(tmp_path: Path) -> None:
     assert "00FF00" in sheet.colors_map
 
 
-def test_colors_map_ignores_configured_colors(tmp_path: Path) -> None:
+def test_colors_map_ignores_configured_colors(colors_workbook: Path) -> None:
     """Ignore configured colors during colors_map extraction."""
-    path = tmp_path / "colors.xlsx"
-    _write_color_workbook(path)
-
     data = extract_sheet_colors_map(
-        path,
+        colors_workbook,
         include_default_background=True,
         ignore_colors={"#ad3815", "00ff00"},
     )
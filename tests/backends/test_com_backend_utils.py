@@ -1,7 +1,12 @@
+from array import array
+from collections.abc import Iterator
+
 from tests.utils import parametrize
 
 from exstruct.core.backends.com_backend import (
+    _break_spans,
     _normalize_area_for_sheet,
+    _read_page_break_locations,
     _split_csv_respecting_quotes,
 )
 
@@ -14,6 +19,8 @@ from exstruct.core.backends.com_backend import (
         ("'Sheet,1'!A1:B2,'Sheet2'!C3:D4", ["'Sheet,1'!A1:B2", "'Sheet2'!C3:D4"]),
         ("'O''Brien'!A1,'X'!B2", ["'O''Brien'!A1", "'X'!B2"]),
         ("OnlyOne", ["OnlyOne"]),
+        ("A1, ,B2,", ["A1", "B2"]),
+        ("Sheet1!A1,'Unclosed,Sheet!B2", ["Sheet1!A1", "'Unclosed,Sheet!B2"]),
     ],
 )
 def test_split_csv_respecting_quotes(raw: str, expected: list[str]) -> None:
@@ -29,6 +36,8 @@ def test_split_csv_respecting_quotes(raw: str, expected: list[str]) -> None:
         ("'O''Brien'!A1", "O'Brien", "A1"),
         ("A1:B2", "Sheet1", "A1:B2"),
         ("Sheet1!A1:B2", "Other", None),
+        ("'Q1!Q2'!C3", "Q1!Q2", "C3"),
+        ("  'Sheet 1'  !A1", "Sheet 1", "A1"),
     ],
 )
 def test_normalize_area_for_sheet(
@@ -36,3 +45,63 @@ def test_normalize_area_for_sheet(
 ) -> None:
     """対象シート名のみレンジを返し、異なる場合は None を返す。"""
     assert _normalize_area_for_sheet(part, ws_name) == expected
+
+
+@parametrize(
+    "start,end,breaks,expected",
+    [
+        (1, 10, [], [(1, 10)]),
+        (1, 10, [5], [(1, 4), (5, 10)]),
+        (3, 8, [1, 3, 6, 9, 20], [(3, 5), (6, 8)]),
+        (1, 10, [2, 11], [(1, 1), (2, 10)]),
+    ],
+)
+def test_break_spans(
+    start: int, end: int, breaks: list[int], expected: list[tuple[int, int]]
+) -> None:
+    """範囲内の改ページ位置だけで分割する。"""
+    assert _break_spans(start, end, array("i", breaks)) == expected
+
+
+class _Location:
+    def __init__(self, row: int) -> None:
+        self.Row = row
+
+
+class _Break:
+    def __init__(self, row: int) -> None:
+        self.Location = _Location(row)
+
+
+class _IndexedBreaks:
+    """Item/Count だけを持つ COM コレクションの代替。"""
+
+    def __init__(self, rows: list[int]) -> None:
+        self._items = [_Break(row) for row in rows]
+        self.Count = len(rows)
+        self.item_calls = 0
+
+    def Item(self, index: int) -> _Break:
+        self.item_calls += 1
+        return self._items[index - 1]
+
+
+class _EnumerableBreaks(_IndexedBreaks):
+    """列挙 (IEnumVARIANT) に対応した COM コレクションの代替。"""
+
+    def __iter__(self) -> Iterator[_Break]:
+        return iter(self._items)
+
+
+def test_read_page_break_locations_prefers_enumeration() -> None:
+    """列挙可能なら Item(i) を呼ばずに読み、位置を昇順に並べる。"""
+    breaks = _EnumerableBreaks([30, 10, 20])
+    assert list(_read_page_break_locations(breaks, "Row")) == [10, 20, 30]
+    assert breaks.item_calls == 0
+
+
+def test_read_page_break_locations_falls_back_to_item() -> None:
+    """列挙できないコレクションは Item(i) で読む。"""
+    breaks = _IndexedBreaks([5, 2])
+    assert list(_read_page_break_locations(breaks, "Row")) == [2, 5]
+    assert breaks.item_calls == 2
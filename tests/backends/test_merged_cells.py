@@ -1,50 +1,62 @@
+from collections.abc import Callable
 from pathlib import Path
 from typing import cast
 
-from _pytest.monkeypatch import MonkeyPatch
 from openpyxl import Workbook
 import pytest
 import xlwings as xw
 
 from exstruct.core.backends.com_backend import ComBackend
 from exstruct.core.backends.openpyxl_backend import OpenpyxlBackend
-from exstruct.core.cells import MergedCellRange
+from exstruct.core.cells import MergedCellRange, extract_sheet_merged_cells
 
 
-def _make_merged_book(path: Path) -> None:
-    """Create a test workbook with a merged cell range.
+def test_openpyxl_backend_extract_merged_cells(merged_workbook: Path) -> None:
+    with OpenpyxlBackend(merged_workbook) as backend:
+        merged = backend.extract_merged_cells()
+    assert merged["Sheet1"] == [MergedCellRange(r1=1, c1=0, r2=1, c2=2, v="Header")]
 
-    Args:
-        path: Path where the workbook will be saved.
-    """
-    wb = Workbook()
-    ws = wb.active
-    ws.title = "Sheet1"
-    ws["A1"] = "Header"
-    ws.merge_cells("A1:C1")
-    wb.save(path)
-    wb.close()
 
+def test_openpyxl_backend_merged_cells_skip_workbook_load(
+    patch_openpyxl_backend: Callable[[str, object], None], merged_workbook: Path
+) -> None:
+    """Merged cells alone are read from the XML without loading a workbook."""
 
-def test_openpyxl_backend_extract_merged_cells(tmp_path: Path) -> None:
-    path = tmp_path / "merged.xlsx"
-    _make_merged_book(path)
+    def _fail_load(*_args: object, **_kwargs: object) -> object:
+        raise AssertionError("workbook should not be loaded")
 
-    backend = OpenpyxlBackend(path)
-    merged = backend.extract_merged_cells()
+    patch_openpyxl_backend("load_openpyxl_workbook", _fail_load)
+    with OpenpyxlBackend(merged_workbook) as backend:
+        merged = backend.extract_merged_cells()
     assert merged["Sheet1"] == [MergedCellRange(r1=1, c1=0, r2=1, c2=2, v="Header")]
 
 
+def test_extract_sheet_merged_cells_limits_to_sheet_names(tmp_path: Path) -> None:
+    wb = Workbook()
+    first = wb.active
+    first.title = "Sheet1"
+    first.merge_cells("A1:B1")
+    wb.create_sheet("Sheet2").merge_cells("C3:D4")
+
+    merged = extract_sheet_merged_cells(
+        tmp_path / "unused.xlsx", workbook=wb, sheet_names={"Sheet2", "Missing"}
+    )
+
+    assert merged == {"Sheet2": [MergedCellRange(r1=3, c1=2, r2=4, c2=3, v=" ")]}
+
+
+def test_merged_cell_range_uses_slots() -> None:
+    merged = MergedCellRange(r1=1, c1=0, r2=1, c2=2, v="Header")
+    assert not hasattr(merged, "__dict__")
+
+
 def test_openpyxl_backend_extract_merged_cells_handles_failure(
-    monkeypatch: MonkeyPatch, tmp_path: Path
+    patch_openpyxl_backend: Callable[[str, object], None], tmp_path: Path
 ) -> None:
     def _boom(_path: Path) -> dict[str, list[MergedCellRange]]:
         raise RuntimeError("boom")
 
-    monkeypatch.setattr(
-        "exstruct.core.backends.openpyxl_backend.extract_sheet_merged_cells",
-        _boom,
-    )
+    patch_openpyxl_backend("extract_sheet_merged_cells", _boom)
     backend = OpenpyxlBackend(tmp_path / "missing.xlsx")
     assert backend.extract_merged_cells() == {}
 
@@ -1,6 +1,7 @@
+from collections.abc import Callable
 from pathlib import Path
 
-from openpyxl import Workbook
+from tests.utils import parametrize
 
 from exstruct import extract
 from exstruct.core.backends.base import PrintAreaData
@@ -13,50 +14,24 @@ from exstruct.core.backends.openpyxl_backend import (
 )
 
 
-def _make_book_with_print_area(path: Path) -> None:
-    """
-    Create a simple Excel workbook with a single sheet named "Sheet1", set its print area to "A1:B2", write "x" to cell A1, save it to the given path, and close the file.
+def _ranges_via_light_extract(path: Path) -> list[tuple[int, int, int, int]]:
+    wb_data = extract(path, mode="light")
+    return [(a.r1, a.c1, a.r2, a.c2) for a in wb_data.sheets["Sheet1"].print_areas]
 
-    Parameters:
-        path (Path): Filesystem path where the workbook will be saved.
-    """
-    wb = Workbook()
-    ws = wb.active
-    ws.title = "Sheet1"
-    ws["A1"] = "x"
-    ws.print_area = "A1:B2"
-    wb.save(path)
-    wb.close()
 
+def _ranges_via_backend(path: Path) -> list[tuple[int, int, int, int]]:
+    with OpenpyxlBackend(path) as backend:
+        areas = backend.extract_print_areas()
+    return [(a.r1, a.c1, a.r2, a.c2) for a in areas["Sheet1"]]
 
-def test_light_mode_includes_print_areas_without_com(tmp_path: Path) -> None:
-    path = tmp_path / "book.xlsx"
-    _make_book_with_print_area(path)
 
-    wb_data = extract(path, mode="light")
-    areas = wb_data.sheets["Sheet1"].print_areas
-    assert len(areas) == 1
-    area = areas[0]
-    assert (area.r1, area.c1, area.r2, area.c2) == (1, 0, 2, 1)
-
-
-def test_openpyxl_backend_multiple_print_areas(tmp_path: Path) -> None:
-    path = tmp_path / "multi_print_area.xlsx"
-    wb = Workbook()
-    ws = wb.active
-    ws.title = "Sheet1"
-    ws["A1"] = "x"
-    ws["D3"] = "y"
-    ws.print_area = "A1:B2,D3:E4"
-    wb.save(path)
-    wb.close()
-
-    backend = OpenpyxlBackend(path)
-    areas = backend.extract_print_areas()
-
-    assert "Sheet1" in areas
-    ranges = [(a.r1, a.c1, a.r2, a.c2) for a in areas["Sheet1"]]
-    assert ranges == [(1, 0, 2, 1), (3, 3, 4, 4)]
+@parametrize("read_ranges", [_ranges_via_light_extract, _ranges_via_backend])
+def test_print_areas_without_com(
+    multi_print_area_workbook: Path,
+    read_ranges: Callable[[Path], list[tuple[int, int, int, int]]],
+) -> None:
+    """Read every print area range of Sheet1 without COM."""
+    assert read_ranges(multi_print_area_workbook) == [(1, 0, 2, 1), (3, 3, 4, 4)]
 
 
 def test_extract_print_areas_from_defined_names_filters_unknown_sheets() -> None:
@@ -122,3 +97,17 @@ def test_append_print_areas_skips_invalid_ranges() -> None:
     _append_print_areas(areas, "Sheet1", "A1:B2,INVALID")
     assert "Sheet1" in areas
     assert len(areas["Sheet1"]) == 1
+
+
+def test_append_print_areas_ignores_empty_range() -> None:
+    """Leave the mapping untouched when the range string is empty."""
+    areas: PrintAreaData = {}
+    _append_print_areas(areas, "Sheet1", "")
+    assert areas == {}
+
+
+def test_append_print_areas_omits_sheet_without_valid_ranges() -> None:
+    """Do not register a sheet whose ranges all fail to parse."""
+    areas: PrintAreaData = {}
+    _append_print_areas(areas, "Sheet1", "INVALID,#REF!")
+    assert areas == {}
@@ -2,11 +2,13 @@
 
 from collections.abc import Callable, Iterator
 from contextlib import contextmanager, redirect_stderr, redirect_stdout
+from functools import lru_cache
 from importlib import util
 import io
 import json
 import os
 from pathlib import Path
+import re
 from typing import TypeVar, cast
 
 from openpyxl import Workbook
@@ -14,32 +16,48 @@ from pydantic import BaseModel
 import pytest
 
 from exstruct.cli.availability import ComAvailability
-from exstruct.cli.main import build_parser, main as cli_main
+from exstruct.cli.main import _default_parser, build_parser, main as cli_main
 
 F = TypeVar("F", bound=Callable[..., object])
 render = cast(Callable[[F], F], pytest.mark.render)
 
-_ALLOWED_CLI_FLAGS: set[str] = {
-    "-f",
-    "-o",
-    "--auto-page-breaks-dir",
-    "--format",
-    "--include-backend-metadata",
-    "--image",
-    "--mode",
-    "--pdf",
-    "--print-areas-dir",
-}
+_ALLOWED_CLI_FLAGS: frozenset[str] = frozenset(
+    {
+        "-f",
+        "-o",
+        "--auto-page-breaks-dir",
+        "--format",
+        "--include-backend-metadata",
+        "--image",
+        "--mode",
+        "--pdf",
+        "--print-areas-dir",
+    }
+)
+_CONTROL_CHARS_RE = re.compile(r"[\x00\n\r]")
 
 
 class CliResult(BaseModel):
     """Result of running the CLI inside the test process."""
 
     returncode: int
-    stdout: bytes | str
-    stderr: bytes | str
+    stdout: str
+    stderr: str
 
+    @property
+    def stdout_bytes(self) -> bytes:
+        """Return stdout encoded as UTF-8, computed only when requested."""
+        return self.stdout.encode("utf-8")
 
+
+@lru_cache(maxsize=1)
+def _yaml_available() -> bool:
+    """Return whether the PyYAML dependency is importable."""
+
+    return util.find_spec("yaml") is not None
+
+
+@lru_cache(maxsize=1)
 def _toon_available() -> bool:
     """Return whether the TOON dependency is importable."""
 
@@ -51,85 +69,79 @@ def _toon_available() -> bool:
         return False
 
 
-def _prepare_sample_excel(tmp_path: Path) -> Path:
-    """Prepare a minimal Excel workbook for CLI tests.
+@pytest.fixture(scope="session")
+def sample_xlsx(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Prepare a minimal Excel workbook once for CLI tests.
 
     Args:
-        tmp_path: Temporary directory provided by pytest for test artifacts.
+        tmp_path_factory: Session-scoped temporary directory factory.
 
     Returns:
         Path to a workbook copied from the repository sample when available or
         a generated fallback workbook created with openpyxl.
     """
     sample = Path("sample") / "sample.xlsx"
-    dest = tmp_path / "sample.xlsx"
+    dest = tmp_path_factory.mktemp("cli") / "sample.xlsx"
     if sample.exists():
         import shutil
 
         shutil.copy(sample, dest)
         return dest
 
-    wb = Workbook()
-    ws = wb.active
-    ws.title = "Sheet1"
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet("Sheet1")
     ws.append(["A", "B"])
     ws.append([1, 2])
     wb.save(dest)
-    wb.close()
     return dest
 
 
-def _prepare_print_area_excel(tmp_path: Path) -> Path:
-    """Prepare a workbook with a defined print area for CLI print-area tests.
+@pytest.fixture(scope="session")
+def print_area_xlsx(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Prepare a workbook with a defined print area once for CLI tests.
 
     Args:
-        tmp_path: Temporary directory provided by pytest for test artifacts.
+        tmp_path_factory: Session-scoped temporary directory factory.
 
     Returns:
         Path to the generated workbook that defines a print area on ``Sheet1``.
     """
-    wb = Workbook()
-    ws = wb.active
-    ws.title = "Sheet1"
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet("Sheet1")
     ws.append(["A", "B"])
     ws.append([1, 2])
     ws.print_area = "A1:B2"
-    dest = tmp_path / "print_area.xlsx"
+    dest = tmp_path_factory.mktemp("cli") / "print_area.xlsx"
     wb.save(dest)
-    wb.close()
     return dest
 
 
-def _prepare_unicode_excel(tmp_path: Path) -> Path:
-    """Create a workbook containing varied Unicode characters for CLI tests.
+@pytest.fixture(scope="session")
+def unicode_xlsx(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Create a workbook containing varied Unicode characters once for CLI tests.
 
     Args:
-        tmp_path: Temporary directory provided by pytest for test artifacts.
+        tmp_path_factory: Session-scoped temporary directory factory.
 
     Returns:
         Path to the generated Excel workbook that includes mixed Unicode
         content such as Japanese text, check marks, and emoji.
     """
 
-    wb = Workbook()
-    ws = wb.active
-    ws.title = "ユニコード"
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet("ユニコード")
     ws.append(["ラベル", "値"])
     ws.append(["チェック", "☑︎ テスト ✓ こんにちは 🌸"])
-    dest = tmp_path / "unicode.xlsx"
+    dest = tmp_path_factory.mktemp("cli") / "unicode.xlsx"
     wb.save(dest)
-    wb.close()
     return dest
 
 
-def _run_cli(
-    args: list[str], *, text: bool = True, env: dict[str, str] | None = None
-) -> CliResult:
+def _run_cli(args: list[str], *, env: dict[str, str] | None = None) -> CliResult:
     """Execute the ExStruct CLI with a fixed command prefix.
 
     Args:
         args: Argument list appended after the module invocation.
-        text: Whether to decode stdout/stderr as text.
         env: Optional environment variables overriding the current process.
 
     Returns:
@@ -146,14 +158,10 @@ def _run_cli(
     ):
         returncode = cli_main(argv=safe_args)
 
-    stdout_text = stdout_buffer.getvalue()
-    stderr_text = stderr_buffer.getvalue()
-    if text:
-        return CliResult(returncode=returncode, stdout=stdout_text, stderr=stderr_text)
     return CliResult(
         returncode=returncode,
-        stdout=stdout_text.encode("utf-8"),
-        stderr=stderr_text.encode("utf-8"),
+        stdout=stdout_buffer.getvalue(),
+        stderr=stderr_buffer.getvalue(),
     )
 
 
@@ -185,13 +193,10 @@ def _stdout_text(result: CliResult) -> str:
         result: Completed CLI result.
 
     Returns:
-        Decoded stdout string or empty string when stdout is absent.
+        Captured stdout string or empty string when stdout is absent.
     """
 
-    stdout = result.stdout
-    if isinstance(stdout, bytes):
-        return stdout.decode("utf-8", errors="replace")
-    return stdout
+    return result.stdout
 
 
 def _stderr_text(result: CliResult) -> str:
@@ -201,13 +206,10 @@ def _stderr_text(result: CliResult) -> str:
         result: Completed CLI result.
 
     Returns:
-        Decoded stderr string or empty string when stderr is absent.
+        Captured stderr string or empty string when stderr is absent.
     """
 
-    stderr = result.stderr
-    if isinstance(stderr, bytes):
-        return stderr.decode("utf-8", errors="replace")
-    return stderr
+    return result.stderr
 
 
 def _ensure_no_control_chars(arg: str) -> None:
@@ -220,7 +222,7 @@ def _ensure_no_control_chars(arg: str) -> None:
         ValueError: If control characters are found.
     """
 
-    if "\x00" in arg or "\n" in arg or "\r" in arg:
+    if _CONTROL_CHARS_RE.search(arg):
         msg = "CLI arguments must not contain control characters"
         raise ValueError(msg)
 
@@ -245,41 +247,52 @@ def _temporary_env(env: dict[str, str] | None) -> Iterator[None]:
     """Temporarily override environment variables for CLI execution.
 
     Args:
-        env: Environment mapping to apply for the duration of the context.
+        env: Variables to set for the duration of the context. Only these
+            keys are saved and restored afterwards.
     """
 
     if env is None:
         yield
         return
-    original = os.environ.copy()
-    os.environ.clear()
+    saved = {key: os.environ.get(key) for key in env}
     os.environ.update(env)
     try:
         yield
     finally:
-        os.environ.clear()
-        os.environ.update(original)
+        for key, value in saved.items():
+            if value is None:
+                os.environ.pop(key, None)
+            else:
+                os.environ[key] = value
+
 
+@pytest.mark.parametrize(  # type: ignore[misc]
+    "arg", ["a\x00b", "line\nbreak", "carriage\rreturn", "--unknown"]
+)
+def test_sanitize_cli_args_rejects_unsafe_arguments(arg: str) -> None:
+    """Reject control characters and flags outside the allowlist."""
 
-def test_CLIでjson出力が成功する(tmp_path: Path) -> None:
+    with pytest.raises(ValueError):
+        _sanitize_cli_args(["book.xlsx", arg])
+
+
+def test_CLIでjson出力が成功する(tmp_path: Path, sample_xlsx: Path) -> None:
     """Test that the CLI writes JSON output successfully."""
 
-    xlsx = _prepare_sample_excel(tmp_path)
     out_json = tmp_path / "out.json"
-    result = _run_cli([str(xlsx), "-o", str(out_json)])
+    result = _run_cli([str(sample_xlsx), "-o", str(out_json)])
     assert result.returncode == 0
     assert out_json.exists()
     # stdout may be empty when writing to a file; ensure no errors surfaced
     assert "Error" not in _stdout_text(result)
 
 
-def test_CLIでyamlやtoon指定は未サポート(tmp_path: Path) -> None:
+def test_CLIでyamlやtoon指定は未サポート(tmp_path: Path, sample_xlsx: Path) -> None:
     """Test YAML and TOON CLI handling based on optional dependencies."""
 
-    xlsx = _prepare_sample_excel(tmp_path)
     out_yaml = tmp_path / "out.yaml"
-    result = _run_cli([str(xlsx), "-o", str(out_yaml), "-f", "yaml"])
-    if util.find_spec("yaml") is not None:
+    result = _run_cli([str(sample_xlsx), "-o", str(out_yaml), "-f", "yaml"])
+    if _yaml_available():
         assert result.returncode == 0
         assert out_yaml.exists()
     else:
@@ -287,7 +300,7 @@ def test_CLIでyamlやtoon指定は未サポート(tmp_path: Path) -> None:
         assert "pyyaml" in _stdout_text(result) or "pyyaml" in _stderr_text(result)
 
     out_toon = tmp_path / "out.toon"
-    result = _run_cli([str(xlsx), "-o", str(out_toon), "-f", "toon"])
+    result = _run_cli([str(sample_xlsx), "-o", str(out_toon), "-f", "toon"])
     if _toon_available():
         assert result.returncode == 0
         assert out_toon.exists()
@@ -297,18 +310,18 @@ def test_CLIでyamlやtoon指定は未サポート(tmp_path: Path) -> None:
 
 
 @render
-def test_CLIでpdfと画像が出力される(tmp_path: Path) -> None:
+def test_CLIでpdfと画像が出力される(tmp_path: Path, sample_xlsx: Path) -> None:
     """Test that the CLI exports PDF and PNG artifacts."""
 
-    xlsx = _prepare_sample_excel(tmp_path)
     out_json = tmp_path / "out.json"
-    result = _run_cli([str(xlsx), "-o", str(out_json), "--pdf", "--image"])
+    result = _run_cli([str(sample_xlsx), "-o", str(out_json), "--pdf", "--image"])
     assert result.returncode == 0
     pdf_path = out_json.with_suffix(".pdf")
     images_dir = out_json.parent / f"{out_json.stem}_images"
     assert pdf_path.exists()
     assert images_dir.exists()
-    assert any(images_dir.glob("*.png"))
+    with os.scandir(images_dir) as entries:
+        assert any(entry.name.endswith(".png") for entry in entries)
 
 
 def test_CLIで無効ファイルは安全終了する(tmp_path: Path) -> None:
@@ -323,11 +336,10 @@ def test_CLIで無効ファイルは安全終了する(tmp_path: Path) -> None:
 
 
 def test_cli_forwards_include_backend_metadata_flag(
-    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path, sample_xlsx: Path
 ) -> None:
     """Verify that the CLI forwards backend metadata inclusion to process_excel."""
 
-    xlsx = _prepare_sample_excel(tmp_path)
     out_json = tmp_path / "out.json"
     captured: dict[str, object] = {}
 
@@ -335,18 +347,27 @@ def test_cli_forwards_include_backend_metadata_flag(
         captured.update(kwargs)
 
     monkeypatch.setattr("exstruct.cli.main.process_excel", _capture_process_excel)
-    result = _run_cli([str(xlsx), "-o", str(out_json), "--include-backend-metadata"])
+    result = _run_cli(
+        [str(sample_xlsx), "-o", str(out_json), "--include-backend-metadata"]
+    )
     assert result.returncode == 0
     assert captured["include_backend_metadata"] is True
 
 
-def test_CLI_print_areas_dir_outputs_files(tmp_path: Path) -> None:
+def test_CLI_print_areas_dir_outputs_files(
+    tmp_path: Path, print_area_xlsx: Path
+) -> None:
     """Verify that the CLI writes print-area JSON files to the target directory."""
 
-    xlsx = _prepare_print_area_excel(tmp_path)
     areas_dir = tmp_path / "areas"
     result = _run_cli(
-        [str(xlsx), "--print-areas-dir", str(areas_dir), "--mode", "standard"]
+        [
+            str(print_area_xlsx),
+            "--print-areas-dir",
+            str(areas_dir),
+            "--mode",
+            "standard",
+        ]
     )
     assert result.returncode == 0
     files = list(areas_dir.glob("*.json"))
@@ -356,11 +377,10 @@ def test_CLI_print_areas_dir_outputs_files(tmp_path: Path) -> None:
     )
 
 
-def test_cli_libreoffice_rejects_pdf_and_image(tmp_path: Path) -> None:
+def test_cli_libreoffice_rejects_pdf_and_image(sample_xlsx: Path) -> None:
     """Verify that the CLI LibreOffice rejects PDF and image."""
 
-    xlsx = _prepare_sample_excel(tmp_path)
-    result = _run_cli([str(xlsx), "--mode", "libreoffice", "--pdf", "--image"])
+    result = _run_cli([str(sample_xlsx), "--mode", "libreoffice", "--pdf", "--image"])
 
     assert result.returncode == 1
     combined_output = _stdout_text(result) + _stderr_text(result)
@@ -368,7 +388,7 @@ def test_cli_libreoffice_rejects_pdf_and_image(tmp_path: Path) -> None:
 
 
 def test_cli_libreoffice_rejects_auto_page_breaks_dir(
-    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    tmp_path: Path, sample_xlsx: Path, monkeypatch: pytest.MonkeyPatch
 ) -> None:
     """Verify that the CLI rejects auto page-break export in LibreOffice mode."""
 
@@ -381,12 +401,11 @@ def test_cli_libreoffice_rejects_auto_page_breaks_dir(
     monkeypatch.setattr("exstruct.cli.main.process_excel", _raise_process_excel)
     monkeypatch.setattr("exstruct.cli.main.get_com_availability", _raise_com_probe)
 
-    xlsx = _prepare_sample_excel(tmp_path)
     auto_dir = tmp_path / "auto"
 
     result = _run_cli(
         [
-            str(xlsx),
+            str(sample_xlsx),
             "--mode",
             "libreoffice",
             "--auto-page-breaks-dir",
@@ -400,7 +419,7 @@ def test_cli_libreoffice_rejects_auto_page_breaks_dir(
 
 
 def test_cli_libreoffice_rejects_rendering_and_auto_page_breaks(
-    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    tmp_path: Path, sample_xlsx: Path, monkeypatch: pytest.MonkeyPatch
 ) -> None:
     """Verify that the CLI LibreOffice rejects rendering and auto page breaks."""
 
@@ -413,12 +432,11 @@ def test_cli_libreoffice_rejects_rendering_and_auto_page_breaks(
     monkeypatch.setattr("exstruct.cli.main.process_excel", _raise_process_excel)
     monkeypatch.setattr("exstruct.cli.main.get_com_availability", _raise_com_probe)
 
-    xlsx = _prepare_sample_excel(tmp_path)
     auto_dir = tmp_path / "auto"
 
     result = _run_cli(
         [
-            str(xlsx),
+            str(sample_xlsx),
             "--mode",
             "libreoffice",
             "--pdf",
@@ -445,6 +463,13 @@ def test_cli_parser_always_includes_auto_page_breaks_option() -> None:
     assert "standard or --mode verbose with Excel COM" in help_text
 
 
+def test_cli_main_reuses_default_parser() -> None:
+    """Ensure main shares one parser while build_parser stays fresh per call."""
+
+    assert _default_parser() is _default_parser()
+    assert build_parser() is not build_parser()
+
+
 def test_cli_parser_help_does_not_probe_com_availability(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
@@ -479,7 +504,7 @@ def test_cli_main_help_does_not_probe_com_availability(
 
 
 def test_cli_auto_page_breaks_rejects_light_mode(
-    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    tmp_path: Path, sample_xlsx: Path, monkeypatch: pytest.MonkeyPatch
 ) -> None:
     """Verify that light mode rejects auto page-break export explicitly."""
 
@@ -488,11 +513,10 @@ def test_cli_auto_page_breaks_rejects_light_mode(
 
     monkeypatch.setattr("exstruct.cli.main.get_com_availability", _raise)
 
-    xlsx = _prepare_sample_excel(tmp_path)
     auto_dir = tmp_path / "auto"
     result = _run_cli(
         [
-            str(xlsx),
+            str(sample_xlsx),
             "--mode",
             "light",
             "--auto-page-breaks-dir",
@@ -510,11 +534,10 @@ def test_cli_auto_page_breaks_rejects_light_mode(
 
 @pytest.mark.parametrize("mode", ["standard", "verbose"])  # type: ignore[misc]
 def test_cli_auto_page_breaks_requires_com_at_runtime(
-    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, mode: str
+    tmp_path: Path, sample_xlsx: Path, monkeypatch: pytest.MonkeyPatch, mode: str
 ) -> None:
     """Verify that auto page-break export fails clearly when COM is unavailable."""
 
-    xlsx = _prepare_sample_excel(tmp_path)
     auto_dir = tmp_path / "auto"
     monkeypatch.setattr(
         "exstruct.cli.main.get_com_availability",
@@ -523,7 +546,7 @@ def test_cli_auto_page_breaks_requires_com_at_runtime(
 
     result = _run_cli(
         [
-            str(xlsx),
+            str(sample_xlsx),
             "--mode",
             mode,
             "--auto-page-breaks-dir",
@@ -540,20 +563,19 @@ def test_cli_auto_page_breaks_requires_com_at_runtime(
     assert "Reason: Non-Windows platform." in combined_output
 
 
-def test_CLI_stdout_is_utf8_with_cp932_env(tmp_path: Path) -> None:
+def test_CLI_stdout_is_utf8_with_cp932_env(unicode_xlsx: Path) -> None:
     """Ensure stdout remains UTF-8 even when PYTHONIOENCODING forces cp932.
 
     Args:
-        tmp_path: Temporary directory provided by pytest for test artifacts.
+        unicode_xlsx: Workbook containing mixed Unicode content.
     """
 
-    xlsx = _prepare_unicode_excel(tmp_path)
-    env = os.environ.copy()
-    env["PYTHONIOENCODING"] = "cp932"
-    result = _run_cli([str(xlsx), "--format", "json"], text=False, env=env)
+    result = _run_cli(
+        [str(unicode_xlsx), "--format", "json"], env={"PYTHONIOENCODING": "cp932"}
+    )
 
     assert result.returncode == 0
 
-    stdout_text = _stdout_text(result)
-    assert "☑︎ テスト ✓ こんにちは 🌸" in stdout_text
-    json.loads(stdout_text)
+    stdout_bytes = result.stdout_bytes
+    assert "☑︎ テスト ✓ こんにちは 🌸".encode() in stdout_bytes
+    json.loads(stdout_bytes)
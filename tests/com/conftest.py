@@ -0,0 +1,107 @@
+"""Shared fixtures for Excel COM tests."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+
+import pytest
+import xlwings as xw
+
+from exstruct.core.integrate import extract_workbook
+from exstruct.models import WorkbookData
+
+
+@contextmanager
+def _excel_app() -> Iterator[xw.App]:
+    app = xw.App(add_book=False, visible=False)
+    app.display_alerts = False
+    app.screen_updating = False
+    try:
+        yield app
+    finally:
+        try:
+            app.quit()
+        except Exception:
+            try:
+                app.kill()
+            except Exception:
+                app = None
+
+
+@pytest.fixture(scope="session")
+def excel_app() -> Iterator[xw.App]:
+    """Start one hidden Excel instance shared by every COM fixture.
+
+    Process startup is the dominant cost of building COM workbooks, so the
+    builders add books to this instance instead of launching their own. It is
+    quit (or killed) when the session ends. COM-marked tests are skipped
+    before fixture setup, so Excel is never launched off Windows.
+    """
+    with _excel_app() as app:
+        yield app
+
+
+def _make_workbook_with_shapes(app: xw.App, path: Path) -> None:
+    wb = app.books.add()
+    try:
+        sht = wb.sheets[0]
+        sht.name = "Sheet1"
+
+        rect = sht.api.Shapes.AddShape(1, 50, 50, 120, 60)  # msoShapeRectangle
+        rect.TextFrame2.TextRange.Text = "rect"
+
+        _ = sht.api.Shapes.AddShape(5, 300, 50, 80, 40)  # msoShapeOval (no text)
+
+        line = sht.api.Shapes.AddLine(10, 10, 110, 10)
+        line.Line.EndArrowheadStyle = 3  # msoArrowheadTriangle
+
+        outer = sht.api.Shapes.AddShape(1, 200, 200, 150, 100)
+        inner = sht.api.Shapes.AddShape(1, 230, 230, 80, 40)
+        inner.TextFrame2.TextRange.Text = "inner"
+        sht.api.Shapes.Range([outer.Name, inner.Name]).Group()
+
+        # Add two rectangles and a connector that explicitly connects them
+        # so that ConnectorFormat.BeginConnectedShape / EndConnectedShape
+        # are populated by Excel.
+        src_shape = sht.api.Shapes.AddShape(1, 50, 150, 80, 40)
+        src_shape.TextFrame2.TextRange.Text = "src"
+        dst_shape = sht.api.Shapes.AddShape(1, 200, 150, 80, 40)
+        dst_shape.TextFrame2.TextRange.Text = "dst"
+        connector = sht.api.Shapes.AddConnector(1, 90, 170, 200, 170)
+        connector.Line.EndArrowheadStyle = 3
+        try:
+            connector.ConnectorFormat.BeginConnect(src_shape, 1)
+            connector.ConnectorFormat.EndConnect(dst_shape, 1)
+        except Exception:
+            # In some environments connector wiring may fail; tests will
+            # simply not find connected shapes in that case.
+            connector = None
+
+        wb.save(str(path))
+    finally:
+        wb.close()
+
+
+@pytest.fixture(scope="session")
+def shapes_workbook(
+    tmp_path_factory: pytest.TempPathFactory, excel_app: xw.App
+) -> Path:
+    """Build the shapes workbook once per session.
+
+    Launching Excel dominates the cost of these tests, so every shapes test
+    reads the same saved file instead of driving a fresh Excel instance. Under
+    pytest-xdist each worker has its own session, so each worker builds its
+    own copy in its own temporary directory and no Excel instance is shared
+    across processes.
+    """
+    path = tmp_path_factory.mktemp("com") / "shapes.xlsx"
+    _make_workbook_with_shapes(excel_app, path)
+    return path
+
+
+@pytest.fixture(scope="session")
+def shapes_wb_data(shapes_workbook: Path) -> WorkbookData:
+    """Extract the shapes workbook once and share the result across tests."""
+    return extract_workbook(shapes_workbook)
@@ -1,3 +1,5 @@
+from dataclasses import dataclass
+import os
 from pathlib import Path
 
 from openpyxl import Workbook
@@ -8,56 +10,85 @@ from exstruct import process_excel
 pytestmark = pytest.mark.render
 
 
-def test_render_smoke_pdf_and_png(tmp_path: Path) -> None:
-    # create a tiny workbook
-    xlsx = tmp_path / "sample.xlsx"
-    wb = Workbook()
-    ws = wb.active
-    ws.title = "Sheet1"
-    ws["A1"] = "hello"
+@dataclass(frozen=True)
+class _RenderedOutputs:
+    """Artifacts written by one ``process_excel`` render run."""
+
+    out_json: Path
+
+    @property
+    def pdf_path(self) -> Path:
+        return self.out_json.with_suffix(".pdf")
+
+    @property
+    def images_dir(self) -> Path:
+        return self.out_json.parent / f"{self.out_json.stem}_images"
+
+
+@pytest.fixture(scope="session")
+def rendered_smoke(tmp_path_factory: pytest.TempPathFactory) -> _RenderedOutputs:
+    """Render a tiny workbook to JSON, PDF, and PNG once per session."""
+    out_dir = tmp_path_factory.mktemp("render")
+    xlsx = out_dir / "sample.xlsx"
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet("Sheet1")
+    ws.append(["hello"])
     wb.save(xlsx)
 
-    out_json = tmp_path / "out.json"
+    out_json = out_dir / "out.json"
     process_excel(
         xlsx,
         output_path=out_json,
         out_fmt="json",
         pdf=True,
         image=True,
-        dpi=72,
+        dpi=36,
         mode="standard",
         pretty=True,
     )
-    pdf_path = out_json.with_suffix(".pdf")
-    images_dir = out_json.parent / f"{out_json.stem}_images"
-    assert out_json.exists()
-    assert pdf_path.exists()
-    assert images_dir.exists()
-    assert any(images_dir.glob("*.png"))
-
+    return _RenderedOutputs(out_json=out_json)
 
-def test_render_multiple_print_ranges_images(tmp_path: Path) -> None:
-    """
-    Verify that processing a workbook with multiple print ranges across four sheets produces an images directory containing exactly four PNG files.
 
-    Uses the test asset 'assets/multiple_print_ranges_4sheets.xlsx', runs process_excel with image output enabled, and asserts the generated images directory exists and contains four .png images.
-    """
+@pytest.fixture(scope="session")
+def rendered_multiple_print_ranges(
+    tmp_path_factory: pytest.TempPathFactory,
+) -> _RenderedOutputs:
+    """Render the 4-sheet multiple-print-ranges asset to PNG once per session."""
     xlsx = (
         Path(__file__).resolve().parents[1]
         / "assets"
         / "multiple_print_ranges_4sheets.xlsx"
     )
-    out_json = tmp_path / "out.json"
+    out_json = tmp_path_factory.mktemp("render") / "out.json"
     process_excel(
         xlsx,
         output_path=out_json,
         out_fmt="json",
         image=True,
-        dpi=72,
+        dpi=36,
         mode="standard",
         pretty=True,
     )
-    images_dir = out_json.parent / f"{out_json.stem}_images"
+    return _RenderedOutputs(out_json=out_json)
+
+
+def test_render_smoke_pdf_and_png(rendered_smoke: _RenderedOutputs) -> None:
+    assert rendered_smoke.out_json.exists()
+    assert rendered_smoke.pdf_path.exists()
+    assert rendered_smoke.images_dir.exists()
+    with os.scandir(rendered_smoke.images_dir) as entries:
+        assert any(entry.name.endswith(".png") for entry in entries)
+
+
+def test_render_multiple_print_ranges_images(
+    rendered_multiple_print_ranges: _RenderedOutputs,
+) -> None:
+    """
+    Verify that processing a workbook with multiple print ranges across four sheets produces an images directory containing exactly four PNG files.
+
+    Uses the test asset 'assets/multiple_print_ranges_4sheets.xlsx', rendered once by the session fixture with image output enabled.
+    """
+    images_dir = rendered_multiple_print_ranges.images_dir
     images = list(images_dir.glob("*.png"))
     assert images_dir.exists()
     assert len(images) == 4
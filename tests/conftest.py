@@ -75,6 +75,8 @@ def pytest_configure(config: pytest.Config) -> None:
 @lru_cache(maxsize=1)
 def _has_excel_com() -> bool:
     """Return True if Excel COM can be opened via xlwings."""
+    if not IS_WINDOWS:
+        return False
     try:
         import xlwings as xw
 
@@ -214,14 +216,12 @@ def _render_skip_reason() -> str | None:
     """
     if not RUN_RENDER_SMOKE:
         return "Render tests disabled; set RUN_RENDER_SMOKE=1 to enable."
-    reason = _com_skip_reason()
-    if reason:
-        return reason
+    # Import probes are cheap; check them before the COM probe starts Excel.
     if not _has_pdfium():
         return "pypdfium2 is unavailable."
     if not _has_pillow():
         return "Pillow (PIL) is unavailable."
-    return None
+    return _com_skip_reason()
 
 
 def _libreoffice_skip_reason() -> str | None:
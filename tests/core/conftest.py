@@ -0,0 +1,70 @@
+"""Shared workbook fixtures for core extraction tests."""
+
+from __future__ import annotations
+
+from pathlib import Path
+import shutil
+
+from openpyxl import Workbook
+from openpyxl.worksheet.table import Table, TableStyleInfo
+import pytest
+
+
+@pytest.fixture(scope="session")
+def link_workbook_template(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Build the hyperlink golden workbook once per session.
+
+    Sheet1 has "link" in A1 pointing at http://example.com and plain
+    "no-link" text in B1.
+    """
+    path = tmp_path_factory.mktemp("golden") / "links.xlsx"
+    wb = Workbook()
+    ws = wb.active
+    ws.title = "Sheet1"
+    c = ws["A1"]
+    c.value = "link"
+    c.hyperlink = "http://example.com"
+    ws["B1"] = "no-link"
+    wb.save(path)
+    wb.close()
+    return path
+
+
+@pytest.fixture(scope="session")
+def table_workbook_template(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Build the Excel-table golden workbook once per session.
+
+    Sheet1 holds a header row and two data rows in A1:B3, registered as the
+    table "Tbl".
+    """
+    path = tmp_path_factory.mktemp("golden") / "table.xlsx"
+    wb = Workbook()
+    ws = wb.active
+    ws.title = "Sheet1"
+    ws.append(["A", "B"])
+    ws.append(["v1", "v2"])
+    ws.append(["v3", "v4"])
+    tbl = Table(displayName="Tbl", ref="A1:B3")
+    tbl.tableStyleInfo = TableStyleInfo(
+        name="TableStyleMedium9",
+        showFirstColumn=False,
+        showLastColumn=False,
+        showRowStripes=True,
+        showColumnStripes=False,
+    )
+    ws.add_table(tbl)
+    wb.save(path)
+    wb.close()
+    return path
+
+
+@pytest.fixture
+def link_workbook(link_workbook_template: Path, tmp_path: Path) -> Path:
+    """Return a per-test copy of the hyperlink golden workbook."""
+    return Path(shutil.copy(link_workbook_template, tmp_path / "links.xlsx"))
+
+
+@pytest.fixture
+def table_workbook(table_workbook_template: Path, tmp_path: Path) -> Path:
+    """Return a per-test copy of the Excel-table golden workbook."""
+    return Path(shutil.copy(table_workbook_template, tmp_path / "table.xlsx"))
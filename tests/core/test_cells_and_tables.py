@@ -1,10 +1,12 @@
 from pathlib import Path
+import re
+import sys
 from typing import Never
+import zipfile
 
 from _pytest.monkeypatch import MonkeyPatch
 from openpyxl import Workbook
 from openpyxl.styles import Border, Side
-from openpyxl.worksheet.table import Table, TableStyleInfo
 import pytest
 
 from exstruct.core.cells import (
@@ -16,26 +18,6 @@ from exstruct.core.cells import (
 from exstruct.core.integrate import extract_workbook
 
 
-def _make_workbook_with_table(path: Path) -> None:
-    wb = Workbook()
-    ws = wb.active
-    ws.title = "Sheet1"
-    ws.append(["A", "B"])
-    ws.append(["v1", "v2"])
-    ws.append(["v3", "v4"])
-    tbl = Table(displayName="Tbl", ref="A1:B3")
-    tbl.tableStyleInfo = TableStyleInfo(
-        name="TableStyleMedium9",
-        showFirstColumn=False,
-        showLastColumn=False,
-        showRowStripes=True,
-        showColumnStripes=False,
-    )
-    ws.add_table(tbl)
-    wb.save(path)
-    wb.close()
-
-
 def test_数値セルは型保持で抽出される(tmp_path: Path) -> None:
     path = tmp_path / "numbers.xlsx"
     wb = Workbook()
@@ -54,10 +36,26 @@ def test_数値セルは型保持で抽出される(tmp_path: Path) -> None:
     assert row.c["2"] == "text"
 
 
-def test_openpyxlで正式テーブルを検出できる(tmp_path: Path) -> None:
-    path = tmp_path / "table.xlsx"
-    _make_workbook_with_table(path)
-    tables = detect_tables_openpyxl(path, "Sheet1")
+def test_extract_sheet_cells_shares_column_keys(tmp_path: Path) -> None:
+    """同じ列のキー文字列は全行で同一オブジェクトを共有する。"""
+    path = tmp_path / "keys.xlsx"
+    wb = Workbook()
+    ws = wb.active
+    ws.title = "Sheet1"
+    for r in range(3):
+        ws.append([f"v{r}_{c}" for c in range(12)])
+    wb.save(path)
+    wb.close()
+
+    rows = extract_sheet_cells(path)["Sheet1"]
+    keys = [list(row.c) for row in rows]
+    assert keys[0] == [str(c) for c in range(12)]
+    assert all(a is b for a, b in zip(keys[0], keys[2], strict=True))
+    assert keys[0][11] is sys.intern("11")
+
+
+def test_openpyxlで正式テーブルを検出できる(table_workbook: Path) -> None:
+    tables = detect_tables_openpyxl(table_workbook, "Sheet1")
     assert "A1:B3" in tables
 
 
@@ -88,11 +86,58 @@ def test_openpyxl_border_scan_defers_column_shrink(tmp_path: Path) -> None:
     assert bool(has_border[50, 120]) is True
 
 
+def test_openpyxl_border_scan_measures_sheet_with_bogus_dimension(
+    tmp_path: Path,
+) -> None:
+    """Scan the real extent when the stored <dimension> claims only A1."""
+    source = tmp_path / "source.xlsx"
+    wb = Workbook()
+    ws = wb.active
+    ws.title = "Sheet1"
+    ws.cell(row=30, column=5, value="x").border = Border(left=Side(style="thin"))
+    wb.save(source)
+    wb.close()
+
+    path = tmp_path / "bogus_dimension.xlsx"
+    with zipfile.ZipFile(source) as zin, zipfile.ZipFile(path, "w") as zout:
+        for info in zin.infolist():
+            data = zin.read(info.filename)
+            if info.filename == "xl/worksheets/sheet1.xml":
+                data = re.sub(
+                    rb'<dimension ref="[^"]*"/>', b'<dimension ref="A1"/>', data
+                )
+            zout.writestr(info, data)
+
+    has_border, *_, max_row, max_col = load_border_maps_xlsx(path, "Sheet1")
+    assert (max_row, max_col) == (30, 5)
+    assert bool(has_border[30, 5]) is True
+
+
+def test_openpyxl_border_scan_splits_sides_per_cell(tmp_path: Path) -> None:
+    """Keep each side in its own grid even when cells share one Border style."""
+    path = tmp_path / "sides.xlsx"
+    wb = Workbook()
+    ws = wb.active
+    ws.title = "Sheet1"
+    left_only = Border(left=Side(style="thin"))
+    ws["A1"].border = left_only
+    ws["C1"].border = left_only
+    ws["B2"].border = Border(top=Side(style="thin"), right=Side(style="none"))
+    wb.save(path)
+    wb.close()
+
+    has_border, top, bottom, left, right, *_ = load_border_maps_xlsx(path, "Sheet1")
+    assert left[1, 1] and left[1, 3] and not left[2, 2]
+    assert top[2, 2] and not top[1, 1]
+    assert not bottom.any() and not right.any()
+    assert has_border.tolist() == (top | bottom | left | right).tolist()
+    assert int(has_border.sum()) == 3
+
+
 def test_excelなし環境ではセルとテーブルのみ返す(
-    monkeypatch: MonkeyPatch, tmp_path: Path
+    monkeypatch: MonkeyPatch, table_workbook: Path
 ) -> None:
-    path = tmp_path / "fallback.xlsx"
-    _make_workbook_with_table(path)
+    path = table_workbook
 
     def _raise(*_args: object, **_kwargs: object) -> Never:
         raise RuntimeError("no COM")
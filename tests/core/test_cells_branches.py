@@ -15,6 +15,11 @@ def test_table_density_metrics() -> None:
     assert coverage == 1.0
 
 
+def test_nonempty_mask_pads_ragged_rows() -> None:
+    mask = cells._nonempty_mask([["a", " ", None], ["", 0]])
+    assert mask.tolist() == [[True, False, False], [False, True, False]]
+
+
 def test_is_plausible_table_rejects_too_small() -> None:
     assert cells._is_plausible_table([["only one row"]]) is False
 
@@ -42,6 +47,16 @@ def test_nonempty_clusters_two_components() -> None:
     assert (2, 1, 2, 1) in boxes
 
 
+def test_nonempty_clusters_raster_order_and_empty() -> None:
+    matrix = [
+        ["", "", "a"],
+        ["b", "", "a"],
+        ["b", "b", ""],
+    ]
+    assert cells._nonempty_clusters(matrix) == [(0, 2, 1, 2), (1, 0, 2, 1)]
+    assert cells._nonempty_clusters([["", None], [" ", ""]]) == []
+
+
 def test_detect_border_clusters_fallback() -> None:
     has_border = np.array(
         [
@@ -54,3 +69,34 @@ def test_detect_border_clusters_fallback() -> None:
     rects = cells.detect_border_clusters(has_border, min_size=2)
     # single cluster covering the three True cells -> bbox (0,0)-(1,1)
     assert (0, 0, 1, 1) in rects
+
+
+def test_detect_border_clusters_python_grows_left_of_first_cell() -> None:
+    has_border = np.array(
+        [
+            [False, False, True],
+            [True, False, True],
+            [True, True, True],
+            [False, False, False],
+        ],
+        dtype=bool,
+    )
+    assert cells._detect_border_clusters_python(has_border, 1) == [(0, 0, 2, 2)]
+    assert cells._detect_border_clusters_python(has_border, 7) == []
+    assert cells._detect_border_clusters_python(np.zeros((0, 3), dtype=bool), 1) == []
+
+
+def test_detect_border_clusters_numpy_matches_python() -> None:
+    has_border = np.array(
+        [
+            [True, True, False, True],
+            [False, True, False, True],
+            [True, False, False, False],
+            [True, False, True, True],
+        ],
+        dtype=bool,
+    )
+    for min_size in (1, 2, 3):
+        assert cells._detect_border_clusters_numpy(
+            has_border, min_size
+        ) == cells._detect_border_clusters_python(has_border, min_size)
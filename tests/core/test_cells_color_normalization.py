@@ -1,6 +1,9 @@
+import pytest
 from tests.utils import parametrize
 
+from exstruct.core import cells
 from exstruct.core.cells import (
+    _make_color_key_normalizer,
     _normalize_color_key,
     _normalize_ignore_colors,
     _normalize_rgb,
@@ -41,6 +44,15 @@ def test_normalize_rgb(raw: str, expected: str) -> None:
     assert _normalize_rgb(raw) == expected
 
 
+def test_normalize_rgb_memoizes_repeated_values() -> None:
+    """同じ ARGB 文字列の正規化はキャッシュから返す。"""
+    _normalize_rgb.cache_clear()
+    for _ in range(3):
+        assert _normalize_rgb("FF112233") == "112233"
+    info = _normalize_rgb.cache_info()
+    assert (info.hits, info.misses) == (2, 1)
+
+
 def test_normalize_ignore_colors_filters_empty_and_normalizes() -> None:
     """ignore_colors の正規化と空キー除外を確認する。"""
     result = _normalize_ignore_colors({" #aabbcc ", "", "AUTO:1", "auto:1"})
@@ -50,3 +62,24 @@ def test_normalize_ignore_colors_filters_empty_and_normalizes() -> None:
 def test_normalize_ignore_colors_none_returns_empty() -> None:
     """ignore_colors が None の場合は空集合を返す。"""
     assert _normalize_ignore_colors(None) == set()
+
+
+def test_color_key_normalizer_drops_ignored_and_memoizes(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """同じ生キーは一度だけ正規化し、無視色は None を返す。"""
+    calls: list[str] = []
+    real_normalize = cells._normalize_color_key
+
+    def _counting(color_key: str) -> str:
+        calls.append(color_key)
+        return real_normalize(color_key)
+
+    normalize = _make_color_key_normalizer({"#ad3815"})
+    monkeypatch.setattr(cells, "_normalize_color_key", _counting)
+
+    assert normalize("FFAD3815") is None
+    assert normalize("ff00ff00") == "00FF00"
+    assert normalize("ff00ff00") == "00FF00"
+    assert normalize("FFAD3815") is None
+    assert calls == ["FFAD3815", "ff00ff00"]
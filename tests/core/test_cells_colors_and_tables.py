@@ -1,5 +1,7 @@
 from dataclasses import dataclass
 
+from openpyxl import Workbook
+from openpyxl.styles import PatternFill
 import pytest
 from tests.utils import parametrize
 
@@ -122,6 +124,9 @@ def test_color_to_key_variants(color: _DummyColor, expected: str) -> None:
         (["A", "1"], True),
         ([None, ""], False),
         (["A"], False),
+        (["A", " ", None, 2.5], True),
+        ([1, 2, "x"], False),
+        (["-.5", " 7", None], True),
     ],
 )
 def test_header_like_row(row: list[object], expected: bool) -> None:
@@ -167,3 +172,31 @@ def test_collect_table_candidates_detects_simple_table(
         values, base_top=1, base_left=1, col_name=lambda c: chr(64 + c)
     )
     assert results == ["A1:B3"]
+
+
+def test_extract_sheet_colors_resolves_each_shared_fill_once(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """同じ塗りを共有するセルは塗りごとに一度だけ解決する。"""
+    wb = Workbook()
+    ws = wb.active
+    red = PatternFill(patternType="solid", fgColor="AD3815")
+    for coord in ("A1", "B1", "A2"):
+        ws[coord].fill = red
+    ws["B2"].fill = PatternFill(patternType="solid", fgColor="00FF00")
+
+    calls: list[str] = []
+    real_resolve = cells._resolve_cell_background
+
+    def _counting(cell: object, include_default_background: bool) -> str | None:
+        calls.append(str(getattr(cell, "coordinate", "")))
+        return real_resolve(cell, include_default_background)
+
+    monkeypatch.setattr(cells, "_resolve_cell_background", _counting)
+    sheet = cells._extract_sheet_colors(ws, False, None)
+
+    assert sheet.colors_map == {
+        "AD3815": [(1, 0), (1, 1), (2, 0)],
+        "00FF00": [(2, 1)],
+    }
+    assert calls == ["A1", "B2"]
@@ -18,6 +18,11 @@ from exstruct.core.cells import _coerce_numeric_preserve_format
         (".5", 0.5),
         ("1e3", "1e3"),
         ("text", "text"),
+        ("", ""),
+        ("+", "+"),
+        ("-.5", -0.5),
+        ("+abc", "+abc"),
+        ("１２", 12),
     ],
 )
 def test_coerce_numeric_preserve_format(val: str, expected: int | float | str) -> None:
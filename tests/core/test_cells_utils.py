@@ -1,4 +1,6 @@
 from pathlib import Path
+import re
+import zipfile
 
 from _pytest.monkeypatch import MonkeyPatch
 from openpyxl import Workbook
@@ -101,6 +103,40 @@ def test_extract_sheet_formulas_map_collects_formulas(tmp_path: Path) -> None:
     assert sheet.formulas_map == {"=SUM(A1:A2)": [(1, 1)]}
 
 
+def test_extract_sheet_formulas_map_streams_past_stored_dimension(
+    tmp_path: Path,
+) -> None:
+    """保存された <dimension> が A1 のみでも共有数式を含め全行を読む。"""
+    source = tmp_path / "source.xlsx"
+    wb = Workbook()
+    ws = wb.active
+    ws.title = "Sheet1"
+    ws["A1"] = 1
+    ws["A2"] = 2
+    ws["B1"] = "=A1*2"
+    ws["B2"] = "=A2*2"
+    wb.save(source)
+    wb.close()
+
+    path = tmp_path / "shared.xlsx"
+    with zipfile.ZipFile(source) as zin, zipfile.ZipFile(path, "w") as zout:
+        for info in zin.infolist():
+            data = zin.read(info.filename)
+            if info.filename == "xl/worksheets/sheet1.xml":
+                data = data.replace(
+                    b"<f>A1*2</f>", b'<f t="shared" ref="B1:B2" si="0">A1*2</f>'
+                ).replace(b"<f>A2*2</f>", b'<f t="shared" si="0"/>')
+                data = re.sub(
+                    rb'<dimension ref="[^"]*"/>', b'<dimension ref="A1"/>', data
+                )
+            zout.writestr(info, data)
+
+    result = extract_sheet_formulas_map(path)
+    sheet = result.get_sheet("Sheet1")
+    assert sheet is not None
+    assert sheet.formulas_map == {"=A1*2": [(1, 1)], "=A2*2": [(2, 1)]}
+
+
 def test_normalize_formula_from_com() -> None:
     assert _normalize_formula_from_com("=A1") == "=A1"
     assert _normalize_formula_from_com("A1") is None
@@ -171,3 +207,37 @@ def test_extract_sheet_formulas_map_com_collects_formulas() -> None:
         "=A1": [(1, 0)],
         "=SUM(A1)": [(2, 0)],
     }
+
+
+def test_extract_sheet_formulas_map_com_reads_used_range_once() -> None:
+    """使用範囲の数式は 1 回の COM 読み出しで取得し、オフセットを反映する。"""
+    reads: list[tuple[object, object]] = []
+
+    class _DummyLastCell:
+        row = 4
+        column = 3
+
+    class _DummyUsedRange:
+        row = 3
+        column = 2
+        last_cell = _DummyLastCell()
+
+    class _DummyRange:
+        formula = [["=B3", 1.0], [None, "=C4"]]
+
+    class _DummySheet:
+        name = "Sheet1"
+        used_range = _DummyUsedRange()
+
+        def range(self, start: object, end: object) -> _DummyRange:
+            reads.append((start, end))
+            return _DummyRange()
+
+    class _DummyWorkbook:
+        sheets = [_DummySheet()]
+
+    result = extract_sheet_formulas_map_com(_DummyWorkbook())
+    sheet = result.get_sheet("Sheet1")
+    assert sheet is not None
+    assert reads == [((3, 2), (4, 3))]
+    assert sheet.formulas_map == {"=B3": [(3, 1)], "=C4": [(4, 2)]}
@@ -131,3 +131,52 @@ def test_get_charts_sets_error_on_failure() -> None:
 
     assert len(charts) == 1
     assert charts[0].error is not None
+
+
+def test_get_charts_reads_each_chart_name_once() -> None:
+    """Each chart name and the sheet dispatch are read once per call."""
+    reads: list[str] = []
+    chart_com = _DummyChartCom(
+        ChartType=4,
+        _series=[],
+        _axis=_DummyAxis(
+            HasTitle=False,
+            AxisTitle=_DummyAxisTitle(Text=""),
+            MinimumScale=0.0,
+            MaximumScale=1.0,
+        ),
+        HasTitle=False,
+        ChartTitle=_DummyChartTitle(Text=""),
+    )
+
+    class _CountingShape:
+        width = 10.0
+        height = 10.0
+        left = 0.0
+        top = 0.0
+
+        def __init__(self, name: str) -> None:
+            self._name = name
+
+        @property
+        def name(self) -> str:
+            reads.append(self._name)
+            return self._name
+
+    class _CountingSheet:
+        charts = [_CountingShape("Chart1"), _CountingShape("Chart2")]
+
+        @property
+        def api(self) -> _DummySheetApi:
+            reads.append("api")
+            return _DummySheetApi(
+                {
+                    "Chart1": _DummyChartObject(Chart=chart_com),
+                    "Chart2": _DummyChartObject(Chart=chart_com),
+                }
+            )
+
+    charts = get_charts(_CountingSheet())
+
+    assert [c.name for c in charts] == ["Chart1", "Chart2"]
+    assert reads == ["api", "Chart1", "Chart2"]
@@ -1,5 +1,7 @@
+import pytest
 from tests.utils import parametrize
 
+from exstruct.core import charts
 from exstruct.core.charts import parse_series_formula
 
 
@@ -50,6 +52,17 @@ from exstruct.core.charts import parse_series_formula
                 "name_literal": 'A"B',
             },
         ),
+        (
+            '=SERIES("a, (b)",{1,2},(Sheet1!$B$1,Sheet1!$C$1),2,)',
+            {
+                "name_range": None,
+                "x_range": "{1,2}",
+                "y_range": "(Sheet1!$B$1,Sheet1!$C$1)",
+                "plot_order": "2",
+                "bubble_size_range": None,
+                "name_literal": "a, (b)",
+            },
+        ),
         (
             "=SERIES(,,Sheet1!$B$1:$B$3,1)",
             {
@@ -76,8 +89,48 @@ def test_parse_series_formula_valid(
         "",
         "=OTHER(A,B,C)",
         "=SERIES(",
+        '=SERIES("unterminated,A1,B1)',
     ],
 )
 def test_parse_series_formula_invalid(formula: str) -> None:
     """SERIES 以外や不正構文は None を返す。"""
     assert parse_series_formula(formula) is None
+
+
+@parametrize(
+    "formula,is_flat",
+    [
+        ("=SERIES(Sheet1!$B$1,Sheet1!$A$2:$A$5,Sheet1!$B$2:$B$5,1)", True),
+        ('=series( "A""B" ,\'My Sheet\'!$A$1,Sheet1!$B$1,1,Sheet1!$C$1)', True),
+        ("=SERIES(,,Sheet1!$B$1:$B$3,1)", True),
+        ('=SERIES("a, (b)",{1,2},(Sheet1!$B$1,Sheet1!$C$1),2,)', False),
+        ("=SERIES(Sheet1!$B$1;Sheet1!$A$2:$A$5;Sheet1!$B$2:$B$5;1)", False),
+        ('=SERIES("a;b",Sheet1!$A$1,Sheet1!$B$1,1)', False),
+        ("=SERIES(A,B,C,D,E,F)", False),
+    ],
+)
+def test_parse_series_formula_flat_fast_path(
+    formula: str, is_flat: bool, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """単純な SERIES は一括マッチで解析し、結果はスキャナと一致する。"""
+    assert (charts._match_flat_series(formula) is not None) is is_flat
+    parsed = parse_series_formula(formula)
+    monkeypatch.setattr(charts, "_match_flat_series", lambda _formula: None)
+    assert parse_series_formula(formula) == parsed
+
+
+@parametrize(
+    "text,expected",
+    [
+        ("=SERIES(A1)", True),
+        ("=series(A1)", True),
+        ("=SERIEß(A1)", True),
+        ("=SUM(A1:A3)", False),
+        ("=SERIE", False),
+        ("", False),
+    ],
+)
+def test_has_series_prefix_matches_full_upper(text: str, expected: bool) -> None:
+    """先頭 7 文字だけの大文字化でも全体を大文字化した判定と一致する。"""
+    assert charts._has_series_prefix(text) is expected
+    assert text.upper().startswith("=SERIES") is expected
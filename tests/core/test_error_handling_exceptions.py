@@ -14,6 +14,7 @@ from exstruct.errors import (
     SerializationError,
 )
 from exstruct.io import save_as_json, save_as_yaml, serialize_workbook
+from exstruct.io.serialize import _require_yaml
 from exstruct.models import SheetData, WorkbookData
 
 
@@ -42,11 +43,32 @@ def test_save_as_yaml_missing_dependency(
         return original_import(name, package=package)
 
     monkeypatch.setattr(importlib, "import_module", _fake_import)
+    _require_yaml.cache_clear()
     workbook = _minimal_workbook()
     with pytest.raises(MissingDependencyError):
         save_as_yaml(workbook, tmp_path / "out.yaml")
 
 
+def test_require_yaml_imports_once(monkeypatch: pytest.MonkeyPatch) -> None:
+    """A resolved YAML module is reused; failed imports are retried."""
+    pytest.importorskip("yaml")
+    original_import = importlib.import_module
+    calls: list[str] = []
+
+    def _flaky_import(name: str, package: str | None = None) -> object:
+        calls.append(name)
+        if len(calls) == 1:
+            raise ImportError("yaml not installed")
+        return original_import(name, package=package)
+
+    monkeypatch.setattr(importlib, "import_module", _flaky_import)
+    _require_yaml.cache_clear()
+    with pytest.raises(MissingDependencyError):
+        _require_yaml()
+    assert _require_yaml() is _require_yaml()
+    assert calls == ["yaml", "yaml"]
+
+
 def test_save_as_json_write_failure(
     monkeypatch: pytest.MonkeyPatch, tmp_path: Path
 ) -> None:
@@ -49,9 +49,9 @@ from exstruct.core.ooxml_drawing import (
     _extract_chart_series,
     _merge_anchor_geometry,
     _parse_connector_node,
-    _read_relationships,
     read_sheet_drawings,
 )
+from exstruct.core.ooxml_package import read_relationships
 from exstruct.models import Arrow, Shape
 
 
@@ -1180,7 +1180,7 @@ def test_read_relationships_keeps_type_metadata() -> None:
     """Verify that OOXML relationship parsing preserves relationship types."""
 
     with ZipFile(Path("sample/basic/sample.xlsx")) as archive:
-        relationships = _read_relationships(
+        relationships = read_relationships(
             archive,
             "xl/drawings/_rels/drawing1.xml.rels",
         )
@@ -2940,3 +2940,25 @@ def test_libreoffice_payload_parsers_reject_invalid_top_level_data() -> None:
     for parser, payload, expected_message in cases:
         with pytest.raises(RuntimeError, match=expected_message):
             parser(payload)
+
+
+@pytest.mark.parametrize(
+    "record",
+    [
+        DrawingShapeRef(
+            drawing_id=1,
+            name="Box",
+            kind="shape",
+            left=0,
+            top=0,
+            width=10,
+            height=10,
+        ),
+        DrawingConnectorRef(drawing_id=2, start_drawing_id=1, end_drawing_id=None),
+        LibreOfficeChartGeometry(name="Chart 1"),
+        LibreOfficeDrawPageShape(name="Box"),
+    ],
+)
+def test_per_object_drawing_records_use_slots(record: object) -> None:
+    """Per-shape records carry no instance __dict__."""
+    assert not hasattr(record, "__dict__")
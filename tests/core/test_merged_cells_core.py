@@ -1,8 +1,17 @@
+from datetime import datetime, timedelta
+import logging
 from pathlib import Path
+from zipfile import ZipFile
 
-from openpyxl import Workbook
+from openpyxl import Workbook, load_workbook
+from openpyxl.utils.datetime import CALENDAR_MAC_1904
+import pytest
 
-from exstruct.core.cells import extract_sheet_merged_cells
+from exstruct.core.cells import (
+    _read_anchor_cells,
+    extract_sheet_merged_cells,
+    extract_sheet_merged_cells_fast,
+)
 
 
 def _make_merged_book(path: Path) -> None:
@@ -34,3 +43,116 @@ def test_extract_sheet_merged_cells_empty(tmp_path: Path) -> None:
 
     merged = extract_sheet_merged_cells(path)
     assert merged["Sheet"] == []
+
+
+def test_extract_sheet_merged_cells_fast_matches_openpyxl(tmp_path: Path) -> None:
+    """XML 直読みでも openpyxl と同じ値・範囲を返す。"""
+    path = tmp_path / "typed.xlsx"
+    wb = Workbook()
+    ws = wb.active
+    ws.title = "Typed"
+    values: list[object] = [
+        datetime(2024, 1, 2, 3, 4),
+        timedelta(hours=30),
+        True,
+        1.5,
+        12,
+        "shared",
+        "=1+2",
+    ]
+    for row, value in enumerate(values, start=1):
+        ws.cell(row=row, column=2, value=value)
+        ws.merge_cells(start_row=row, start_column=2, end_row=row, end_column=3)
+    ws.merge_cells("E20")
+    wb.create_sheet("Skipped").merge_cells("A1:B1")
+    wb.save(path)
+
+    fast = extract_sheet_merged_cells_fast(path, sheet_names={"Typed"})
+    slow = extract_sheet_merged_cells(
+        path, workbook=load_workbook(path, data_only=True), sheet_names={"Typed"}
+    )
+
+    assert list(fast) == ["Typed"]
+    assert fast["Typed"] == slow["Typed"]
+    ordered = sorted(fast["Typed"], key=lambda r: r.r1)
+    assert [r.v for r in ordered] == [
+        "2024-01-02 03:04:00",
+        "1 day, 6:00:00",
+        "True",
+        "1.5",
+        "12",
+        "shared",
+        " ",
+        " ",
+    ]
+    assert (ordered[-1].r1, ordered[-1].c2) == (20, 4)
+
+
+def test_extract_sheet_merged_cells_paths_share_order() -> None:
+    """XML 直読みと openpyxl 経由で結合範囲の並び順まで一致する。"""
+    path = Path("sample/forms_with_many_merged_cells/ja_general_form/ja_form.xlsx")
+
+    fast = extract_sheet_merged_cells_fast(path)
+    slow = extract_sheet_merged_cells(
+        path, workbook=load_workbook(path, data_only=True)
+    )
+
+    assert fast == slow
+    for ranges in fast.values():
+        assert len(ranges) > 1
+        assert ranges == sorted(ranges, key=lambda r: (r.r1, r.c1, r.r2, r.c2))
+
+
+def test_extract_sheet_merged_cells_fast_honors_1904_epoch(tmp_path: Path) -> None:
+    """1904 年基準のブックでも日付値を正しく復元する。"""
+    path = tmp_path / "mac.xlsx"
+    wb = Workbook()
+    wb.epoch = CALENDAR_MAC_1904
+    ws = wb.active
+    ws["A1"] = datetime(2020, 1, 1)
+    ws.merge_cells("A1:B1")
+    wb.save(path)
+
+    merged = extract_sheet_merged_cells_fast(path)
+    assert merged["Sheet"][0].v == "2020-01-01 00:00:00"
+
+
+def test_extract_sheet_merged_cells_fast_skips_invalid_refs(
+    tmp_path: Path, caplog: pytest.LogCaptureFixture
+) -> None:
+    """$ 付き・小文字の参照は正規化し、解釈できない参照だけを読み飛ばす。"""
+    source = tmp_path / "source.xlsx"
+    _make_merged_book(source)
+    path = tmp_path / "odd_refs.xlsx"
+    with ZipFile(source) as src, ZipFile(path, "w") as dst:
+        for item in src.infolist():
+            data = src.read(item)
+            if item.filename == "xl/worksheets/sheet1.xml":
+                data = data.replace(b'ref="A1:B2"', b'ref="$a$1:$B$2"')
+                data = data.replace(b'ref="D4:E4"', b'ref="D4:"')
+            dst.writestr(item, data)
+
+    with caplog.at_level(logging.WARNING, logger="exstruct.core.cells"):
+        merged = extract_sheet_merged_cells_fast(path)
+
+    assert [(r.r1, r.c1, r.r2, r.c2, r.v) for r in merged["Sheet1"]] == [
+        (1, 0, 2, 1, "Title")
+    ]
+    assert "'D4:'" in caplog.text
+
+
+def test_read_anchor_cells_counts_cells_without_ref() -> None:
+    """r 属性のないセルは直前のセルから列を数えて照合する。"""
+    data = (
+        b'<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+        b'<sheetData><row r="2"><c r="B2"><v>1</v></c><c><v>2</v></c></row>'
+        b'<row r="3"><c><v>3</v></c><c r="D3"><v>4</v></c></row></sheetData>'
+        b"</worksheet>"
+    )
+    anchors = {"C2": (2, 3), "A3": (3, 1), "D3": (3, 4)}
+    found = _read_anchor_cells(data, anchors)
+    assert {pos: raw.text for pos, raw in found.items()} == {
+        (2, 3): "2",
+        (3, 1): "3",
+        (3, 4): "4",
+    }
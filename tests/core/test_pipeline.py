@@ -1,11 +1,15 @@
 """Tests for extraction pipeline planning and step orchestration."""
 
+from collections.abc import Callable
+from dataclasses import replace
 import logging
 from pathlib import Path
 
 from _pytest.monkeypatch import MonkeyPatch
+from openpyxl import Workbook
 import pytest
 
+from exstruct.core.backends import openpyxl_backend
 from exstruct.core.backends.com_backend import ComBackend
 from exstruct.core.backends.openpyxl_backend import OpenpyxlBackend
 from exstruct.core.cells import (
@@ -19,11 +23,12 @@ from exstruct.core.pipeline import (
     ExtractionArtifacts,
     ExtractionInputs,
     PipelinePlan,
-    _col_in_intervals,
+    _excluded_col_keys,
     _filter_rows_excluding_merged_values,
     _merge_intervals,
     _resolve_sheet_colors_map,
     _resolve_sheet_formulas_map,
+    _shared_openpyxl_backend,
     build_cells_tables_workbook,
     build_com_pipeline,
     build_pre_com_pipeline,
@@ -39,51 +44,74 @@ from exstruct.core.pipeline import (
     step_extract_print_areas_com,
     step_extract_shapes_com,
 )
+from exstruct.errors import FallbackReason
 from exstruct.models import CellRow, PrintArea, Shape
 
+MakeInputs = Callable[..., ExtractionInputs]
+
+# Every flag off; tests override only the fields they exercise.
+_BASE_INPUTS = ExtractionInputs(
+    file_path=Path("book.xlsx"),
+    mode="standard",
+    include_cell_links=False,
+    include_print_areas=False,
+    include_auto_page_breaks=False,
+    include_colors_map=False,
+    include_default_background=False,
+    ignore_colors=None,
+    include_formulas_map=False,
+    use_com_for_formulas=False,
+    include_merged_cells=False,
+    include_merged_values_in_rows=True,
+)
+
+
+@pytest.fixture(scope="module")
+def book_path(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Return a workbook path shared by the tests that never create the file.
+
+    Tests that write a workbook use their own ``tmp_path`` instead.
+    """
+    return tmp_path_factory.mktemp("pipeline") / "book.xlsx"
+
+
+@pytest.fixture
+def make_inputs(book_path: Path) -> MakeInputs:
+    """Return a factory that derives ``ExtractionInputs`` from ``_BASE_INPUTS``.
+
+    ``file_path`` defaults to ``book_path``; keyword arguments replace the
+    matching fields.
+    """
+
+    def _make(**overrides: object) -> ExtractionInputs:
+        fields: dict[str, object] = {"file_path": book_path}
+        fields.update(overrides)
+        return replace(_BASE_INPUTS, **fields)
+
+    return _make
+
 
 def test_build_pre_com_pipeline_respects_flags(
-    monkeypatch: MonkeyPatch, tmp_path: Path
+    monkeypatch: MonkeyPatch, make_inputs: MakeInputs
 ) -> None:
     """Verify that the pre-COM pipeline only includes the requested steps."""
 
-    inputs = ExtractionInputs(
-        file_path=tmp_path / "book.xlsx",
-        mode="standard",
-        include_cell_links=False,
-        include_print_areas=False,
-        include_auto_page_breaks=False,
-        include_colors_map=False,
-        include_default_background=False,
-        ignore_colors=None,
-        include_formulas_map=False,
-        use_com_for_formulas=False,
-        include_merged_cells=False,
-        include_merged_values_in_rows=True,
-    )
+    inputs = make_inputs()
     steps = build_pre_com_pipeline(inputs)
     step_names = [step.__name__ for step in steps]
     assert step_names == ["step_extract_cells"]
 
 
 def test_build_pre_com_pipeline_includes_colors_map_for_light(
-    monkeypatch: MonkeyPatch, tmp_path: Path
+    monkeypatch: MonkeyPatch, make_inputs: MakeInputs
 ) -> None:
     """Verify that light mode keeps the colors-map step in the pre-COM pipeline."""
 
-    inputs = ExtractionInputs(
-        file_path=tmp_path / "book.xlsx",
+    inputs = make_inputs(
         mode="light",
-        include_cell_links=False,
         include_print_areas=True,
-        include_auto_page_breaks=False,
         include_colors_map=True,
-        include_default_background=False,
-        ignore_colors=None,
-        include_formulas_map=False,
-        use_com_for_formulas=False,
         include_merged_cells=True,
-        include_merged_values_in_rows=True,
     )
     steps = build_pre_com_pipeline(inputs)
     step_names = [step.__name__ for step in steps]
@@ -96,46 +124,20 @@ def test_build_pre_com_pipeline_includes_colors_map_for_light(
 
 
 def test_build_pre_com_pipeline_skips_merged_cells_when_disabled(
-    tmp_path: Path,
+    make_inputs: MakeInputs,
 ) -> None:
     """Verify that merged-cell extraction is omitted when the flag is disabled."""
 
-    inputs = ExtractionInputs(
-        file_path=tmp_path / "book.xlsx",
-        mode="standard",
-        include_cell_links=False,
-        include_print_areas=True,
-        include_auto_page_breaks=False,
-        include_colors_map=True,
-        include_default_background=False,
-        ignore_colors=None,
-        include_formulas_map=False,
-        use_com_for_formulas=False,
-        include_merged_cells=False,
-        include_merged_values_in_rows=True,
-    )
+    inputs = make_inputs(include_print_areas=True, include_colors_map=True)
     steps = build_pre_com_pipeline(inputs)
     step_names = [step.__name__ for step in steps]
     assert "step_extract_merged_cells_openpyxl" not in step_names
 
 
-def test_build_com_pipeline_respects_flags(tmp_path: Path) -> None:
+def test_build_com_pipeline_respects_flags(make_inputs: MakeInputs) -> None:
     """Verify that the COM pipeline includes only the enabled COM steps."""
 
-    inputs = ExtractionInputs(
-        file_path=tmp_path / "book.xlsx",
-        mode="standard",
-        include_cell_links=False,
-        include_print_areas=False,
-        include_auto_page_breaks=True,
-        include_colors_map=False,
-        include_default_background=False,
-        ignore_colors=None,
-        include_formulas_map=False,
-        use_com_for_formulas=False,
-        include_merged_cells=False,
-        include_merged_values_in_rows=True,
-    )
+    inputs = make_inputs(include_auto_page_breaks=True)
     steps = build_com_pipeline(inputs)
     step_names = [step.__name__ for step in steps]
     assert step_names == [
@@ -146,55 +148,54 @@ def test_build_com_pipeline_respects_flags(tmp_path: Path) -> None:
 
 
 def test_build_com_pipeline_excludes_auto_page_breaks_when_disabled(
-    tmp_path: Path,
+    make_inputs: MakeInputs,
 ) -> None:
     """Verify that auto page-break extraction is skipped when disabled."""
 
-    inputs = ExtractionInputs(
-        file_path=tmp_path / "book.xlsx",
-        mode="standard",
-        include_cell_links=False,
-        include_print_areas=False,
-        include_auto_page_breaks=False,
-        include_colors_map=False,
-        include_default_background=False,
-        ignore_colors=None,
-        include_formulas_map=False,
-        use_com_for_formulas=False,
-        include_merged_cells=False,
-        include_merged_values_in_rows=True,
-    )
+    inputs = make_inputs()
     steps = build_com_pipeline(inputs)
     step_names = [step.__name__ for step in steps]
     assert "step_extract_auto_page_breaks_com" not in step_names
 
 
-def test_build_com_pipeline_empty_for_light(tmp_path: Path) -> None:
+def test_build_com_pipeline_empty_for_light(make_inputs: MakeInputs) -> None:
     """Verify that light mode does not schedule any COM-only steps."""
 
-    inputs = ExtractionInputs(
-        file_path=tmp_path / "book.xlsx",
+    inputs = make_inputs(
         mode="light",
-        include_cell_links=False,
         include_print_areas=True,
         include_auto_page_breaks=True,
         include_colors_map=True,
-        include_default_background=False,
-        ignore_colors=None,
-        include_formulas_map=False,
-        use_com_for_formulas=False,
-        include_merged_cells=False,
-        include_merged_values_in_rows=True,
     )
     steps = build_com_pipeline(inputs)
     assert steps == []
 
 
-def test_resolve_extraction_inputs_defaults(tmp_path: Path) -> None:
+def test_build_pre_com_pipeline_resolves_steps_per_call(
+    monkeypatch: MonkeyPatch, make_inputs: MakeInputs
+) -> None:
+    """Verify that rebound step functions and the env flag apply to the next build."""
+
+    inputs = make_inputs(include_colors_map=True)
+    monkeypatch.delenv("SKIP_COM_TESTS", raising=False)
+    first = build_pre_com_pipeline(inputs)
+    assert step_extract_colors_map_openpyxl not in first
+
+    def _fake_cells(inputs: ExtractionInputs, artifacts: ExtractionArtifacts) -> None:
+        return None
+
+    monkeypatch.setattr("exstruct.core.pipeline.step_extract_cells", _fake_cells)
+    monkeypatch.setenv("SKIP_COM_TESTS", "1")
+    steps = build_pre_com_pipeline(inputs)
+    assert steps[0] is _fake_cells
+    assert step_extract_colors_map_openpyxl in steps
+
+
+def test_resolve_extraction_inputs_defaults(book_path: Path) -> None:
     """Verify that standard-mode defaults are populated consistently."""
 
     inputs = resolve_extraction_inputs(
-        tmp_path / "book.xlsx",
+        book_path,
         mode="standard",
         include_cell_links=None,
         include_print_areas=None,
@@ -214,11 +215,11 @@ def test_resolve_extraction_inputs_defaults(tmp_path: Path) -> None:
     assert inputs.include_merged_cells is True
 
 
-def test_resolve_extraction_inputs_defaults_for_libreoffice(tmp_path: Path) -> None:
+def test_resolve_extraction_inputs_defaults_for_libreoffice(book_path: Path) -> None:
     """Verify that LibreOffice mode uses the same default data-selection flags."""
 
     inputs = resolve_extraction_inputs(
-        tmp_path / "book.xlsx",
+        book_path,
         mode="libreoffice",
         include_cell_links=None,
         include_print_areas=None,
@@ -239,12 +240,12 @@ def test_resolve_extraction_inputs_defaults_for_libreoffice(tmp_path: Path) -> N
 
 
 def test_resolve_extraction_inputs_forces_merged_cells_when_excluding_values(
-    tmp_path: Path,
+    book_path: Path,
 ) -> None:
     """Verify that merged-cell metadata stays enabled when merged values are excluded."""
 
     inputs = resolve_extraction_inputs(
-        tmp_path / "book.xlsx",
+        book_path,
         mode="light",
         include_cell_links=None,
         include_print_areas=None,
@@ -260,7 +261,7 @@ def test_resolve_extraction_inputs_forces_merged_cells_when_excluding_values(
 
 
 def test_resolve_extraction_inputs_warns_on_xls_formulas(
-    tmp_path: Path, monkeypatch: MonkeyPatch
+    book_path: Path, monkeypatch: MonkeyPatch
 ) -> None:
     """Verify that `.xls` formula extraction emits the compatibility warning."""
 
@@ -274,7 +275,7 @@ def test_resolve_extraction_inputs_warns_on_xls_formulas(
     monkeypatch.setattr("exstruct.core.pipeline.warn_once", _warn_once)
 
     inputs = resolve_extraction_inputs(
-        tmp_path / "book.xls",
+        book_path.with_suffix(".xls"),
         mode="standard",
         include_cell_links=None,
         include_print_areas=None,
@@ -290,12 +291,12 @@ def test_resolve_extraction_inputs_warns_on_xls_formulas(
     assert calls
 
 
-def test_resolve_extraction_inputs_rejects_xls_for_libreoffice(tmp_path: Path) -> None:
+def test_resolve_extraction_inputs_rejects_xls_for_libreoffice(book_path: Path) -> None:
     """Verify that LibreOffice mode rejects legacy `.xls` workbooks."""
 
     with pytest.raises(ValueError, match="not supported in libreoffice mode"):
         resolve_extraction_inputs(
-            tmp_path / "book.xls",
+            book_path.with_suffix(".xls"),
             mode="libreoffice",
             include_cell_links=None,
             include_print_areas=None,
@@ -309,11 +310,11 @@ def test_resolve_extraction_inputs_rejects_xls_for_libreoffice(tmp_path: Path) -
         )
 
 
-def test_resolve_extraction_inputs_sets_ignore_colors(tmp_path: Path) -> None:
+def test_resolve_extraction_inputs_sets_ignore_colors(book_path: Path) -> None:
     """Verify that verbose mode normalizes a missing ignore-colors set."""
 
     inputs = resolve_extraction_inputs(
-        tmp_path / "book.xlsx",
+        book_path,
         mode="verbose",
         include_cell_links=None,
         include_print_areas=None,
@@ -329,7 +330,7 @@ def test_resolve_extraction_inputs_sets_ignore_colors(tmp_path: Path) -> None:
 
 
 def test_build_cells_tables_workbook_uses_print_areas(
-    monkeypatch: MonkeyPatch, tmp_path: Path
+    monkeypatch: MonkeyPatch, tmp_path: Path, make_inputs: MakeInputs
 ) -> None:
     """Verify that table detection receives the worksheet print areas."""
 
@@ -342,20 +343,13 @@ def test_build_cells_tables_workbook_uses_print_areas(
         "exstruct.core.backends.openpyxl_backend.detect_tables_openpyxl",
         fake_detect_tables,
     )
+    # The backend hands its loaded workbook to table detection, so the file
+    # has to exist even though detection itself is faked.
+    book_path = tmp_path / "book.xlsx"
+    Workbook().save(book_path)
 
-    inputs = ExtractionInputs(
-        file_path=tmp_path / "book.xlsx",
-        mode="standard",
-        include_cell_links=False,
-        include_print_areas=True,
-        include_auto_page_breaks=False,
-        include_colors_map=False,
-        include_default_background=False,
-        ignore_colors=None,
-        include_formulas_map=False,
-        use_com_for_formulas=False,
-        include_merged_cells=True,
-        include_merged_values_in_rows=True,
+    inputs = make_inputs(
+        file_path=book_path, include_print_areas=True, include_merged_cells=True
     )
     artifacts = ExtractionArtifacts(
         cell_data={"Sheet1": [CellRow(r=1, c={"0": "v"})]},
@@ -373,25 +367,33 @@ def test_build_cells_tables_workbook_uses_print_areas(
     assert sheet.merged_cells is None
 
 
+def test_build_cells_tables_workbook_omits_disabled_print_areas(
+    monkeypatch: MonkeyPatch, tmp_path: Path, make_inputs: MakeInputs
+) -> None:
+    """Verify that collected print areas are dropped when the flag is off."""
+
+    monkeypatch.setattr(
+        "exstruct.core.backends.openpyxl_backend.detect_tables_openpyxl",
+        lambda *_args, **_kwargs: [],
+    )
+    book_path = tmp_path / "book.xlsx"
+    Workbook().save(book_path)
+    inputs = make_inputs(file_path=book_path, mode="light")
+    artifacts = ExtractionArtifacts(
+        cell_data={"Sheet1": [CellRow(r=1, c={"0": "v"})], "Sheet2": []},
+        print_area_data={"Sheet1": [PrintArea(r1=1, c1=0, r2=1, c2=0)]},
+    )
+    wb = build_cells_tables_workbook(inputs=inputs, artifacts=artifacts, reason="t")
+    assert not wb.sheets["Sheet1"].print_areas
+    assert not wb.sheets["Sheet2"].print_areas
+
+
 def test_build_cells_tables_workbook_excludes_merged_values_in_rows(
-    tmp_path: Path,
+    make_inputs: MakeInputs,
 ) -> None:
     """Verify that merged values are removed from row payloads when requested."""
 
-    inputs = ExtractionInputs(
-        file_path=tmp_path / "book.xlsx",
-        mode="standard",
-        include_cell_links=False,
-        include_print_areas=False,
-        include_auto_page_breaks=False,
-        include_colors_map=False,
-        include_default_background=False,
-        ignore_colors=None,
-        include_formulas_map=False,
-        use_com_for_formulas=False,
-        include_merged_cells=True,
-        include_merged_values_in_rows=False,
-    )
+    inputs = make_inputs(include_merged_cells=True, include_merged_values_in_rows=False)
     artifacts = ExtractionArtifacts(
         cell_data={"Sheet1": [CellRow(r=1, c={"0": "A", "1": "B", "2": "C"})]},
         merged_cell_data={"Sheet1": [MergedCellRange(r1=1, c1=0, r2=1, c2=1, v="A")]},
@@ -450,6 +452,20 @@ def test_filter_rows_excluding_merged_values_drops_links_when_filtered() -> None
     assert filtered[0].links is None
 
 
+def test_filter_rows_excluding_merged_values_reuses_untouched_rows() -> None:
+    """Verify that rows with nothing inside a merged range are reused as-is."""
+
+    untouched = CellRow(r=1, c={"3": "D"}, links={"3": "L3"})
+    orphan_link = CellRow(r=1, c={"3": "D"}, links={"4": "L4"})
+    merged_cells = [MergedCellRange(r1=1, c1=0, r2=1, c2=1, v="A")]
+    filtered = _filter_rows_excluding_merged_values(
+        [untouched, orphan_link], merged_cells
+    )
+    assert filtered[0] is untouched
+    assert filtered[1] is not orphan_link
+    assert filtered[1].links is None
+
+
 def test_resolve_sheet_colors_map_empty() -> None:
     """Verify that a missing workbook colors map resolves to an empty sheet map."""
 
@@ -468,14 +484,30 @@ def test_merge_intervals_merges_adjacent() -> None:
     assert _merge_intervals([(1, 2), (3, 4)]) == [(1, 4)]
 
 
-def test_col_in_intervals_fast_false() -> None:
-    """Verify that `_col_in_intervals` short-circuits for columns before the range."""
+def test_excluded_col_keys_expands_intervals() -> None:
+    """Verify that merged intervals expand to their string column keys."""
+
+    assert _excluded_col_keys([(0, 1), (3, 3)]) == frozenset({"0", "1", "3"})
 
-    assert _col_in_intervals(1, [(3, 5)]) is False
+
+def test_filter_rows_excluding_merged_values_shares_row_patterns() -> None:
+    """Verify that rows under the same merged ranges are filtered alike."""
+
+    rows = [CellRow(r=r, c={"0": "A", "1": "B", "2": "C"}) for r in (1, 2, 3)]
+    merged_cells = [
+        MergedCellRange(r1=1, c1=0, r2=2, c2=1, v="A"),
+        MergedCellRange(r1=3, c1=2, r2=3, c2=2, v="C"),
+    ]
+    filtered = _filter_rows_excluding_merged_values(rows, merged_cells)
+    assert [row.c for row in filtered] == [
+        {"2": "C"},
+        {"2": "C"},
+        {"0": "A", "1": "B"},
+    ]
 
 
 def test_step_extract_colors_map_openpyxl_sets_data(
-    tmp_path: Path, monkeypatch: MonkeyPatch
+    monkeypatch: MonkeyPatch, make_inputs: MakeInputs
 ) -> None:
     """Verify that the openpyxl colors-map step stores extracted data."""
 
@@ -492,27 +524,14 @@ def test_step_extract_colors_map_openpyxl_sets_data(
         return WorkbookColorsMap(sheets={})
 
     monkeypatch.setattr(OpenpyxlBackend, "extract_colors_map", _fake)
-    inputs = ExtractionInputs(
-        file_path=tmp_path / "book.xlsx",
-        mode="standard",
-        include_cell_links=False,
-        include_print_areas=False,
-        include_auto_page_breaks=False,
-        include_colors_map=True,
-        include_default_background=False,
-        ignore_colors=None,
-        include_formulas_map=False,
-        use_com_for_formulas=False,
-        include_merged_cells=False,
-        include_merged_values_in_rows=True,
-    )
+    inputs = make_inputs(include_colors_map=True)
     artifacts = ExtractionArtifacts()
     step_extract_colors_map_openpyxl(inputs, artifacts)
     assert artifacts.colors_map_data is not None
 
 
 def test_step_extract_colors_map_com_falls_back(
-    tmp_path: Path, monkeypatch: MonkeyPatch
+    monkeypatch: MonkeyPatch, make_inputs: MakeInputs
 ) -> None:
     """Verify that the COM colors-map step falls back to openpyxl on `None`."""
 
@@ -542,27 +561,14 @@ def test_step_extract_colors_map_com_falls_back(
 
     monkeypatch.setattr(ComBackend, "extract_colors_map", _fake_com)
     monkeypatch.setattr(OpenpyxlBackend, "extract_colors_map", _fake_openpyxl)
-    inputs = ExtractionInputs(
-        file_path=tmp_path / "book.xlsx",
-        mode="standard",
-        include_cell_links=False,
-        include_print_areas=False,
-        include_auto_page_breaks=False,
-        include_colors_map=True,
-        include_default_background=False,
-        ignore_colors=None,
-        include_formulas_map=False,
-        use_com_for_formulas=False,
-        include_merged_cells=False,
-        include_merged_values_in_rows=True,
-    )
+    inputs = make_inputs(include_colors_map=True)
     artifacts = ExtractionArtifacts()
     step_extract_colors_map_com(inputs, artifacts, object())
     assert artifacts.colors_map_data is not None
 
 
 def test_step_extract_auto_page_breaks_com_sets_data(
-    tmp_path: Path, monkeypatch: MonkeyPatch
+    monkeypatch: MonkeyPatch, make_inputs: MakeInputs
 ) -> None:
     """Verify that the COM auto-page-break step stores extracted ranges."""
 
@@ -571,27 +577,14 @@ def test_step_extract_auto_page_breaks_com_sets_data(
         return {"Sheet1": [PrintArea(r1=1, c1=0, r2=1, c2=0)]}
 
     monkeypatch.setattr(ComBackend, "extract_auto_page_breaks", _fake)
-    inputs = ExtractionInputs(
-        file_path=tmp_path / "book.xlsx",
-        mode="standard",
-        include_cell_links=False,
-        include_print_areas=False,
-        include_auto_page_breaks=True,
-        include_colors_map=False,
-        include_default_background=False,
-        ignore_colors=None,
-        include_formulas_map=False,
-        use_com_for_formulas=False,
-        include_merged_cells=False,
-        include_merged_values_in_rows=True,
-    )
+    inputs = make_inputs(include_auto_page_breaks=True)
     artifacts = ExtractionArtifacts()
     step_extract_auto_page_breaks_com(inputs, artifacts, object())
     assert artifacts.auto_page_break_data
 
 
 def test_build_cells_tables_workbook_fetches_missing_maps(
-    tmp_path: Path, monkeypatch: MonkeyPatch
+    monkeypatch: MonkeyPatch, make_inputs: MakeInputs
 ) -> None:
     """Verify that workbook assembly fetches missing colors and formulas maps."""
 
@@ -617,20 +610,7 @@ def test_build_cells_tables_workbook_fetches_missing_maps(
     monkeypatch.setattr(OpenpyxlBackend, "extract_colors_map", _fake_colors)
     monkeypatch.setattr(OpenpyxlBackend, "extract_formulas_map", _fake_formulas)
 
-    inputs = ExtractionInputs(
-        file_path=tmp_path / "book.xlsx",
-        mode="standard",
-        include_cell_links=False,
-        include_print_areas=False,
-        include_auto_page_breaks=False,
-        include_colors_map=True,
-        include_default_background=False,
-        ignore_colors=None,
-        include_formulas_map=True,
-        use_com_for_formulas=False,
-        include_merged_cells=False,
-        include_merged_values_in_rows=True,
-    )
+    inputs = make_inputs(include_colors_map=True, include_formulas_map=True)
     artifacts = ExtractionArtifacts(
         cell_data={"Sheet1": [CellRow(r=1, c={"0": "A"})]},
         merged_cell_data={"Sheet1": []},
@@ -640,7 +620,9 @@ def test_build_cells_tables_workbook_fetches_missing_maps(
 
 
 def test_step_extract_formulas_map_openpyxl_skips_on_failure(
-    tmp_path: Path, monkeypatch: MonkeyPatch, caplog: "pytest.LogCaptureFixture"
+    monkeypatch: MonkeyPatch,
+    caplog: "pytest.LogCaptureFixture",
+    make_inputs: MakeInputs,
 ) -> None:
     """Verify that openpyxl formulas extraction logs and skips failures."""
 
@@ -649,20 +631,7 @@ def test_step_extract_formulas_map_openpyxl_skips_on_failure(
         raise RuntimeError("boom")
 
     monkeypatch.setattr(OpenpyxlBackend, "extract_formulas_map", _raise)
-    inputs = ExtractionInputs(
-        file_path=tmp_path / "book.xlsx",
-        mode="standard",
-        include_cell_links=False,
-        include_print_areas=False,
-        include_auto_page_breaks=False,
-        include_colors_map=False,
-        include_default_background=False,
-        ignore_colors=None,
-        include_formulas_map=True,
-        use_com_for_formulas=False,
-        include_merged_cells=False,
-        include_merged_values_in_rows=True,
-    )
+    inputs = make_inputs(include_formulas_map=True)
     artifacts = ExtractionArtifacts()
 
     with caplog.at_level(logging.WARNING):
@@ -673,7 +642,9 @@ def test_step_extract_formulas_map_openpyxl_skips_on_failure(
 
 
 def test_step_extract_formulas_map_com_skips_on_failure(
-    tmp_path: Path, monkeypatch: MonkeyPatch, caplog: "pytest.LogCaptureFixture"
+    monkeypatch: MonkeyPatch,
+    caplog: "pytest.LogCaptureFixture",
+    make_inputs: MakeInputs,
 ) -> None:
     """Verify that COM formulas extraction logs and skips failures."""
 
@@ -682,20 +653,7 @@ def test_step_extract_formulas_map_com_skips_on_failure(
         raise RuntimeError("boom")
 
     monkeypatch.setattr(ComBackend, "extract_formulas_map", _raise)
-    inputs = ExtractionInputs(
-        file_path=tmp_path / "book.xlsx",
-        mode="standard",
-        include_cell_links=False,
-        include_print_areas=False,
-        include_auto_page_breaks=False,
-        include_colors_map=False,
-        include_default_background=False,
-        ignore_colors=None,
-        include_formulas_map=True,
-        use_com_for_formulas=True,
-        include_merged_cells=False,
-        include_merged_values_in_rows=True,
-    )
+    inputs = make_inputs(include_formulas_map=True, use_com_for_formulas=True)
     artifacts = ExtractionArtifacts()
 
     with caplog.at_level(logging.WARNING):
@@ -746,7 +704,7 @@ def test_merge_intervals_keeps_non_overlapping() -> None:
 
 
 def test_step_extract_shapes_com_sets_data(
-    tmp_path: Path, monkeypatch: MonkeyPatch
+    monkeypatch: MonkeyPatch, make_inputs: MakeInputs
 ) -> None:
     """Verify that the COM shapes step stores extracted shape data."""
 
@@ -758,27 +716,14 @@ def test_step_extract_shapes_com_sets_data(
         return shapes_data
 
     monkeypatch.setattr("exstruct.core.pipeline.get_shapes_with_position", _fake)
-    inputs = ExtractionInputs(
-        file_path=tmp_path / "book.xlsx",
-        mode="standard",
-        include_cell_links=False,
-        include_print_areas=False,
-        include_auto_page_breaks=False,
-        include_colors_map=False,
-        include_default_background=False,
-        ignore_colors=None,
-        include_formulas_map=False,
-        use_com_for_formulas=False,
-        include_merged_cells=False,
-        include_merged_values_in_rows=True,
-    )
+    inputs = make_inputs()
     artifacts = ExtractionArtifacts()
     step_extract_shapes_com(inputs, artifacts, object())
     assert artifacts.shape_data == shapes_data
 
 
 def test_step_extract_charts_com_sets_data(
-    tmp_path: Path, monkeypatch: MonkeyPatch
+    monkeypatch: MonkeyPatch, make_inputs: MakeInputs
 ) -> None:
     """Verify that the COM charts step stores chart data by sheet."""
 
@@ -802,27 +747,14 @@ def test_step_extract_charts_com_sets_data(
         sheets = [_Sheet("Sheet1")]
 
     monkeypatch.setattr("exstruct.core.pipeline.get_charts", _fake)
-    inputs = ExtractionInputs(
-        file_path=tmp_path / "book.xlsx",
-        mode="standard",
-        include_cell_links=False,
-        include_print_areas=False,
-        include_auto_page_breaks=False,
-        include_colors_map=False,
-        include_default_background=False,
-        ignore_colors=None,
-        include_formulas_map=False,
-        use_com_for_formulas=False,
-        include_merged_cells=False,
-        include_merged_values_in_rows=True,
-    )
+    inputs = make_inputs()
     artifacts = ExtractionArtifacts()
     step_extract_charts_com(inputs, artifacts, _Workbook())
     assert artifacts.chart_data == {"Sheet1": charts}
 
 
 def test_step_extract_print_areas_com_skips_when_present(
-    tmp_path: Path, monkeypatch: MonkeyPatch
+    monkeypatch: MonkeyPatch, make_inputs: MakeInputs
 ) -> None:
     """Verify that the COM print-area step does not overwrite existing data."""
 
@@ -831,20 +763,7 @@ def test_step_extract_print_areas_com_skips_when_present(
         raise RuntimeError("should not be called")
 
     monkeypatch.setattr(ComBackend, "extract_print_areas", _raise)
-    inputs = ExtractionInputs(
-        file_path=tmp_path / "book.xlsx",
-        mode="standard",
-        include_cell_links=False,
-        include_print_areas=True,
-        include_auto_page_breaks=False,
-        include_colors_map=False,
-        include_default_background=False,
-        ignore_colors=None,
-        include_formulas_map=False,
-        use_com_for_formulas=False,
-        include_merged_cells=False,
-        include_merged_values_in_rows=True,
-    )
+    inputs = make_inputs(include_print_areas=True)
     artifacts = ExtractionArtifacts(
         print_area_data={"Sheet1": [PrintArea(r1=1, c1=0, r2=1, c2=0)]}
     )
@@ -852,7 +771,7 @@ def test_step_extract_print_areas_com_skips_when_present(
 
 
 def test_step_extract_print_areas_com_sets_data(
-    tmp_path: Path, monkeypatch: MonkeyPatch
+    monkeypatch: MonkeyPatch, make_inputs: MakeInputs
 ) -> None:
     """Verify that the COM print-area step stores the extracted ranges."""
 
@@ -861,27 +780,14 @@ def test_step_extract_print_areas_com_sets_data(
         return {"Sheet1": [PrintArea(r1=1, c1=0, r2=1, c2=0)]}
 
     monkeypatch.setattr(ComBackend, "extract_print_areas", _fake)
-    inputs = ExtractionInputs(
-        file_path=tmp_path / "book.xlsx",
-        mode="standard",
-        include_cell_links=False,
-        include_print_areas=True,
-        include_auto_page_breaks=False,
-        include_colors_map=False,
-        include_default_background=False,
-        ignore_colors=None,
-        include_formulas_map=False,
-        use_com_for_formulas=False,
-        include_merged_cells=False,
-        include_merged_values_in_rows=True,
-    )
+    inputs = make_inputs(include_print_areas=True)
     artifacts = ExtractionArtifacts()
     step_extract_print_areas_com(inputs, artifacts, object())
     assert artifacts.print_area_data
 
 
 def test_step_extract_colors_map_com_sets_data(
-    tmp_path: Path, monkeypatch: MonkeyPatch
+    monkeypatch: MonkeyPatch, make_inputs: MakeInputs
 ) -> None:
     """Verify that the COM colors-map step stores its direct result."""
 
@@ -913,26 +819,13 @@ def test_step_extract_colors_map_com_sets_data(
 
     monkeypatch.setattr(ComBackend, "extract_colors_map", _fake_com)
     monkeypatch.setattr(OpenpyxlBackend, "extract_colors_map", _raise)
-    inputs = ExtractionInputs(
-        file_path=tmp_path / "book.xlsx",
-        mode="standard",
-        include_cell_links=False,
-        include_print_areas=False,
-        include_auto_page_breaks=False,
-        include_colors_map=True,
-        include_default_background=False,
-        ignore_colors=None,
-        include_formulas_map=False,
-        use_com_for_formulas=False,
-        include_merged_cells=False,
-        include_merged_values_in_rows=True,
-    )
+    inputs = make_inputs(include_colors_map=True)
     artifacts = ExtractionArtifacts()
     step_extract_colors_map_com(inputs, artifacts, object())
     assert artifacts.colors_map_data is colors_map
 
 
-def test_run_com_pipeline_executes_steps(tmp_path: Path) -> None:
+def test_run_com_pipeline_executes_steps(make_inputs: MakeInputs) -> None:
     """Verify that `run_com_pipeline` executes each planned step once."""
 
     calls: list[str] = []
@@ -942,20 +835,7 @@ def test_run_com_pipeline_executes_steps(tmp_path: Path) -> None:
         calls.append("called")
         artifacts.shape_data = {"Sheet1": [Shape(id=1, text="", l=0, t=0)]}
 
-    inputs = ExtractionInputs(
-        file_path=tmp_path / "book.xlsx",
-        mode="standard",
-        include_cell_links=False,
-        include_print_areas=False,
-        include_auto_page_breaks=False,
-        include_colors_map=False,
-        include_default_background=False,
-        ignore_colors=None,
-        include_formulas_map=False,
-        use_com_for_formulas=False,
-        include_merged_cells=False,
-        include_merged_values_in_rows=True,
-    )
+    inputs = make_inputs()
     artifacts = ExtractionArtifacts()
     run_com_pipeline([_step], inputs, artifacts, object())
     assert calls == ["called"]
@@ -963,7 +843,7 @@ def test_run_com_pipeline_executes_steps(tmp_path: Path) -> None:
 
 
 def test_run_extraction_pipeline_com_success(
-    tmp_path: Path, monkeypatch: MonkeyPatch
+    monkeypatch: MonkeyPatch, make_inputs: MakeInputs
 ) -> None:
     """Verify that run extraction pipeline COM success."""
 
@@ -1085,22 +965,120 @@ def test_run_extraction_pipeline_com_success(
     monkeypatch.setattr("exstruct.core.pipeline.detect_tables", _fake_detect_tables)
     monkeypatch.setattr("exstruct.core.pipeline.xlwings_workbook", _fake_workbook)
 
-    inputs = ExtractionInputs(
-        file_path=tmp_path / "book.xlsx",
-        mode="standard",
-        include_cell_links=False,
+    inputs = make_inputs()
+
+    result = run_extraction_pipeline(inputs)
+    assert result.state.com_attempted is True
+    assert result.state.com_succeeded is True
+    assert "Sheet1" in result.workbook.sheets
+
+
+def test_run_extraction_pipeline_shares_openpyxl_workbooks(
+    monkeypatch: MonkeyPatch, tmp_path: Path
+) -> None:
+    """Verify that steps share one styled workbook load and release it at the end."""
+
+    path = tmp_path / "book.xlsx"
+    wb = Workbook()
+    ws = wb.active
+    ws.title = "Sheet1"
+    ws["A1"] = "link"
+    ws["A1"].hyperlink = "https://example.com"
+    wb.save(path)
+
+    loads: list[tuple[bool, bool]] = []
+    closed: list[OpenpyxlBackend] = []
+    real_load = openpyxl_backend.load_openpyxl_workbook
+    real_close = OpenpyxlBackend.close
+
+    def _counting_load(
+        file_path: Path, *, data_only: bool, read_only: bool, keep_links: bool = True
+    ) -> object:
+        loads.append((data_only, read_only))
+        return real_load(
+            file_path, data_only=data_only, read_only=read_only, keep_links=keep_links
+        )
+
+    def _recording_close(self: OpenpyxlBackend) -> None:
+        closed.append(self)
+        real_close(self)
+
+    monkeypatch.setattr(openpyxl_backend, "load_openpyxl_workbook", _counting_load)
+    monkeypatch.setattr(OpenpyxlBackend, "close", _recording_close)
+    inputs = resolve_extraction_inputs(
+        path,
+        mode="light",
+        include_cell_links=True,
         include_print_areas=False,
         include_auto_page_breaks=False,
-        include_colors_map=False,
+        include_colors_map=True,
         include_default_background=False,
         ignore_colors=None,
         include_formulas_map=False,
-        use_com_for_formulas=False,
         include_merged_cells=False,
         include_merged_values_in_rows=True,
     )
 
     result = run_extraction_pipeline(inputs)
-    assert result.state.com_attempted is True
-    assert result.state.com_succeeded is True
-    assert "Sheet1" in result.workbook.sheets
+
+    assert result.workbook.sheets["Sheet1"].rows[0].links == {
+        "0": "https://example.com"
+    }
+    assert loads == [(True, False)]
+    assert len(closed) == 1
+    assert result.artifacts.openpyxl_backend is None
+
+
+def test_shared_openpyxl_backend_closes_backend_for_other_file(
+    book_path: Path, make_inputs: MakeInputs
+) -> None:
+    """Verify that a backend bound to another file is closed before replacement."""
+
+    closed: list[OpenpyxlBackend] = []
+
+    class _RecordingBackend(OpenpyxlBackend):
+        def close(self) -> None:
+            closed.append(self)
+            super().close()
+
+    stale = _RecordingBackend(book_path.with_name("other.xlsx"))
+    artifacts = ExtractionArtifacts(openpyxl_backend=stale)
+
+    backend = _shared_openpyxl_backend(make_inputs(), artifacts)
+
+    assert closed == [stale]
+    assert backend is not stale
+    assert backend.file_path == book_path
+    assert artifacts.openpyxl_backend is backend
+    assert _shared_openpyxl_backend(make_inputs(), artifacts) is backend
+
+
+def test_run_extraction_pipeline_releases_openpyxl_before_com(
+    monkeypatch: MonkeyPatch, tmp_path: Path, make_inputs: MakeInputs
+) -> None:
+    """Verify that cached openpyxl workbooks are released before Excel opens."""
+
+    path = tmp_path / "book.xlsx"
+    Workbook().save(path)
+    events: list[str] = []
+    real_close = OpenpyxlBackend.close
+
+    def _recording_close(self: OpenpyxlBackend) -> None:
+        events.append("close")
+        real_close(self)
+
+    def _unavailable_workbook(_: Path) -> object:
+        events.append("excel")
+        raise RuntimeError("Excel is not installed")
+
+    monkeypatch.delenv("SKIP_COM_TESTS", raising=False)
+    monkeypatch.setattr(OpenpyxlBackend, "close", _recording_close)
+    monkeypatch.setattr(
+        "exstruct.core.pipeline.xlwings_workbook", _unavailable_workbook
+    )
+
+    result = run_extraction_pipeline(make_inputs(file_path=path))
+
+    assert result.state.fallback_reason is FallbackReason.COM_UNAVAILABLE
+    assert events[:2] == ["close", "excel"]
+    assert result.artifacts.openpyxl_backend is None
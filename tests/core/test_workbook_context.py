@@ -13,7 +13,7 @@ def test_openpyxl_workbook_closes(monkeypatch: MonkeyPatch, tmp_path: Path) -> N
             calls["close"] += 1
 
     def fake_load_workbook(
-        path: Path, *, data_only: bool, read_only: bool
+        path: Path, *, data_only: bool, read_only: bool, keep_links: bool
     ) -> DummyWorkbook:
         return DummyWorkbook()
 
@@ -44,7 +44,7 @@ def test_openpyxl_workbook_sets_warning_filters(
             pass
 
     def fake_load_workbook(
-        path: Path, *, data_only: bool, read_only: bool
+        path: Path, *, data_only: bool, read_only: bool, keep_links: bool
     ) -> DummyWorkbook:
         return DummyWorkbook()
 
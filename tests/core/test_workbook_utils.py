@@ -100,3 +100,50 @@ def test_find_open_workbook_returns_none_on_iter_error(
 
     monkeypatch.setattr(workbook.xw, "apps", _BadApps())
     assert workbook._find_open_workbook(Path("book.xlsx")) is None
+
+
+def test_xlwings_workbook_quiets_owned_app(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    events: list[str] = []
+
+    class _DummyBook:
+        def close(self) -> None:
+            events.append("close")
+
+    class _DummyApi:
+        EnableEvents = True
+
+    class _DummyBooks:
+        def __init__(self, app: _DummyApp) -> None:
+            self._app = app
+
+        def open(self, _path: str) -> _DummyBook:
+            events.append(
+                f"open alerts={self._app.display_alerts}"
+                f" screen={self._app.screen_updating}"
+                f" events={self._app.api.EnableEvents}"
+            )
+            return _DummyBook()
+
+    class _DummyApp:
+        def __init__(self, **_kwargs: object) -> None:
+            self.display_alerts = True
+            self.screen_updating = True
+            self.api = _DummyApi()
+            self.books = _DummyBooks(self)
+
+        def quit(self) -> None:
+            events.append("quit")
+
+    monkeypatch.setattr(workbook, "_find_open_workbook", lambda _path: None)
+    monkeypatch.setattr(workbook.xw, "App", _DummyApp)
+
+    with workbook.xlwings_workbook(tmp_path / "book.xlsx"):
+        pass
+
+    assert events == [
+        "open alerts=False screen=False events=False",
+        "close",
+        "quit",
+    ]
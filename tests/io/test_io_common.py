@@ -1,9 +1,12 @@
+import json
+import math
 from pathlib import Path
 
 from _pytest.monkeypatch import MonkeyPatch
+import pytest
 
-from exstruct.io import save_sheets
-from exstruct.models import SheetData, WorkbookData
+from exstruct.io import save_sheets, serialize_workbook
+from exstruct.models import CellRow, SheetData, WorkbookData
 
 
 def test_save_sheets_accepts_yml(monkeypatch: MonkeyPatch, tmp_path: Path) -> None:
@@ -21,3 +24,45 @@ def test_save_sheets_accepts_yml(monkeypatch: MonkeyPatch, tmp_path: Path) -> No
     path = next(iter(written.values()))
     assert path.suffix == ".yaml"
     assert path.read_text(encoding="utf-8") == "dummy-yaml"
+
+
+def test_pretty_json_matches_stdlib_with_or_without_orjson(
+    monkeypatch: MonkeyPatch,
+) -> None:
+    """orjson の有無で pretty JSON の出力が変わらない。"""
+    pytest.importorskip("orjson")
+    cells: list[dict[str, str | int | float]] = [
+        {"0": '見出し "x"\n', "1": 1.5, "2": 7},
+        {"0": 1e-05},
+        {"0": 1e-07},
+        {"0": 1e16},
+        {"0": -2.5e20},
+    ]
+    for c in cells:
+        wb = WorkbookData(
+            book_name="帳票.xlsx",
+            sheets={"Sheet1": SheetData(rows=[CellRow(r=1, c=c)])},
+        )
+        with monkeypatch.context() as patch:
+            patch.setattr("exstruct.io.serialize._optional_orjson", lambda: None)
+            stdlib = serialize_workbook(wb, fmt="json", pretty=True)
+        assert serialize_workbook(wb, fmt="json", pretty=True) == stdlib
+        assert stdlib == json.dumps(json.loads(stdlib), ensure_ascii=False, indent=2)
+
+
+def test_pretty_json_keeps_non_finite_floats_with_orjson() -> None:
+    """NaN/Infinity を含む場合は標準ライブラリの出力に戻す。"""
+    pytest.importorskip("orjson")
+    wb = WorkbookData(
+        book_name="book.xlsx",
+        sheets={
+            "Sheet1": SheetData(
+                rows=[CellRow(r=1, c={"0": math.nan, "1": math.inf, "2": 1.5})]
+            )
+        },
+    )
+
+    text = serialize_workbook(wb, fmt="json", pretty=True)
+
+    assert '"0": NaN' in text
+    assert '"1": Infinity' in text
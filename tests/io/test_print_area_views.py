@@ -1,7 +1,7 @@
 import json
 from pathlib import Path
 
-from exstruct.io import save_print_area_views
+from exstruct.io import _filter_row_to_area, save_print_area_views
 from exstruct.models import (
     Arrow,
     CellRow,
@@ -120,3 +120,13 @@ def test_save_print_area_views_no_print_areas_returns_empty(tmp_path: Path) -> N
     wb.sheets["Sheet1"].print_areas = []
     written = save_print_area_views(wb, tmp_path, fmt="json")
     assert written == {}
+
+
+def test_filter_row_to_area_only_builds_links_for_linked_rows() -> None:
+    area = PrintArea(r1=1, c1=0, r2=2, c2=1)
+    plain = _filter_row_to_area(CellRow(r=1, c={"0": "A"}), area)
+    linked = _filter_row_to_area(
+        CellRow(r=2, c={"1": "B", "3": "D"}, links={"1": "u1", "3": "u3"}), area
+    )
+    assert plain is not None and plain.links is None
+    assert linked is not None and linked.links == {"1": "u1"}
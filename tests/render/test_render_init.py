@@ -1,9 +1,13 @@
 from __future__ import annotations
 
 import builtins
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
+import ctypes
 import json
 import logging
+import mmap
+import multiprocessing.util
+import os
 from pathlib import Path
 import shutil
 import subprocess
@@ -18,6 +22,7 @@ import xlwings as xw
 
 from exstruct.errors import MissingDependencyError, RenderError
 import exstruct.render as render
+from exstruct.render._images import JPEG_QUALITY
 
 
 class FakeSheet:
@@ -74,6 +79,11 @@ class FakeBooks:
             raise ValueError("open failed")
         return FakeBook(self._sheet_names)
 
+    @property
+    def count(self) -> int:
+        """Return the number of open books, as xlwings does over COM."""
+        return 0
+
 
 class FakeApp:
     """Stub of xlwings App."""
@@ -99,8 +109,9 @@ class FakeBitmap:
 class FakePage:
     """Stub of a PDF page."""
 
-    def render(self, scale: float) -> FakeBitmap:
+    def render(self, scale: float, **kwargs: object) -> FakeBitmap:
         _ = scale
+        _ = kwargs
         return FakeBitmap()
 
 
@@ -129,6 +140,9 @@ class FakePdfDocument:
         _ = index
         return FakePage()
 
+    def __iter__(self) -> Iterator[FakePage]:
+        return (FakePage() for _ in range(self._page_count))
+
     def __len__(self) -> int:
         return self._page_count
 
@@ -219,6 +233,51 @@ def test_export_pdf_success(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) ->
     assert output_pdf.exists()
 
 
+def test_export_pdf_skips_excel_when_pdf_is_current(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """An existing PDF newer than the workbook is reused without starting Excel."""
+    from openpyxl import Workbook
+
+    xlsx = tmp_path / "input.xlsx"
+    workbook = Workbook()
+    workbook.active.title = "Data"
+    workbook.create_sheet("Summary")
+    workbook.save(xlsx)
+    output_pdf = tmp_path / "out.pdf"
+    output_pdf.write_bytes(b"%PDF-1.4 cached")
+    workbook_mtime = xlsx.stat().st_mtime
+    os.utime(output_pdf, (workbook_mtime + 10, workbook_mtime + 10))
+
+    def _no_excel(*args: object, **kwargs: object) -> FakeApp:
+        raise AssertionError("Excel should not be started")
+
+    monkeypatch.setattr(xw, "App", _no_excel)
+
+    assert render.export_pdf(xlsx, output_pdf) == ["Data", "Summary"]
+    assert output_pdf.read_bytes() == b"%PDF-1.4 cached"
+
+    monkeypatch.setattr(xw, "App", _fake_app_factory(["Data", "Summary"]))
+    assert render.export_pdf(xlsx, output_pdf, force=True) == ["Data", "Summary"]
+    assert output_pdf.read_bytes() == b"%PDF-1.4"
+
+
+def test_export_pdf_reexports_stale_pdf(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """A PDF older than the workbook is regenerated through Excel."""
+    xlsx = tmp_path / "input.xlsx"
+    xlsx.write_bytes(b"dummy")
+    output_pdf = tmp_path / "out.pdf"
+    output_pdf.write_bytes(b"%PDF-1.4 stale")
+    workbook_mtime = xlsx.stat().st_mtime
+    os.utime(output_pdf, (workbook_mtime - 10, workbook_mtime - 10))
+    monkeypatch.setattr(xw, "App", _fake_app_factory(["Sheet1"]))
+
+    assert render.export_pdf(xlsx, output_pdf) == ["Sheet1"]
+    assert output_pdf.read_bytes() == b"%PDF-1.4"
+
+
 def test_export_pdf_wraps_failure(
     tmp_path: Path, monkeypatch: pytest.MonkeyPatch
 ) -> None:
@@ -286,7 +345,7 @@ def test_export_sheet_images_success(
     xlsx = tmp_path / "input.xlsx"
     xlsx.write_bytes(b"dummy")
     out_dir = tmp_path / "images"
-    monkeypatch.setenv("EXSTRUCT_RENDER_SUBPROCESS", "0")
+    monkeypatch.setattr(render, "_USE_RENDER_SUBPROCESS", False)
 
     fake_pdfium = SimpleNamespace(PdfDocument=FakePdfDocument)
     monkeypatch.setattr(render, "_require_pdfium", lambda: fake_pdfium)
@@ -302,6 +361,139 @@ def test_export_sheet_images_success(
     assert fake_app.display_alerts is False
 
 
+def test_export_sheet_images_jpeg_format(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """export_sheet_images writes .jpg files with JPEG save options when requested."""
+    xlsx = tmp_path / "input.xlsx"
+    xlsx.write_bytes(b"dummy")
+    out_dir = tmp_path / "images"
+    monkeypatch.setattr(render, "_USE_RENDER_SUBPROCESS", False)
+    saved: list[dict[str, object]] = []
+
+    def _recording_save(self: FakeImage, path: Path, **kwargs: object) -> None:
+        _ = self
+        saved.append(kwargs)
+        path.write_bytes(b"JPEG")
+
+    monkeypatch.setattr(FakeImage, "save", _recording_save)
+    fake_pdfium = SimpleNamespace(PdfDocument=FakePdfDocument)
+    monkeypatch.setattr(render, "_require_pdfium", lambda: fake_pdfium)
+    monkeypatch.setattr(
+        render, "_require_excel_app", lambda: FakeApp(["Sheet1", "Sheet2"], False)
+    )
+
+    written = render.export_sheet_images(xlsx, out_dir, dpi=144, image_format="jpeg")
+
+    assert [path.name for path in written] == [
+        "01_Sheet1.jpg",
+        "02_Sheet1.jpg",
+        "03_Sheet2.jpg",
+    ]
+    assert all(path.exists() for path in written)
+    assert all(call["format"] == "JPEG" for call in saved)
+    assert all(call["quality"] == JPEG_QUALITY for call in saved)
+
+
+def test_export_sheet_images_rejects_unknown_format(tmp_path: Path) -> None:
+    """Reject unsupported image formats before starting Excel."""
+    with pytest.raises(ValueError, match="Unsupported image format"):
+        render.export_sheet_images(
+            tmp_path / "input.xlsx",
+            tmp_path / "images",
+            image_format=cast(Any, "gif"),
+        )
+
+
+def test_render_pdf_pages_in_process_writes_final_page_names(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Multi-page sheets are written under their final names without renames."""
+
+    def _fail_replace(self: Path, target: Path) -> Path:
+        raise AssertionError(f"unexpected rename {self} -> {target}")
+
+    monkeypatch.setattr(Path, "replace", _fail_replace)
+    fake_pdfium = cast(ModuleType, SimpleNamespace(PdfDocument=FakePdfDocument))
+
+    written = render._render_pdf_pages_in_process(
+        fake_pdfium, tmp_path / "sheet_01.pdf", tmp_path, 4, "Sheet1", 144
+    )
+
+    assert [path.name for path in written] == ["05_Sheet1.png", "06_Sheet1.png"]
+    assert all(path.exists() for path in written)
+
+
+def test_open_pdf_document_loads_from_memory_map(tmp_path: Path) -> None:
+    """map_pdf=True hands pdfium a ctypes view of the mapped file, not a path."""
+    pdf_path = tmp_path / "sheet_01.pdf"
+    pdf_path.write_bytes(b"%PDF-1.4")
+    inputs: list[object] = []
+
+    class _RecordingPdfDocument(FakePdfDocument):
+        def __init__(self, source: object) -> None:
+            inputs.append(source)
+            super().__init__(source if isinstance(source, str) else "sheet_02")
+
+    fake_pdfium = cast(ModuleType, SimpleNamespace(PdfDocument=_RecordingPdfDocument))
+
+    with render._open_pdf_document(fake_pdfium, pdf_path, map_pdf=True) as pdf:
+        assert len(pdf) == 1
+        assert isinstance(inputs[0], ctypes.Array)
+        assert bytes(inputs[0]) == b"%PDF-1.4"
+    with render._open_pdf_document(fake_pdfium, pdf_path, map_pdf=False):
+        pass
+
+    assert inputs[1] == str(pdf_path)
+
+
+def test_open_pdf_document_unmaps_file_after_close(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """The memory map is closed when the block exits, even on errors."""
+    pdf_path = tmp_path / "sheet_01.pdf"
+    pdf_path.write_bytes(b"%PDF-1.4")
+    mappings: list[mmap.mmap] = []
+
+    class _TrackedMmap(mmap.mmap):
+        def __init__(self, *args: object, **kwargs: object) -> None:
+            mappings.append(self)
+
+    monkeypatch.setattr(mmap, "mmap", _TrackedMmap)
+    fake_pdfium = cast(
+        ModuleType,
+        SimpleNamespace(PdfDocument=lambda _source: FakePdfDocument("sheet_02")),
+    )
+
+    with render._open_pdf_document(fake_pdfium, pdf_path, map_pdf=True):
+        assert not mappings[0].closed
+    assert mappings[0].closed
+
+    with pytest.raises(RuntimeError, match="render failed"):
+        with render._open_pdf_document(fake_pdfium, pdf_path, map_pdf=True):
+            raise RuntimeError("render failed")
+    assert mappings[1].closed
+
+
+def test_render_pdf_pages_in_process_with_mapped_pdf(tmp_path: Path) -> None:
+    """Real pypdfium2 renders every page of a memory-mapped PDF."""
+    pdfium = pytest.importorskip("pypdfium2")
+    pytest.importorskip("PIL")
+    pdf_path = tmp_path / "sheet_01.pdf"
+    document = pdfium.PdfDocument.new()
+    document.new_page(72, 72)
+    document.new_page(72, 72)
+    document.save(pdf_path)
+    document.close()
+
+    written = render._render_pdf_pages_in_process(
+        pdfium, pdf_path, tmp_path, 0, "Sheet1", 72, map_pdf=True
+    )
+
+    assert [path.name for path in written] == ["01_Sheet1.png", "02_Sheet1.png"]
+    assert all(path.stat().st_size > 0 for path in written)
+
+
 def test_export_sheet_images_propagates_render_error(
     tmp_path: Path, monkeypatch: pytest.MonkeyPatch
 ) -> None:
@@ -309,7 +501,7 @@ def test_export_sheet_images_propagates_render_error(
     xlsx = tmp_path / "input.xlsx"
     xlsx.write_bytes(b"dummy")
     out_dir = tmp_path / "images"
-    monkeypatch.setenv("EXSTRUCT_RENDER_SUBPROCESS", "0")
+    monkeypatch.setattr(render, "_USE_RENDER_SUBPROCESS", False)
 
     fake_pdfium = SimpleNamespace(PdfDocument=FakePdfDocument)
     monkeypatch.setattr(render, "_require_pdfium", lambda: fake_pdfium)
@@ -328,7 +520,7 @@ def test_export_sheet_images_wraps_unknown_error(
     xlsx = tmp_path / "input.xlsx"
     xlsx.write_bytes(b"dummy")
     out_dir = tmp_path / "images"
-    monkeypatch.setenv("EXSTRUCT_RENDER_SUBPROCESS", "0")
+    monkeypatch.setattr(render, "_USE_RENDER_SUBPROCESS", False)
 
     fake_pdfium = SimpleNamespace(PdfDocument=ExplodingPdfDocument)
     monkeypatch.setattr(render, "_require_pdfium", lambda: fake_pdfium)
@@ -356,11 +548,14 @@ def test_export_sheet_images_uses_subprocess_when_enabled(
         sheet_index: int,
         safe_name: str,
         dpi: int,
+        *,
+        image_format: str = "png",
     ) -> list[Path]:
+        _ = image_format
         calls.append((pdf_path, output_dir, sheet_index, safe_name, dpi))
         return [output_dir / f"{sheet_index + 1:02d}_{safe_name}.png"]
 
-    monkeypatch.setenv("EXSTRUCT_RENDER_SUBPROCESS", "1")
+    monkeypatch.setattr(render, "_USE_RENDER_SUBPROCESS", True)
     monkeypatch.setattr(
         render, "_require_excel_app", lambda: FakeApp(["SheetA", "SheetB"], False)
     )
@@ -381,7 +576,7 @@ def test_export_sheet_images_with_sheet_only(
     xlsx = tmp_path / "input.xlsx"
     xlsx.write_bytes(b"dummy")
     out_dir = tmp_path / "images"
-    monkeypatch.setenv("EXSTRUCT_RENDER_SUBPROCESS", "0")
+    monkeypatch.setattr(render, "_USE_RENDER_SUBPROCESS", False)
 
     fake_pdfium = SimpleNamespace(PdfDocument=FakePdfDocument)
     monkeypatch.setattr(render, "_require_pdfium", lambda: fake_pdfium)
@@ -403,7 +598,7 @@ def test_export_sheet_images_with_sheet_and_range(
     xlsx = tmp_path / "input.xlsx"
     xlsx.write_bytes(b"dummy")
     out_dir = tmp_path / "images"
-    monkeypatch.setenv("EXSTRUCT_RENDER_SUBPROCESS", "0")
+    monkeypatch.setattr(render, "_USE_RENDER_SUBPROCESS", False)
 
     fake_pdfium = SimpleNamespace(PdfDocument=FakePdfDocument)
     monkeypatch.setattr(render, "_require_pdfium", lambda: fake_pdfium)
@@ -447,10 +642,14 @@ def test_export_sheet_images_rejects_invalid_range(tmp_path: Path) -> None:
 
 
 def test_use_render_subprocess_env_toggle(monkeypatch: pytest.MonkeyPatch) -> None:
-    """_use_render_subprocess respects the env toggle."""
+    """_use_render_subprocess respects the env toggle after a reload."""
+    monkeypatch.setattr(render, "_USE_RENDER_SUBPROCESS", render._USE_RENDER_SUBPROCESS)
     monkeypatch.setenv("EXSTRUCT_RENDER_SUBPROCESS", "1")
+    assert render._reload_render_subprocess_env() is True
+    assert render._use_render_subprocess() is True
+    monkeypatch.setenv("EXSTRUCT_RENDER_SUBPROCESS", "False")
     assert render._use_render_subprocess() is True
-    monkeypatch.setenv("EXSTRUCT_RENDER_SUBPROCESS", "0")
+    assert render._reload_render_subprocess_env() is False
     assert render._use_render_subprocess() is False
 
 
@@ -543,6 +742,7 @@ def test_render_pdf_pages_subprocess_success(tmp_path: Path) -> None:
         safe_name: str,
         dpi: int,
         *,
+        image_format: str = "png",
         startup_timeout_seconds: float,
         result_timeout_seconds: float,
         join_timeout_seconds: float,
@@ -552,6 +752,7 @@ def test_render_pdf_pages_subprocess_success(tmp_path: Path) -> None:
         _ = sheet_index
         _ = safe_name
         _ = dpi
+        _ = image_format
         _ = startup_timeout_seconds
         _ = result_timeout_seconds
         _ = join_timeout_seconds
@@ -583,6 +784,7 @@ def test_render_pdf_pages_subprocess_emits_stage_logs(
         safe_name: str,
         dpi: int,
         *,
+        image_format: str = "png",
         startup_timeout_seconds: float,
         result_timeout_seconds: float,
         join_timeout_seconds: float,
@@ -592,6 +794,7 @@ def test_render_pdf_pages_subprocess_emits_stage_logs(
         _ = sheet_index
         _ = safe_name
         _ = dpi
+        _ = image_format
         _ = startup_timeout_seconds
         _ = result_timeout_seconds
         _ = join_timeout_seconds
@@ -620,6 +823,7 @@ def test_render_pdf_pages_subprocess_error(tmp_path: Path) -> None:
         safe_name: str,
         dpi: int,
         *,
+        image_format: str = "png",
         startup_timeout_seconds: float,
         result_timeout_seconds: float,
         join_timeout_seconds: float,
@@ -629,6 +833,7 @@ def test_render_pdf_pages_subprocess_error(tmp_path: Path) -> None:
         _ = sheet_index
         _ = safe_name
         _ = dpi
+        _ = image_format
         _ = startup_timeout_seconds
         _ = result_timeout_seconds
         _ = join_timeout_seconds
@@ -990,6 +1195,7 @@ def test_sanitize_sheet_filename() -> None:
     """_sanitize_sheet_filename replaces invalid characters and defaults."""
     assert render._sanitize_sheet_filename("Sheet/1") == "Sheet_1"
     assert render._sanitize_sheet_filename("  ") == "sheet"
+    assert render._sanitize_sheet_filename('a\\b:c*d?e"f<g>h|i') == "a_b_c_d_e_f_g_h_i"
 
 
 def test_split_csv_respecting_quotes() -> None:
@@ -1094,6 +1300,50 @@ def test_iter_sheet_apis_prefers_worksheets_collection() -> None:
     assert result[1][1] == "Sheet2"
 
 
+def test_iter_sheet_apis_skips_hidden_sheets() -> None:
+    """Skip hidden and very hidden sheets unless include_hidden is set."""
+
+    class _WsApi:
+        def __init__(self, name: str, visible: int) -> None:
+            self.Name = name
+            self.Visible = visible
+
+    class _Worksheets:
+        _items = [
+            _WsApi("Shown", -1),
+            _WsApi("Hidden", 0),
+            _WsApi("VeryHidden", 2),
+            _WsApi("AlsoShown", -1),
+        ]
+        Count = len(_items)
+
+        def Item(self, index: int) -> _WsApi:
+            return self._items[index - 1]
+
+    class _Api:
+        Worksheets = _Worksheets()
+
+    class _Wb:
+        api = _Api()
+        sheets: list[Any] = []
+
+    visible = render._iter_sheet_apis(cast(xw.Book, _Wb()))
+    assert [(index, name) for index, name, _ in visible] == [
+        (0, "Shown"),
+        (3, "AlsoShown"),
+    ]
+    everything = render._iter_sheet_apis(cast(xw.Book, _Wb()), include_hidden=True)
+    assert [name for _, name, _ in everything] == [
+        "Shown",
+        "Hidden",
+        "VeryHidden",
+        "AlsoShown",
+    ]
+    found = render._find_sheet_api(cast(xw.Book, _Wb()), sheet_name="Hidden")
+    assert found is not None
+    assert found[0] == "Hidden"
+
+
 def test_export_pdf_propagates_render_error(
     tmp_path: Path, monkeypatch: pytest.MonkeyPatch
 ) -> None:
@@ -1158,16 +1408,6 @@ def test_build_sheet_export_plan_handles_multiple_areas(
     assert [item[2] for item in plan] == ["A1:B2", "C3:D4"]
 
 
-def test_page_index_from_suffix_default() -> None:
-    """Default to zero when no suffix exists."""
-    assert render._page_index_from_suffix("sheet") == 0
-
-
-def test_page_index_from_suffix_non_digit() -> None:
-    """Default to zero when suffix is not numeric."""
-    assert render._page_index_from_suffix("sheet_pxx") == 0
-
-
 def test_export_sheet_pdf_skips_invalid_print_area(tmp_path: Path) -> None:
     """Skip restoring PrintArea when setter fails."""
 
@@ -1239,6 +1479,7 @@ def test_export_sheet_images_with_app_retries_on_empty(
 ) -> None:
     """Retry export when rendering returns empty results."""
     calls: list[int] = []
+    map_flags: list[bool] = []
 
     def _fake_render(
         _pdfium: ModuleType | None,
@@ -1248,6 +1489,9 @@ def test_export_sheet_images_with_app_retries_on_empty(
         safe_name: str,
         _dpi: int,
         _use_subprocess: bool,
+        _image_format: str = "png",
+        *,
+        map_pdf: bool = False,
     ) -> list[Path]:
         """
         Simulates rendering a PDF sheet to image files for tests.
@@ -1262,11 +1506,14 @@ def test_export_sheet_images_with_app_retries_on_empty(
             safe_name (str): Sanitized sheet name used in the filename.
             _dpi: Ignored in the fake implementation (kept for signature compatibility).
             _use_subprocess: Ignored in the fake implementation (kept for signature compatibility).
+            _image_format: Ignored in the fake implementation (kept for signature compatibility).
+            map_pdf (bool): Recorded to verify the retry reads the re-exported PDF via mmap.
 
         Returns:
             list[Path]: Empty list on the first call, otherwise a list containing one Path pointing to the fake PNG file.
         """
         calls.append(1)
+        map_flags.append(map_pdf)
         if len(calls) == 1:
             return []
         return [output_dir / f"{sheet_index + 1:02d}_{safe_name}.png"]
@@ -1295,6 +1542,7 @@ def test_export_sheet_images_with_app_retries_on_empty(
         None,
     )
     assert len(calls) == 2
+    assert map_flags == [False, True]
     assert result
 
 
@@ -1321,6 +1569,7 @@ def test_export_sheet_images_with_app_skips_retry_for_targeted_range(
         _safe_name: str,
         _dpi: int,
         _use_subprocess: bool,
+        _image_format: str = "png",
     ) -> list[Path]:
         render_calls.append(1)
         return []
@@ -1364,15 +1613,6 @@ def test_export_sheet_images_with_app_skips_retry_for_targeted_range(
     assert export_calls == [False]
 
 
-def test_page_index_from_suffix_handles_multi_digits() -> None:
-    """Support multi-digit page suffixes."""
-    assert render._page_index_from_suffix("sheet_01") == 0
-    assert render._page_index_from_suffix("sheet_01_p01") == 0
-    assert render._page_index_from_suffix("sheet_01_p10") == 9
-    assert render._page_index_from_suffix("sheet_01_p100") == 99
-    assert render._page_index_from_suffix("sheet_01_p0") == 0
-
-
 def test_export_sheet_pdf_does_not_swallow_export_errors(tmp_path: Path) -> None:
     """Propagate export errors even if restore fails."""
 
@@ -1440,3 +1680,338 @@ def test_export_sheet_pdf_does_not_swallow_export_errors(tmp_path: Path) -> None
             ignore_print_areas=False,
             print_area="A1:B2",
         )
+
+
+class _RecordingPool:
+    """Pool stand-in that records its lifecycle calls."""
+
+    def __init__(self) -> None:
+        self.calls: list[str] = []
+
+    def close(self) -> None:
+        self.calls.append("close")
+
+    def terminate(self) -> None:
+        self.calls.append("terminate")
+
+    def join(self) -> None:
+        self.calls.append("join")
+
+
+def test_export_sheet_images_many_runs_inline_for_single_worker(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """processes=1 renders each workbook in order without starting a pool."""
+    calls: list[tuple[str, str, int, str]] = []
+
+    def _fake_export(
+        excel_path: str, output_dir: str, *, dpi: int, image_format: str
+    ) -> list[Path]:
+        calls.append((excel_path, output_dir, dpi, image_format))
+        return [Path(output_dir) / "01_Sheet1.png"]
+
+    def _no_pool(processes: int) -> object:
+        raise AssertionError(f"unexpected pool with {processes} workers")
+
+    monkeypatch.setattr(render, "export_sheet_images", _fake_export)
+    monkeypatch.setattr(render, "_new_render_pool", _no_pool)
+
+    results = render.export_sheet_images_many(
+        [tmp_path / "a.xlsx", tmp_path / "b.xlsx"],
+        [tmp_path / "a", tmp_path / "b"],
+        dpi=72,
+        image_format="jpeg",
+        processes=1,
+    )
+
+    assert results == [
+        [tmp_path / "a" / "01_Sheet1.png"],
+        [tmp_path / "b" / "01_Sheet1.png"],
+    ]
+    assert [call[0] for call in calls] == [
+        str(tmp_path / "a.xlsx"),
+        str(tmp_path / "b.xlsx"),
+    ]
+    assert all(call[2:] == (72, "jpeg") for call in calls)
+
+
+def test_export_sheet_images_many_restores_order_from_pool(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Pool completions arriving out of order are placed back by job index."""
+    created: list[int] = []
+
+    class _ReversedPool(_RecordingPool):
+        def imap_unordered(
+            self,
+            func: Callable[[tuple[int, str, str, int, str]], tuple[int, list[str]]],
+            jobs: list[tuple[int, str, str, int, str]],
+        ) -> Iterator[tuple[int, list[str]]]:
+            _ = func
+            return ((job[0], [f"{job[2]}/01_Sheet1.png"]) for job in reversed(jobs))
+
+    pool = _ReversedPool()
+
+    def _fake_pool(processes: int) -> _ReversedPool:
+        created.append(processes)
+        return pool
+
+    monkeypatch.setattr(render, "_new_render_pool", _fake_pool)
+    excel_paths = [tmp_path / f"{name}.xlsx" for name in "abc"]
+    output_dirs = [tmp_path / name for name in "abc"]
+
+    results = render.export_sheet_images_many(excel_paths, output_dirs, processes=8)
+
+    assert created == [3]
+    assert results == [[Path(f"{out}/01_Sheet1.png")] for out in output_dirs]
+    # Workers must exit normally so their Excel finalizers run.
+    assert pool.calls == ["close", "join"]
+
+
+def test_export_sheet_images_many_terminates_pool_on_failure(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """A failed job terminates the pool instead of waiting for the other jobs."""
+
+    class _FailingPool(_RecordingPool):
+        def imap_unordered(
+            self,
+            func: Callable[[tuple[int, str, str, int, str]], tuple[int, list[str]]],
+            jobs: list[tuple[int, str, str, int, str]],
+        ) -> Iterator[tuple[int, list[str]]]:
+            _ = (func, jobs)
+            raise RenderError("job failed")
+
+    pool = _FailingPool()
+    monkeypatch.setattr(render, "_new_render_pool", lambda _processes: pool)
+
+    with pytest.raises(RenderError, match="job failed"):
+        render.export_sheet_images_many(
+            [tmp_path / "a.xlsx", tmp_path / "b.xlsx"],
+            [tmp_path / "a", tmp_path / "b"],
+            processes=2,
+        )
+
+    assert pool.calls == ["terminate", "join"]
+
+
+def test_init_render_worker_quits_app_when_worker_exits(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """The worker's Excel survives its jobs and is quit by its exit finalizer."""
+    worker_app = FakeApp(["Sheet1"], False)
+    finalizers: list[tuple[object, Callable[[], None], int | None]] = []
+
+    def _record_finalizer(
+        obj: object, callback: Callable[[], None], *, exitpriority: int | None = None
+    ) -> None:
+        finalizers.append((obj, callback, exitpriority))
+
+    monkeypatch.setattr(render, "_WORKER_APP", None)
+    monkeypatch.setattr(render, "_require_excel_app", lambda: worker_app)
+    monkeypatch.setattr(multiprocessing.util, "Finalize", _record_finalizer)
+    monkeypatch.setattr(render, "_export_sheet_pdf", lambda *a, **k: None)
+    monkeypatch.setattr(
+        render,
+        "_render_sheet_images",
+        lambda *a, **k: [tmp_path / "out" / "01_Sheet1.png"],
+    )
+
+    render._init_render_worker()
+    render._export_sheet_images_with_app(
+        tmp_path / "in.xlsx",
+        tmp_path / "out",
+        tmp_path / "tmp",
+        144,
+        False,
+        None,
+        None,
+        None,
+    )
+    assert worker_app.quit_called is False
+
+    # Finalizers without an object only run at process exit if they carry an
+    # exit priority; run them as the exiting worker would.
+    assert [(obj, priority) for obj, _, priority in finalizers] == [(None, 10)]
+    for _, callback, _ in finalizers:
+        callback()
+    assert worker_app.quit_called is True
+    assert render._WORKER_APP is None
+
+
+def test_export_sheet_images_with_app_drops_unresponsive_worker_app(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """A worker app that fails COM calls is discarded; a healthy one is kept."""
+
+    class _DeadBooks(FakeBooks):
+        @property
+        def count(self) -> int:
+            raise RuntimeError("RPC server is unavailable")
+
+    healthy_app = FakeApp(["Sheet1"], True)
+    dead_app = FakeApp(["Sheet1"], True)
+    dead_app.books = _DeadBooks(["Sheet1"], True)
+
+    for app, expect_kept in ((healthy_app, True), (dead_app, False)):
+        monkeypatch.setattr(render, "_WORKER_APP", app)
+        with pytest.raises(ValueError, match="open failed"):
+            render._export_sheet_images_with_app(
+                tmp_path / "in.xlsx",
+                tmp_path / "out",
+                tmp_path / "tmp",
+                144,
+                False,
+                None,
+                None,
+                None,
+            )
+        assert (render._WORKER_APP is app) is expect_kept
+        assert app.quit_called is not expect_kept
+
+
+def test_export_sheet_images_many_rejects_mismatched_lengths(tmp_path: Path) -> None:
+    """Each workbook needs exactly one output directory."""
+    with pytest.raises(ValueError, match="same length"):
+        render.export_sheet_images_many([tmp_path / "a.xlsx"], [])
+    with pytest.raises(ValueError, match="processes must be >= 1"):
+        render.export_sheet_images_many(
+            [tmp_path / "a.xlsx"], [tmp_path / "a"], processes=0
+        )
+
+
+def test_export_sheet_images_with_app_reuses_worker_app(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """A pool worker's Excel instance is reused and left running after export."""
+    worker_app = FakeApp(["Sheet1"], False)
+
+    def _no_new_app() -> xw.App:
+        raise AssertionError("worker app should be reused")
+
+    monkeypatch.setattr(render, "_WORKER_APP", worker_app)
+    monkeypatch.setattr(render, "_require_excel_app", _no_new_app)
+    monkeypatch.setattr(render, "_export_sheet_pdf", lambda *a, **k: None)
+    monkeypatch.setattr(
+        render,
+        "_render_sheet_images",
+        lambda *a, **k: [tmp_path / "out" / "01_Sheet1.png"],
+    )
+
+    result = render._export_sheet_images_with_app(
+        tmp_path / "in.xlsx",
+        tmp_path / "out",
+        tmp_path / "tmp",
+        144,
+        False,
+        None,
+        None,
+        None,
+    )
+
+    assert result == [tmp_path / "out" / "01_Sheet1.png"]
+    assert worker_app.quit_called is False
+
+    render._quit_worker_app()
+    assert worker_app.quit_called is True
+    assert render._WORKER_APP is None
+
+
+def test_export_sheet_images_with_app_overlaps_export_and_render(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Excel exports the next plan item while the previous one is rasterized."""
+    next_exported = threading.Event()
+    exported: list[str] = []
+    render_threads: set[str] = set()
+
+    def _fake_export(
+        _sheet_api: render._SheetApiProtocol,
+        pdf_path: Path,
+        *,
+        ignore_print_areas: bool,
+        print_area: str | None = None,
+    ) -> None:
+        _ = ignore_print_areas
+        _ = print_area
+        assert threading.current_thread() is threading.main_thread()
+        exported.append(pdf_path.name)
+        if pdf_path.name == "sheet_02.pdf":
+            next_exported.set()
+
+    def _fake_render(
+        _pdfium: ModuleType | None,
+        pdf_path: Path,
+        output_dir: Path,
+        sheet_index: int,
+        safe_name: str,
+        _dpi: int,
+        _use_subprocess: bool,
+        _image_format: str = "png",
+    ) -> list[Path]:
+        render_threads.add(threading.current_thread().name)
+        if pdf_path.name == "sheet_01.pdf":
+            assert next_exported.wait(timeout=5.0)
+            return [
+                output_dir / f"{sheet_index + 1:02d}_{safe_name}.png",
+                output_dir / f"{sheet_index + 2:02d}_{safe_name}.png",
+            ]
+        return [output_dir / f"{sheet_index + 1:02d}_{safe_name}.png"]
+
+    monkeypatch.setattr(render, "_export_sheet_pdf", _fake_export)
+    monkeypatch.setattr(render, "_render_sheet_images", _fake_render)
+    monkeypatch.setattr(
+        render, "_require_excel_app", lambda: FakeApp(["Sheet1"], False)
+    )
+    monkeypatch.setattr(
+        render,
+        "_build_sheet_export_plan",
+        lambda _wb, *, sheet=None, a1_range=None: [
+            ("SheetA", cast(render._SheetApiProtocol, object()), None),
+            ("SheetB", cast(render._SheetApiProtocol, object()), None),
+        ],
+    )
+
+    result = render._export_sheet_images_with_app(
+        tmp_path / "in.xlsx",
+        tmp_path / "out",
+        tmp_path / "tmp",
+        144,
+        False,
+        None,
+        None,
+        None,
+    )
+
+    assert [path.name for path in result] == [
+        "01_SheetA.png",
+        "02_SheetA.png",
+        "03_SheetB.png",
+    ]
+    assert exported == ["sheet_01.pdf", "sheet_02.pdf"]
+    assert threading.main_thread().name not in render_threads
+
+
+def test_reusable_bitmap_maker_allocates_once_per_page_size(tmp_path: Path) -> None:
+    """Same-size pages share one bitmap; a size change allocates a new one."""
+    pdfium = pytest.importorskip("pypdfium2")
+    pytest.importorskip("PIL")
+    from exstruct.render._bitmaps import ReusableBitmapMaker
+
+    pdf_path = tmp_path / "sheet_01.pdf"
+    document = pdfium.PdfDocument.new()
+    document.new_page(72, 72)
+    document.new_page(72, 72)
+    document.new_page(144, 72)
+    document.save(pdf_path)
+    document.close()
+    maker = ReusableBitmapMaker(pdfium)
+    sizes: list[tuple[int, int]] = []
+
+    with pdfium.PdfDocument(str(pdf_path)) as pdf:
+        for page in pdf:
+            bitmap = page.render(scale=1.0, bitmap_maker=maker)
+            sizes.append(bitmap.to_pil().size)
+
+    assert sizes == [(72, 72), (72, 72), (144, 72)]
+    assert maker.allocations == 2
@@ -85,3 +85,17 @@ def test_main_preserves_actionable_error_before_request_load(
     assert "ValueError" in captured.err
     error_payload = json.loads(result_path.read_text(encoding="utf-8"))
     assert "ValueError" in error_payload["error"]
+
+
+def test_request_image_format_defaults_to_png(tmp_path: Path) -> None:
+    """Keep PNG output for request payloads written before image_format existed."""
+    payload = _build_request_payload(tmp_path)
+
+    assert subprocess_worker.RenderWorkerRequest.from_payload(payload).image_format == (
+        "png"
+    )
+
+    payload["image_format"] = "jpeg"
+    assert subprocess_worker.RenderWorkerRequest.from_payload(payload).image_format == (
+        "jpeg"
+    )